@@ -1,68 +1,72 @@
+from anyio import CapacityLimiter
 from fastapi import Request
 
-from app.mapper.evaluator.contract import ExpressionEvaluatorContract
-from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.api.readiness import Readiness
 from app.mapper.mapper import Mapper
-from app.mapper.repositories.contracts.repository import MappingRepository
-from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+from app.mapper.mapping_registry import MappingRegistry
+from app.mapper.parallel_converter import ParallelConverter
 from app.profile_enricher.profiler import Profiler
-from app.profile_enricher.repositories.contracts.repository import ProfileRepository
-from app.profile_enricher.repositories.jsonld.jsonld_repository import (
-    JsonLdProfileRepository,
-)
 
 
-def get_mapping_repository(request: Request) -> MappingRepository:
-    """Dependency injection function to get MappingRepository instance.
+def get_mapper(request: Request) -> Mapper:
+    """Dependency injection function to get the Mapper instance.
+
+    The mapper is shared by all the requests, to compile each mapping once.
 
     :param request: The FastAPI request object
-    :return: An instance of MappingRepository
+    :return: The Mapper instance of the application
     """
-    return YamlMappingRepository(
-        logger=request.state.logger,
-    )
+    return request.state.mapper
 
 
-def get_profile_repository(request: Request) -> ProfileRepository:
-    """Dependency injection function to get ProfileRepository instance.
+def get_mapping_registry(request: Request) -> MappingRegistry:
+    """Dependency injection function to get the MappingRegistry instance.
+
+    The registry is shared by all the requests, to keep the registered mappings in memory.
 
     :param request: The FastAPI request object
-    :return: An instance of ProfileRepository
+    :return: The MappingRegistry instance of the application
     """
-    return JsonLdProfileRepository(
-        logger=request.state.logger,
-        config=request.state.config,
-    )
+    return request.state.mapping_registry
 
 
-def get_expression_evaluator(request: Request) -> ExpressionEvaluatorContract:
-    """Dependency injection function to get an ExpressionEvaluator instance.
+def get_profiler(request: Request) -> Profiler:
+    """Dependency injection function to get the Profiler instance.
+
+    The profiler is shared by all the requests, so that each profile is loaded once.
 
     :param request: The FastAPI request object
-    :return: An instance of ExpressionEvaluatorContract
+    :return: The Profiler instance of the application
     """
-    return EvalExpressionEvaluator(logger=request.state.logger)
+    return request.state.profiler
 
 
-def get_mapper(request: Request) -> Mapper:
-    """Dependency injection function to get a Mapper instance.
+def get_parallel_converter(request: Request) -> ParallelConverter | None:
+    """Dependency injection function to get the ParallelConverter instance.
 
     :param request: The FastAPI request object
-    :return: An instance of Mapper
+    :return: The ParallelConverter instance of the application,
+        None if the custom files are not converted in parallel
     """
-    return Mapper(
-        repository=get_mapping_repository(request=request),
-        expression_evaluator=get_expression_evaluator(request=request),
-        logger=request.state.logger,
-    )
+    return request.state.parallel_converter
 
 
-def get_profiler(request: Request) -> Profiler:
-    """Dependency injection function to get a Profiler instance.
+def get_conversion_limiter(request: Request) -> CapacityLimiter:
+    """Dependency injection function to get the limiter of the custom files conversions.
+
+    The custom files are converted in threads of their own, so that large uploads
+    never take the threads of the other requests.
+
+    :param request: The FastAPI request object
+    :return: The CapacityLimiter of the custom files conversion threads
+    """
+    return request.state.conversion_limiter
+
+
+def get_readiness(request: Request) -> Readiness:
+    """Dependency injection function to get the Readiness instance.
 
     :param request: The FastAPI request object
-    :return: An instance of Profiler
+    :return: The Readiness instance of the application
     """
-    return Profiler(
-        repository=get_profile_repository(request=request),
-    )
+    return request.state.readiness
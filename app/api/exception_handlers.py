@@ -8,10 +8,13 @@ from app.mapper.evaluator.exceptions import ExpressionEvaluationError
 from app.mapper.exceptions import (
     MapperError,
     MappingConfigToModelError,
+    MappingNotFoundError,
 )
 from app.parsers.exceptions import (
     CSVParsingError,
+    DecompressionError,
     InvalidCSVStructureError,
+    JSONParsingError,
     ParserError,
     ParserFactoryError,
 )
@@ -38,6 +41,7 @@ class ExceptionHandler:
             # MapperError and its subclasses
             MapperError: status.HTTP_500_INTERNAL_SERVER_ERROR,
             MappingConfigToModelError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+            MappingNotFoundError: status.HTTP_404_NOT_FOUND,
             ExpressionEvaluationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
             # ProfilerError and its subclasses
             ProfilerError: status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -51,6 +55,8 @@ class ExceptionHandler:
             ParserFactoryError: status.HTTP_400_BAD_REQUEST,
             CSVParsingError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             InvalidCSVStructureError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+            JSONParsingError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+            DecompressionError: status.HTTP_422_UNPROCESSABLE_ENTITY,
         }
 
     def configure(self, app: FastAPI) -> None:
@@ -83,10 +89,7 @@ class ExceptionHandler:
 
         :return: A JSON response containing error details
         """
-        status_code = self.error_mapping.get(
-            type(exc),
-            status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        status_code = self.get_status_code(exc=exc)
 
         return JSONResponse(
             status_code=status_code,
@@ -97,6 +100,25 @@ class ExceptionHandler:
             ),
         )
 
+    @property
+    def known_exceptions(self) -> tuple[type[Exception], ...]:
+        """The exceptions having a known HTTP status code."""
+        return tuple(self.error_mapping)
+
+    def get_status_code(self, exc: Exception) -> int:
+        """Get the HTTP status code of an exception.
+
+        The status code of an exception is the one of its class or closest known parent,
+        as the exception handlers are.
+
+        :param exc: The exception that was raised
+        :return: The HTTP status code of the exception, 500 if it is unknown
+        """
+        for exc_class in type(exc).__mro__:
+            if exc_class in self.error_mapping:
+                return self.error_mapping[exc_class]
+        return status.HTTP_500_INTERNAL_SERVER_ERROR
+
     def global_exception_handler(
         self,
         request: Request,
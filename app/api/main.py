@@ -1,25 +1,72 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.infrastructure.config.envconfig import EnvConfig
+from app.infrastructure.logging.contract import LoggerContract
 from app.infrastructure.logging.jsonlogger import JsonLogger
 from app.infrastructure.logging.types import LogLevel
+from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.mapper.mapper import Mapper
+from app.mapper.mapping_registry import MappingRegistry
+from app.mapper.parallel_converter import ParallelConverter
+from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+from app.profile_enricher.profiler import Profiler
+from app.profile_enricher.repositories.jsonld.jsonld_repository import (
+    JsonLdProfileRepository,
+)
+from app.profile_enricher.repositories.jsonld.profile_loader import ProfileLoader
+from app.profile_enricher.repositories.jsonld.profile_registry import ProfileRegistry
 
 from .exception_handlers import ExceptionHandler
+from .readiness import Readiness
+from .routers.health import router as health_router
 from .routers.traces import router as traces_router
 
 config = EnvConfig()
 
 
+def warmup(
+    mapper: Mapper,
+    profile_registry: ProfileRegistry,
+    readiness: Readiness,
+    logger: LoggerContract,
+) -> None:
+    """Load the mappings and the profiles, then flag the application as ready.
+
+    The application is flagged as ready even if the warmup fails,
+    the mappings and profiles not loaded being loaded on first use.
+
+    :param mapper: The Mapper instance of the application
+    :param profile_registry: The ProfileRegistry instance of the application
+    :param readiness: The Readiness instance of the application
+    :param logger: LoggerContract implementation for logging
+    """
+    mappings = profiles = 0
+    try:
+        mappings = mapper.warmup()
+        profiles = profile_registry.warmup(group_names=config.get_profiles_names())
+    except Exception as e:
+        logger.exception("Warmup failed", e)
+    finally:
+        readiness.set_ready()
+    logger.info("Application ready", {"mappings": mappings, "profiles": profiles})
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> dict[str, Any]:
     """Lifespan context manager for the FastAPI application.
 
+    The mappings and profiles are warmed up in a thread once the application started,
+    the readiness being flagged when done.
+
     :param _app: The FastAPI application instance
-    :yield: A dictionary containing logger and config objects
+    :yield: A dictionary containing logger, config, registries, mapper, profiler,
+        parallel converter, conversion limiter and readiness objects
     """
     logger = JsonLogger(name=__name__, level=config.get_log_level())
     logger.info(
@@ -30,9 +77,74 @@ async def lifespan(_app: FastAPI) -> dict[str, Any]:
         },
     )
 
-    yield {"logger": logger, "config": config}
+    mapping_registry = MappingRegistry(
+        repository=YamlMappingRepository(logger=logger),
+        base_path=config.get_mappings_registry_path(),
+        logger=logger,
+        max_entries=config.get_mappings_registry_size(),
+    )
+
+    profile_registry = ProfileRegistry(
+        profile_loader=ProfileLoader(logger=logger, config=config),
+        logger=logger,
+    )
+
+    mapper = Mapper(
+        repository=YamlMappingRepository(logger=logger),
+        expression_evaluator=EvalExpressionEvaluator(logger=logger),
+        logger=logger,
+    )
+    profiler = Profiler(
+        repository=JsonLdProfileRepository(
+            logger=logger,
+            config=config,
+            profile_registry=profile_registry,
+        ),
+    )
+
+    # Rows of custom files converted in a pool of processes, if configured
+    processes = config.get_custom_conversion_processes()
+    parallel_converter = (
+        ParallelConverter(
+            processes=processes,
+            logger=logger,
+            log_level=config.get_log_level(),
+            chunk_size=config.get_custom_conversion_chunk_size(),
+        )
+        if processes > 1
+        else None
+    )
+
+    # Threads of the custom files conversions, not shared with the other requests
+    conversion_limiter = anyio.CapacityLimiter(config.get_custom_conversion_threads())
+
+    readiness = Readiness()
+    warmup_task = asyncio.create_task(
+        asyncio.to_thread(
+            warmup,
+            mapper=mapper,
+            profile_registry=profile_registry,
+            readiness=readiness,
+            logger=logger,
+        ),
+    )
+
+    yield {
+        "logger": logger,
+        "config": config,
+        "mapping_registry": mapping_registry,
+        "profile_registry": profile_registry,
+        "mapper": mapper,
+        "profiler": profiler,
+        "parallel_converter": parallel_converter,
+        "conversion_limiter": conversion_limiter,
+        "readiness": readiness,
+    }
 
     logger.info("Application shutting down")
+    await warmup_task
+    if parallel_converter is not None:
+        parallel_converter.shutdown()
 
 
 app = FastAPI(
@@ -46,6 +158,7 @@ exception_handler = ExceptionHandler()
 exception_handler.configure(app)
 
 app.include_router(router=traces_router)
+app.include_router(router=health_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,22 @@
+from threading import Event
+
+
+class Readiness:
+    """Readiness of the application to serve conversions.
+
+    The application is ready once the mappings and profiles are warmed up,
+    so that the first requests don't pay for their loading.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the Readiness, not ready yet."""
+        self._ready = Event()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the application is ready."""
+        return self._ready.is_set()
+
+    def set_ready(self) -> None:
+        """Flag the application as ready."""
+        self._ready.set()
@@ -0,0 +1,43 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+
+from app.api.dependencies import get_readiness
+from app.api.readiness import Readiness
+from app.api.schemas import ReadinessResponseModel
+
+router = APIRouter()
+
+
+@router.get(
+    "/ready",
+    tags=["Health"],
+    description="Tell whether the application is warmed up and ready to serve conversions.",
+    status_code=200,
+)
+def get_readiness_status(
+    response: Response,
+    readiness: Annotated[Readiness, Depends(get_readiness)],
+) -> ReadinessResponseModel:
+    """Get the readiness of the application.
+
+    ---
+    get:
+      summary: Readiness
+      description: Tell whether the mappings and profiles are loaded.
+      responses:
+        200:
+          description: The application is ready
+          content:
+            application/json:
+              schema: ReadinessResponseModel
+        503:
+          description: The application is warming up
+
+    :param response: The FastAPI response object
+    :param readiness: The Readiness instance of the application
+    :return: The response model telling whether the application is ready
+    """
+    if not readiness.is_ready:
+        response.status_code = 503
+    return ReadinessResponseModel(ready=readiness.is_ready)
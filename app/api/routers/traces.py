@@ -1,29 +1,64 @@
-from collections.abc import AsyncGenerator
-from json import dumps
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Iterator
+from json import JSONDecodeError, dumps, loads
 from typing import Annotated
 
+from anyio import CapacityLimiter
 from fastapi import APIRouter, Depends, Form, Request, UploadFile
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from pydantic import Json
+from starlette.concurrency import run_in_threadpool
 
-from app.api.dependencies import get_mapper, get_profiler
+from app.api.dependencies import (
+    get_conversion_limiter,
+    get_mapper,
+    get_mapping_registry,
+    get_parallel_converter,
+    get_profiler,
+)
+from app.api.exception_handlers import ExceptionHandler
 from app.api.schemas import (
     DEFAULT_OUTPUT_FORMAT,
+    BatchTransformErrorModel,
+    BatchTransformInputTraceRequestModel,
+    BatchTransformInputTraceResponseModel,
+    BatchTransformItemResponseModel,
     CustomConfigModel,
+    RegisterMappingResponseModel,
     TransformInputTraceRequestModel,
     TransformInputTraceResponseMetaModel,
     TransformInputTraceResponseModel,
     ValidateInputTraceRequestModel,
     ValidateInputTraceResponseModel,
 )
+from app.api.streaming import (
+    NDJSON_MEDIA_TYPE,
+    DuplexStreamingResponse,
+    iter_lines_batches,
+    iterate_in_thread,
+)
 from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace
 from app.mapper.mapper import Mapper
+from app.mapper.mapping_registry import MappingRegistry
+from app.mapper.models.mapping_models import MappingPlan
+from app.mapper.parallel_converter import ParallelConverter
+from app.parsers.exceptions import ParserFactoryError
 from app.parsers.factory import ParserFactory
 from app.parsers.jsonencoder import CustomJSONEncoder
 from app.profile_enricher.profiler import Profiler
 
 router = APIRouter()
 
+# Response header telling whether the uploaded mapping file was served from the cache
+MAPPING_CACHE_HEADER = "X-Mapping-Cache"
+# Response header giving the version of the registered mapping used for the conversion
+MAPPING_VERSION_HEADER = "X-Mapping-Version"
+
+# Gives the errors of the traces of a batch, as they would be given for a single trace
+exception_handler = ExceptionHandler()
+
 
 @router.post(
     "/validate",
@@ -108,36 +143,253 @@ def transform_input_trace(
 
     input_trace = query.get_trace()
 
-    mapper.load_schema_by_formats(
+    plan = mapper.get_plan_by_formats(
         input_format=input_trace.format,
         output_format=query.output_format,
     )
+    response = transform_trace(
+        input_trace=input_trace,
+        output_format=query.output_format,
+        plan=plan,
+        mapper=mapper,
+        profiler=profiler,
+    )
+
+    logger.info("Convert endpoint completed", {"input_format": input_trace.format})
+    return response
+
+
+@router.post(
+    "/convert/batch",
+    tags=["Trace transformation"],
+    description="Transform a batch of input traces, of any formats, into specific output traces.",
+    status_code=200,
+)
+def transform_input_traces(
+    request: Request,
+    query: BatchTransformInputTraceRequestModel,
+    mapper: Annotated[Mapper, Depends(get_mapper)],
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+) -> BatchTransformInputTraceResponseModel:
+    """Transform and enrich a batch of traces.
+
+    The traces are grouped by input and output formats, so that the mapping of each group
+    is resolved once. A trace failing to transform doesn't fail the batch: its result
+    gives the error it would have raised on its own. Unexpected errors fail the batch.
+
+    ---
+    post:
+      summary: Transform a batch of input traces
+      description: Transform input traces into specific output formats and enrich them with profile data if available.
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema: BatchTransformInputTraceRequestModel
+      responses:
+        200:
+          description: Transformed traces or errors, in the order of the input traces
+          content:
+            application/json:
+              schema: BatchTransformInputTraceResponseModel
+
+    :param request: The FastAPI request object
+    :param query: The request query model
+    :param mapper: The Mapper instance for trace conversion
+    :param profiler: The Profiler instance for trace enrichment and validation
+    :return: The response model containing the result of each trace
+    """
+    logger = request.state.logger
+    logger.info("Batch convert endpoint called", {"traces": len(query.traces)})
+
+    results: list[BatchTransformItemResponseModel | None] = [None] * len(query.traces)
+    groups: defaultdict[
+        tuple[CustomTraceFormatStrEnum, CustomTraceFormatStrEnum],
+        list[tuple[int, Trace]],
+    ] = defaultdict(list)
+    for index, item in enumerate(query.traces):
+        try:
+            input_trace = item.get_trace()
+        except exception_handler.known_exceptions as e:
+            results[index] = get_batch_error(request=request, exc=e)
+            continue
+        groups[input_trace.format, item.output_format].append((index, input_trace))
+
+    for (input_format, output_format), group_traces in groups.items():
+        try:
+            plan = mapper.get_plan_by_formats(
+                input_format=input_format,
+                output_format=output_format,
+            )
+        except exception_handler.known_exceptions as e:
+            error = get_batch_error(request=request, exc=e)
+            for index, _ in group_traces:
+                results[index] = error
+            continue
+
+        for index, input_trace in group_traces:
+            try:
+                response = transform_trace(
+                    input_trace=input_trace,
+                    output_format=output_format,
+                    plan=plan,
+                    mapper=mapper,
+                    profiler=profiler,
+                )
+            except exception_handler.known_exceptions as e:
+                results[index] = get_batch_error(request=request, exc=e)
+                continue
+            results[index] = BatchTransformItemResponseModel(
+                output_trace=response.output_trace,
+                recommendations=response.recommendations,
+                meta=response.meta,
+            )
+
+    logger.info(
+        "Batch convert endpoint completed",
+        {"traces": len(results), "groups": len(groups)},
+    )
+    return BatchTransformInputTraceResponseModel(results=results)
+
+
+@router.post(
+    "/convert_stream",
+    response_class=DuplexStreamingResponse,
+    tags=["Trace transformation"],
+    description="Transform a stream of input traces, one JSON trace per line, into a stream of output traces.",
+    status_code=200,
+)
+async def transform_input_traces_stream(
+    request: Request,
+    mapper: Annotated[Mapper, Depends(get_mapper)],
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+    input_format: CustomTraceFormatStrEnum | None = None,
+    output_format: CustomTraceFormatStrEnum = DEFAULT_OUTPUT_FORMAT,
+) -> StreamingResponse:
+    """Transform and enrich a stream of traces.
+
+    The request body is read as it is received, and the lines of each received chunk
+    are converted in a worker thread, so that the body is never held in memory.
+    Each line of the response is the result of the line of the request at the same
+    position, blank lines aside, as given by /convert/batch.
+
+    ---
+    post:
+      summary: Transform a stream of input traces
+      description: Transform NDJSON input traces into specific output traces and enrich them with profile data if available.
+      requestBody:
+        required: true
+        content:
+          application/x-ndjson: {}
+      responses:
+        200:
+          description: Transformed traces or errors, one per line
+          content:
+            application/x-ndjson: {}
+        400:
+          description: Bad request, the request body is not NDJSON
+
+    :param request: The FastAPI request object
+    :param mapper: The Mapper instance for trace conversion
+    :param profiler: The Profiler instance for trace enrichment and validation
+    :param input_format: The format of the input traces, detected for each trace if not provided
+    :param output_format: The desired output format
+    :return: A streaming response containing the result of each trace
+    :raises ParserFactoryError: If the request body is not NDJSON
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type != NDJSON_MEDIA_TYPE:
+        raise ParserFactoryError(f"Unsupported MIME type: {content_type}")
+
+    logger = request.state.logger
+    logger.info(
+        "Convert stream endpoint called",
+        {"input_format": input_format, "output_format": output_format},
+    )
+    # The mapping plans, resolved once per input format of the stream
+    plans: dict[CustomTraceFormatStrEnum, MappingPlan] = {}
+
+    def transform_line(line: bytes) -> str:
+        try:
+            try:
+                data = loads(line)
+            except JSONDecodeError as e:
+                raise ValueError("Invalid JSON trace") from e
+            input_trace = Trace(data=data, format=input_format)
+            plan = plans.get(input_trace.format)
+            if plan is None:
+                plan = mapper.get_plan_by_formats(
+                    input_format=input_trace.format,
+                    output_format=output_format,
+                )
+                plans[input_trace.format] = plan
+            response = transform_trace(
+                input_trace=input_trace,
+                output_format=output_format,
+                plan=plan,
+                mapper=mapper,
+                profiler=profiler,
+            )
+            result = BatchTransformItemResponseModel(
+                output_trace=response.output_trace,
+                recommendations=response.recommendations,
+                meta=response.meta,
+            )
+        except exception_handler.known_exceptions as e:
+            result = get_batch_error(request=request, exc=e)
+        # Encoded as /convert and /convert/batch responses are
+        return dumps(obj=jsonable_encoder(result)) + "\n"
+
+    def transform_lines(lines: list[bytes]) -> str:
+        return "".join(transform_line(line=line) for line in lines)
+
+    async def generate_output_traces() -> AsyncGenerator:
+        async for lines in iter_lines_batches(chunks=request.stream()):
+            yield await run_in_threadpool(transform_lines, lines)
+
+    return DuplexStreamingResponse(
+        content=generate_output_traces(),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
 
+def transform_trace(
+    input_trace: Trace,
+    output_format: CustomTraceFormatStrEnum,
+    plan: MappingPlan,
+    mapper: Mapper,
+    profiler: Profiler,
+) -> TransformInputTraceResponseModel:
+    """Transform a trace with a mapping plan, then enrich and validate it.
+
+    :param input_trace: The input trace
+    :param output_format: The desired output format
+    :param plan: The compiled mapping plan from the input format to the output format
+    :param mapper: The Mapper instance for trace conversion
+    :param profiler: The Profiler instance for trace enrichment and validation
+    :return: The response model containing the transformed trace
+    :raises ValueError: If the trace does not match the profile
+    """
     # Convert
     output_trace = mapper.convert(
         input_trace=input_trace,
-        output_format=query.output_format,
+        output_format=output_format,
+        plan=plan,
     )
     # Enrich and validate
     recommendations = []
     if output_trace.profile:
-        profiler.enrich_trace(trace=output_trace)
+        result = profiler.enrich_and_validate_trace(trace=output_trace)
+        if result.errors:
+            raise ValueError(f"The trace does not match the profile: {result.errors}")
 
-        errors = profiler.validate_trace(trace=output_trace)
-        if errors:
-            raise ValueError(f"The trace does not match the profile: {errors}")
-
-        recommendations = profiler.get_recommendations(
-            trace=output_trace,
-        )
+        recommendations = result.recommendations
 
     meta = TransformInputTraceResponseMetaModel(
         input_format=input_trace.format,
         output_format=output_trace.format,
         profile=output_trace.profile,
     )
-
-    logger.info("Convert endpoint completed", {"input_format": input_trace.format})
     return TransformInputTraceResponseModel(
         output_trace=output_trace.data,
         meta=meta,
@@ -145,6 +397,65 @@ def transform_input_trace(
     )
 
 
+def get_batch_error(
+    request: Request,
+    exc: Exception,
+) -> BatchTransformItemResponseModel:
+    """Get the result of a trace of a batch failing to transform.
+
+    :param request: The FastAPI request object
+    :param exc: The exception raised by the transformation of the trace
+    :return: The result of the trace, giving its error
+    """
+    status_code = exception_handler.get_status_code(exc=exc)
+    return BatchTransformItemResponseModel(
+        error=BatchTransformErrorModel(
+            status_code=status_code,
+            **exception_handler.get_error_detail(
+                exc=exc,
+                status_code=status_code,
+                request=request,
+            ),
+        ),
+    )
+
+
+@router.post(
+    "/mappings",
+    tags=["Custom transformation"],
+    description="Register a mapping file, to reference it by id in custom transformations.",
+    status_code=201,
+)
+def register_mapping(
+    mapping_file: UploadFile,
+    mapping_registry: Annotated[MappingRegistry, Depends(get_mapping_registry)],
+) -> RegisterMappingResponseModel:
+    """Validate and register a mapping file.
+
+    ---
+    post:
+      summary: Register mapping
+      description: Validate a mapping file and store it on the server.
+      responses:
+        201:
+          description: Successfully registered mapping
+          content:
+            application/json:
+              schema: RegisterMappingResponseModel
+        500:
+          description: Internal server error, invalid mapping file
+
+    :param mapping_file: The uploaded file containing the mapping configuration
+    :param mapping_registry: The MappingRegistry instance storing the mappings
+    :return: The response model containing the mapping id and version
+    """
+    registered = mapping_registry.register(mapping_file=mapping_file.file)
+    return RegisterMappingResponseModel(
+        mapping_id=registered.mapping_id,
+        version=registered.version,
+    )
+
+
 @router.post(
     "/convert_custom",
     response_class=StreamingResponse,
@@ -155,40 +466,86 @@ def transform_input_trace(
 async def transform_custom_file(
     request: Request,
     data_file: UploadFile,
-    mapping_file: UploadFile,
     mapper: Annotated[Mapper, Depends(get_mapper)],
+    mapping_registry: Annotated[MappingRegistry, Depends(get_mapping_registry)],
+    parallel_converter: Annotated[
+        ParallelConverter | None,
+        Depends(get_parallel_converter),
+    ],
+    conversion_limiter: Annotated[CapacityLimiter, Depends(get_conversion_limiter)],
+    mapping_file: UploadFile | None = None,
+    mapping_id: Annotated[str | None, Form()] = None,
     config: Annotated[Json[CustomConfigModel] | None, Form()] = None,
     output_format: Annotated[CustomTraceFormatStrEnum, Form()] = DEFAULT_OUTPUT_FORMAT,
 ) -> StreamingResponse:
     """Transform a custom file using a provided mapping file and parsing configuration.
     This method processes an uploaded file, applies a custom mapping, and streams the
     transformed data as xAPI statements.
+    The mapping is either uploaded as a file or referenced by the id of a registered mapping.
     :param request: The request object
     :param data_file: The uploaded file containing the data to be transformed
+    :param mapper: The Mapper instance for trace conversion
+    :param mapping_registry: The MappingRegistry instance storing the registered mappings
+    :param parallel_converter: The ParallelConverter instance converting the rows
+        in a pool of processes, None to convert them in a worker thread
+    :param conversion_limiter: The limiter of the custom files conversion threads
     :param mapping_file: The uploaded file containing the mapping configuration
+    :param mapping_id: The id of a registered mapping, instead of a mapping file
     :param config: Optional custom configuration for parsing
     :param output_format: The desired output format for the transformation
-    :param mapper: The Mapper instance for trace conversion
-    :return: A streaming response containing the transformed xAPI statements.
+    :return: A streaming response containing the transformed xAPI statements,
+        with a X-Mapping-Cache header set to "hit" if the mapping file was already cached,
+        or a X-Mapping-Version header for a registered mapping.
+    :raises ValueError: If both or none of mapping_file and mapping_id are provided
     """
+    if (mapping_file is None) == (mapping_id is None):
+        raise ValueError("Either a mapping file or a mapping id must be provided")
+
     request.state.logger.info(data_file)
     parser = ParserFactory.get_parser(
         mime_type=data_file.content_type,
         logger=request.state.logger,
         parsing_config=config,
+        # Large files parsed in the pool of processes converting them
+        executor=parallel_converter.executor if parallel_converter else None,
+        filename=data_file.filename,
+        file=data_file.file,
     )
 
-    mapper.load_schema_by_file(file=mapping_file.file)
+    if mapping_id is not None:
+        registered = await run_in_threadpool(mapping_registry.get, mapping_id)
+        plan = await run_in_threadpool(mapper.get_plan, registered.schema)
+        headers = {MAPPING_VERSION_HEADER: registered.version}
+    else:
+        plan, from_cache = await run_in_threadpool(
+            mapper.get_plan_by_file,
+            mapping_file.file,
+        )
+        headers = {MAPPING_CACHE_HEADER: "hit" if from_cache else "miss"}
 
-    async def generate_xapi_statements() -> AsyncGenerator:
+    def generate_xapi_statements() -> Iterator[str]:
+        if parallel_converter is not None:
+            yield from parallel_converter.convert(
+                traces=parser.parse(file=data_file.file),
+                schema=plan.schema,
+                output_format=output_format,
+            )
+            return
         for trace in parser.parse(file=data_file.file):
             output_trace = mapper.convert(
                 input_trace=trace,
                 output_format=output_format,
+                plan=plan,
             )
             yield dumps(obj=output_trace.data, cls=CustomJSONEncoder) + "\n"
 
+    # Parsed, converted and encoded in a worker thread, not to block the event loop,
+    # taken from the threads of the conversions, not to block the other requests
     return StreamingResponse(
-        content=generate_xapi_statements(),
-        media_type="application/x-ndjson",
+        content=iterate_in_thread(
+            texts=generate_xapi_statements(),
+            limiter=conversion_limiter,
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers=headers,
     )
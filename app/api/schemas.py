@@ -3,10 +3,11 @@ from pydantic import BaseModel, Field
 from app.common.common_types import JsonType
 from app.common.extensions.enums.custom_trace_formats import CustomTraceFormatStrEnum
 from app.common.models.trace import Trace
-from app.parsers.types import DelimiterEnum, QuotingEnum
+from app.parsers.types import ColumnTypeEnum, DelimiterEnum, QuotingEnum
 from app.profile_enricher.profiler_types import ValidationRecommendation
 
 DEFAULT_OUTPUT_FORMAT = CustomTraceFormatStrEnum.XAPI
+MAX_BATCH_SIZE = 1000
 
 
 class InputTraceRequestModel(BaseModel):
@@ -61,6 +62,52 @@ class TransformInputTraceResponseModel(BaseModel):
     meta: TransformInputTraceResponseMetaModel
 
 
+# Batch transformation models
+class BatchTransformInputTraceRequestModel(BaseModel):
+    """Model for batch transform input traces request."""
+
+    traces: list[TransformInputTraceRequestModel] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Input traces to transform, of any input and output formats",
+    )
+
+
+class BatchTransformErrorModel(BaseModel):
+    """Model for the error of a trace of a batch transformation."""
+
+    status_code: int = Field(description="HTTP status code of the error")
+    detail: str = Field(description="Error detail")
+    cause: str | None = Field(default=None, description="Cause of the error")
+
+
+class BatchTransformItemResponseModel(BaseModel):
+    """Model for the result of a trace of a batch transformation.
+
+    Either the transformed trace with its metadata, or the error are given.
+    """
+
+    output_trace: JsonType | None = Field(
+        default=None,
+        description="Transformed output trace in JSON format",
+    )
+    recommendations: list[ValidationRecommendation] = Field(
+        default_factory=list,
+        description="List of recommendations to improve output trace",
+    )
+    meta: TransformInputTraceResponseMetaModel | None = None
+    error: BatchTransformErrorModel | None = None
+
+
+class BatchTransformInputTraceResponseModel(BaseModel):
+    """Model for batch transform input traces response."""
+
+    results: list[BatchTransformItemResponseModel] = Field(
+        description="Results of the transformations, in the order of the input traces",
+    )
+
+
 # Validation models
 class ValidateInputTraceRequestModel(InputTraceRequestModel):
     """Model for validate input trace request."""
@@ -72,6 +119,21 @@ class ValidateInputTraceResponseModel(BaseModel):
     input_format: CustomTraceFormatStrEnum = Field(description="Input trace format.")
 
 
+# Mapping registry models
+class RegisterMappingResponseModel(BaseModel):
+    """Model for register mapping response."""
+
+    mapping_id: str = Field(description="Identifier to reference the mapping with")
+    version: str = Field(description="Hash of the mapping file content")
+
+
+# Health models
+class ReadinessResponseModel(BaseModel):
+    """Model for readiness response."""
+
+    ready: bool = Field(description="Whether the mappings and profiles are loaded")
+
+
 # Custom file transformation models
 class CustomConfigModel(BaseModel):
     encoding: str | None = Field(
@@ -106,3 +168,14 @@ class CustomConfigModel(BaseModel):
         default=None,
         description="Quoting style used in the CSV file",
     )
+    input_format: CustomTraceFormatStrEnum | None = Field(
+        default=None,
+        description="Format of the traces of a JSON or NDJSON file. "
+        "Detected for each trace if not provided, custom if no format matches",
+    )
+    column_types: dict[str, ColumnTypeEnum] | None = Field(
+        default=None,
+        description="Types of the columns, overriding the types inferred from the "
+        "first rows. The values of a string column are never converted to numbers",
+        examples=[{"zip_code": "string", "date": "date"}],
+    )
@@ -0,0 +1,116 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import TYPE_CHECKING
+
+import anyio
+from anyio.from_thread import run as run_from_thread
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    from starlette.types import Receive, Scope, Send
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Size from which the produced text is flushed to the response, in characters
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Number of chunks produced ahead of the response
+DEFAULT_MAX_BUFFERED_CHUNKS = 8
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """A streaming response whose content is produced while the request body is read.
+
+    StreamingResponse listens for the client disconnection by receiving the request
+    messages, which would take the chunks of the body away from the content.
+    Here, the disconnection is noticed by the request stream instead.
+    """
+
+    async def __call__(
+        self,
+        _scope: "Scope",
+        _receive: "Receive",
+        send: "Send",
+    ) -> None:
+        """Stream the content, without listening for the client disconnection.
+
+        :param _scope: The ASGI scope of the request
+        :param _receive: The ASGI receive channel, left to the request stream
+        :param send: The ASGI send channel
+        """
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_lines_batches(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[list[bytes]]:
+    """Split a stream of chunks into batches of lines, as the chunks are received.
+
+    Each batch holds the complete lines of a chunk, so that only one chunk
+    and one incomplete line are in memory at once. Blank lines are skipped.
+
+    :param chunks: The chunks of the stream, such as the body of a request
+    :return: The batches of lines, without their line terminator
+    """
+    remainder = b""
+    async for chunk in chunks:
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        batch = [line for line in lines if line.strip()]
+        if batch:
+            yield batch
+    if remainder.strip():
+        yield [remainder]
+
+
+async def iterate_in_thread(
+    texts: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_buffered_chunks: int = DEFAULT_MAX_BUFFERED_CHUNKS,
+    limiter: anyio.CapacityLimiter | None = None,
+) -> AsyncIterator[bytes]:
+    """Produce texts in a worker thread, and yield them in chunks of about chunk_size.
+
+    The thread stops producing while max_buffered_chunks chunks are waiting to be sent,
+    and stops for good if the chunks are not consumed anymore.
+    An exception raised by the texts is raised once the chunks produced before are yielded.
+
+    :param texts: The texts to produce, iterated in the worker thread
+    :param chunk_size: Size from which the produced texts are yielded, in characters
+    :param max_buffered_chunks: Maximum number of chunks produced ahead
+    :param limiter: The limiter of the threads the texts are produced in,
+        the default thread limiter if not provided
+    :return: The chunks of the texts, encoded in UTF-8
+    """
+    send_stream, receive_stream = anyio.create_memory_object_stream(
+        max_buffer_size=max_buffered_chunks,
+    )
+
+    def produce() -> None:
+        with send_stream:
+            buffer: list[str] = []
+            size = 0
+            try:
+                for text in texts:
+                    buffer.append(text)
+                    size += len(text)
+                    if size >= chunk_size:
+                        run_from_thread(send_stream.send, "".join(buffer).encode())
+                        buffer, size = [], 0
+                if buffer:
+                    run_from_thread(send_stream.send, "".join(buffer).encode())
+            except anyio.BrokenResourceError:
+                # The chunks are not consumed anymore
+                return
+
+    producer = asyncio.ensure_future(
+        anyio.to_thread.run_sync(produce, limiter=limiter),
+    )
+    try:
+        async with receive_stream:
+            async for chunk in receive_stream:
+                yield chunk
+    finally:
+        # The thread stops on its next chunk once the receive stream is closed
+        with anyio.CancelScope(shield=True):
+            await producer
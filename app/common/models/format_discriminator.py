@@ -0,0 +1,68 @@
+from collections.abc import Callable, Mapping
+from functools import partial
+
+from pydantic import BaseModel
+
+from app.common.common_types import JsonType
+
+from .trace_formats import (
+    BaseXapiStatement,
+    IMSCaliperSensorModel1_1,
+    IMSCaliperSensorModel1_2,
+)
+
+# JSON-LD contexts of the Caliper versions, by model
+CALIPER_CONTEXTS: dict[type[BaseModel], str] = {
+    IMSCaliperSensorModel1_1: "http://purl.imsglobal.org/ctx/caliper/v1p1",
+    IMSCaliperSensorModel1_2: "http://purl.imsglobal.org/ctx/caliper/v1p2",
+}
+# Keys required in every xAPI statement
+XAPI_KEYS = frozenset({"actor", "verb", "object"})
+
+# Tells whether a trace is of a format: True if it is identified as such,
+# False if it can't be valid for it, None if it doesn't say
+type FormatDiscriminator = Callable[[JsonType], bool | None]
+
+
+def discriminate_caliper(data: JsonType, context: str) -> bool | None:
+    """Tell whether a Caliper envelope is of the version of a JSON-LD context.
+
+    The version is given by the envelope `dataVersion`, or else by the `@context`
+    of its first entity or event, which has a `type`.
+
+    :param data: The trace data
+    :param context: The JSON-LD context of the version
+    :return: Whether the envelope is of the version, None if it doesn't say
+    """
+    if not isinstance(data, Mapping):
+        return False
+
+    version = data.get("dataVersion")
+    if version not in CALIPER_CONTEXTS.values():
+        entities = data.get("data")
+        entity = entities[0] if isinstance(entities, list) and entities else None
+        if not isinstance(entity, Mapping) or "type" not in entity:
+            return None
+        version = entity.get("@context")
+        if version not in CALIPER_CONTEXTS.values():
+            return None
+    return version == context
+
+
+def discriminate_xapi(data: JsonType) -> bool:
+    """Tell whether a trace has the actor, verb and object of an xAPI statement.
+
+    :param data: The trace data
+    :return: Whether the trace has the keys of a statement
+    """
+    return isinstance(data, Mapping) and XAPI_KEYS.issubset(data)
+
+
+# The discriminators of the format models having one
+FORMAT_DISCRIMINATORS: dict[type[BaseModel], FormatDiscriminator] = {
+    **{
+        model: partial(discriminate_caliper, context=context)
+        for model, context in CALIPER_CONTEXTS.items()
+    },
+    BaseXapiStatement: discriminate_xapi,
+}
@@ -0,0 +1,108 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cache
+
+from pydantic import BaseModel, RootModel
+from pydantic.fields import FieldInfo
+
+from app.common.common_types import JsonType
+
+
+@dataclass(frozen=True)
+class FormatSignature:
+    """Top-level keys a trace must have to be valid for a format model.
+
+    A signature is a necessary condition only: a trace matching it must still be validated,
+    but a trace not matching it can't be valid for the model.
+
+    :param required_keys: For each required field, the keys accepted for it
+    :param allowed_keys: The only keys accepted, None if extra keys are allowed
+    :param is_exact: False if the keys can't be derived from the model, which then matches any trace
+    """
+
+    required_keys: tuple[frozenset[str], ...] = ()
+    allowed_keys: frozenset[str] | None = None
+    is_exact: bool = True
+
+    def may_match(self, data: JsonType) -> bool:
+        """Check whether a trace may be valid for the model.
+
+        :param data: The trace data
+        :return: False if the trace can't be valid for the model
+        """
+        if not self.is_exact:
+            return True
+        if not isinstance(data, Mapping):
+            return False
+        if not all(
+            any(key in data for key in field_keys) for field_keys in self.required_keys
+        ):
+            return False
+        return self.allowed_keys is None or self.allowed_keys.issuperset(data)
+
+
+@cache
+def get_format_signature(model: type[BaseModel]) -> FormatSignature:
+    """Derive the signature of a format model, once per model.
+
+    The signature is not exact when the model may change its input keys
+    before validating them (root models, `before` or `wrap` model validators)
+    or when a field accepts several aliases.
+
+    :param model: The format model
+    :return: The signature of the model
+    """
+    if issubclass(model, RootModel) or any(
+        validator.info.mode in ("before", "wrap")
+        for validator in model.__pydantic_decorators__.model_validators.values()
+    ):
+        return FormatSignature(is_exact=False)
+
+    populate_by_name = bool(model.model_config.get("populate_by_name"))
+    fields_keys = {}
+    for name, field in model.model_fields.items():
+        field_keys = _get_field_keys(
+            name=name,
+            field=field,
+            populate_by_name=populate_by_name,
+        )
+        if field_keys is None:
+            return FormatSignature(is_exact=False)
+        fields_keys[name] = field_keys
+
+    allowed_keys = None
+    if model.model_config.get("extra") == "forbid":
+        allowed_keys = frozenset().union(*fields_keys.values())
+
+    return FormatSignature(
+        required_keys=tuple(
+            fields_keys[name]
+            for name, field in model.model_fields.items()
+            if field.is_required()
+        ),
+        allowed_keys=allowed_keys,
+    )
+
+
+def _get_field_keys(
+    name: str,
+    field: FieldInfo,
+    populate_by_name: bool,
+) -> frozenset[str] | None:
+    """Get the input keys accepted for a model field.
+
+    :param name: The field name
+    :param field: The field info
+    :param populate_by_name: Whether the field can be populated by its name as well as its alias
+    :return: The accepted keys, None if they can't be determined (AliasPath, AliasChoices)
+    """
+    alias = (
+        field.validation_alias if field.validation_alias is not None else field.alias
+    )
+    if alias is None:
+        return frozenset({name})
+    if not isinstance(alias, str):
+        return None
+    if populate_by_name:
+        return frozenset({alias, name})
+    return frozenset({alias})
@@ -1,4 +1,12 @@
-from pydantic import BaseModel, model_validator
+from dataclasses import dataclass
+from typing import Self
+
+from pydantic import (
+    BaseModel,
+    PrivateAttr,
+    ValidatorFunctionWrapHandler,
+    model_validator,
+)
 
 from app.common.common_types import JsonType
 from app.common.exceptions import InvalidTraceError, UnknownFormatError
@@ -7,28 +15,59 @@ from app.common.extensions.enums import (
     CustomTraceFormatStrEnum,
 )
 
+from .format_discriminator import FORMAT_DISCRIMINATORS
+from .format_signature import get_format_signature
+
+
+@dataclass(slots=True)
+class TraceRecord:
+    """Trace read from a file, as given to the mapper, not validated against its format.
+
+    Parsers yield records rather than traces, the validation of a trace being only
+    needed at the API boundary, and costly for every row of a large file.
+
+    :param data: The trace data
+    :param format: The format of the trace
+    """
+
+    data: JsonType
+    format: CustomTraceFormatStrEnum
+
 
 class Trace(BaseModel):
     """Represents a trace in a specific format.
 
     This class encapsulates the trace data and its associated format.
     It provides a method for automatic format detection.
+    The format model instance built while validating the data is kept with the trace,
+    so that it is never validated twice.
     """
 
     data: JsonType
     format: CustomTraceFormatStrEnum
     profile: str | None = None
 
-    @model_validator(mode="before")
+    _model: BaseModel | None = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
     @classmethod
-    def validate_data_and_format(cls, values: dict) -> dict:
+    def validate_data_and_format(
+        cls,
+        values: dict,
+        handler: ValidatorFunctionWrapHandler,
+    ) -> Self:
         """Validates the input data and format.
         If no format is provided, it attempts to detect the format automatically.
 
         :param values: Keyword arguments containing the trace data, format, and optional profile
+        :param handler: The pydantic handler validating the trace fields
         :raises InvalidTraceError: If the trace data is invalid for the specified format
         :raises UnknownFormatError: If the trace format can't be detected
         """
+        # A trace instance, as an existing trace, is already validated
+        if not isinstance(values, dict):
+            return handler(values)
+
         input_data = values.get("data")
         input_format = values.get("format")
 
@@ -36,56 +75,167 @@ class Trace(BaseModel):
             raise InvalidTraceError("Trace data is required")
 
         if input_format:
-            cls.validate_format(
+            model = cls.get_format_model_instance(
                 trace_data=input_data,
                 trace_format=input_format,
             )
         else:
-            detected_format = cls.detect_format(input_data)
-            if detected_format:
-                values["format"] = detected_format
-            else:
+            detected = cls._detect_format_and_model(data=input_data)
+            if detected is None:
                 raise UnknownFormatError("Unable to detect trace format")
+            values["format"], model = detected
 
-        return values
+        trace = handler(values)
+        trace._model = model  # noqa: SLF001
+        return trace
+
+    @classmethod
+    def from_validated_model(
+        cls,
+        data: JsonType,
+        trace_format: CustomTraceFormatStrEnum,
+        model: BaseModel,
+        profile: str | None = None,
+    ) -> Self:
+        """Create a trace from data already validated against its format, without validating it again.
+
+        :param data: The trace data
+        :param trace_format: The format of the trace
+        :param model: The format model instance validated from the data
+        :param profile: The profile of the trace
+        :return: The trace, carrying the format model instance
+        """
+        trace = cls.model_construct(data=data, format=trace_format, profile=profile)
+        trace._model = model  # noqa: SLF001
+        return trace
+
+    @property
+    def model(self) -> BaseModel:
+        """The format model instance of the trace data.
+
+        It is the instance validated when the trace was created, or validated once on first
+        access for traces created without validation.
+
+        :raises InvalidTraceError: If the trace data is invalid for its format
+        """
+        if self._model is None:
+            self._model = self.get_format_model_instance(
+                trace_data=self.data,
+                trace_format=self.format,
+            )
+        return self._model
+
+    def reset_model(self) -> None:
+        """Forget the format model instance, after the trace data was changed in place.
+
+        The model is validated again from the changed data on next access.
+        """
+        self._model = None
 
     @staticmethod
-    def validate_format(
+    def get_format_model_instance(
         trace_data: JsonType,
         trace_format: CustomTraceFormatStrEnum,
-    ) -> bool:
-        """Validate the input data against a specified format.
+    ) -> BaseModel:
+        """Validate the input data against a specified format and get the model instance.
 
         :param trace_data: The input trace data to validate
         :param trace_format: The format to validate against
 
-        :return: True if the data is valid for the specified format
+        :return: The format model instance built from the data
         :raises InvalidTraceError: If the trace format is incorrect
         """
         try:
-            CustomTraceFormatModelEnum[trace_format.name].value(**trace_data)
+            return CustomTraceFormatModelEnum[trace_format.name].value(**trace_data)
         except (ValueError, TypeError) as e:
             raise InvalidTraceError(
                 f"Invalid trace for specified format: {trace_format.name}",
             ) from e
+
+    @classmethod
+    def validate_format(
+        cls,
+        trace_data: JsonType,
+        trace_format: CustomTraceFormatStrEnum,
+    ) -> bool:
+        """Validate the input data against a specified format.
+
+        :param trace_data: The input trace data to validate
+        :param trace_format: The format to validate against
+
+        :return: True if the data is valid for the specified format
+        :raises InvalidTraceError: If the trace format is incorrect
+        """
+        cls.get_format_model_instance(trace_data=trace_data, trace_format=trace_format)
         return True
 
     @classmethod
     def detect_format(cls, data: JsonType) -> CustomTraceFormatStrEnum | None:
         """Attempt to detect the format of the input trace data.
 
-        This method tries to validate the data against all known formats.
+        This method tries to validate the data against all known formats, in order.
+        Formats whose top-level keys signature doesn't match the data, or whose
+        discriminator rules the data out, are skipped without being validated.
+        A format which is the only one identified by its discriminator is validated
+        first, so that the other formats are only tried if it is not valid.
 
         :param data: The input trace data to analyze
 
         :return: The detected format, or None if no format matches
         """
-        for trace_format in CustomTraceFormatStrEnum:
-            if trace_format == CustomTraceFormatStrEnum.CUSTOM:
-                continue
+        detected = cls._detect_format_and_model(data=data)
+        return detected[0] if detected else None
+
+    @classmethod
+    def _detect_format_and_model(
+        cls,
+        data: JsonType,
+    ) -> tuple[CustomTraceFormatStrEnum, BaseModel] | None:
+        """Detect the format of the input trace data, see detect_format.
+
+        :param data: The input trace data to analyze
+
+        :return: The detected format with its model instance, or None if no format matches
+        """
+        for trace_format in cls._get_format_candidates(data=data):
             try:
-                if cls.validate_format(trace_data=data, trace_format=trace_format):
-                    return trace_format
+                model = cls.get_format_model_instance(
+                    trace_data=data,
+                    trace_format=trace_format,
+                )
             except InvalidTraceError:
                 continue
+            return trace_format, model
         return None
+
+    @classmethod
+    def _get_format_candidates(
+        cls,
+        data: JsonType,
+    ) -> list[CustomTraceFormatStrEnum]:
+        """Get the formats the input trace data may be valid for, see detect_format.
+
+        :param data: The input trace data to analyze
+
+        :return: The formats to validate the data against, in order
+        """
+        candidates = []
+        identified = []
+        for trace_format in CustomTraceFormatStrEnum:
+            if trace_format == CustomTraceFormatStrEnum.CUSTOM:
+                continue
+            format_model = CustomTraceFormatModelEnum[trace_format.name].value
+            if not get_format_signature(model=format_model).may_match(data=data):
+                continue
+            discriminator = FORMAT_DISCRIMINATORS.get(format_model)
+            is_format = discriminator(data) if discriminator is not None else None
+            if is_format is False:
+                continue
+            candidates.append(trace_format)
+            if is_format:
+                identified.append(trace_format)
+
+        if len(identified) == 1:
+            candidates.remove(identified[0])
+            candidates.insert(0, identified[0])
+        return candidates
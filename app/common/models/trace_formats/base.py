@@ -1,11 +1,121 @@
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from enum import Enum
 from types import UnionType
-from typing import Any, Union, get_origin
+from typing import Any, ClassVar, Literal, Union, get_args, get_origin
 
 from pydantic import BaseModel, field_validator
 from pydantic.fields import FieldInfo
 from pydantic_core import ValidationError
 from pydantic_core.core_schema import ValidationInfo
 
+DISCRIMINATOR_FIELD = "type"
+
+
+@dataclass(frozen=True)
+class FieldCandidates:
+    """Models a field value can be validated against, indexed by their `type` discriminator.
+
+    Models whose `type` field is a string Literal can only validate values having one of
+    these strings as `type`: they are indexed by these strings so they are the only ones tried.
+
+    Args:
+        untyped (Tuple[Type[BaseModel]]): Models without a string Literal `type` field
+        by_type (Mapping[str, Tuple[Type[BaseModel]]]): Typed models, by `type` value
+        type_optional (Tuple[Type[BaseModel]]): Typed models with a default `type`
+        all_models (Tuple[Type[BaseModel]]): All the models, in resolution order
+
+    """
+
+    untyped: tuple[type[BaseModel], ...] = ()
+    by_type: Mapping[str, tuple[type[BaseModel], ...]] = field(default_factory=dict)
+    type_optional: tuple[type[BaseModel], ...] = ()
+    all_models: tuple[type[BaseModel], ...] = ()
+
+    @classmethod
+    def from_models(cls, models: tuple[type[BaseModel], ...]) -> "FieldCandidates":
+        """Index models by the values of their `type` discriminator.
+
+        Args:
+            models (Tuple[Type[BaseModel]]): The candidate models, in resolution order
+
+        Returns:
+            FieldCandidates: The indexed candidates
+
+        """
+        untyped = []
+        by_type: dict[str, list[type[BaseModel]]] = {}
+        type_optional = []
+        for model in models:
+            type_values = cls.get_type_values(model=model)
+            if type_values is None:
+                untyped.append(model)
+                continue
+            for type_value in type_values:
+                by_type.setdefault(type_value, []).append(model)
+            if not model.model_fields[DISCRIMINATOR_FIELD].is_required():
+                type_optional.append(model)
+
+        return cls(
+            untyped=tuple(untyped),
+            by_type={key: tuple(value) for key, value in by_type.items()},
+            type_optional=tuple(type_optional),
+            all_models=models,
+        )
+
+    @staticmethod
+    def get_type_values(model: type[BaseModel]) -> tuple[str, ...] | None:
+        """Get the `type` values accepted by a model.
+
+        Args:
+            model (Type[BaseModel]): The model
+
+        Returns:
+            Optional[Tuple[str]]: The accepted values, None if the `type` field of the model
+            isn't a Literal of strings
+
+        """
+        type_field = model.model_fields.get(DISCRIMINATOR_FIELD)
+        if (
+            type_field is None
+            or get_origin(type_field.annotation) is not Literal
+            or (type_field.alias or DISCRIMINATOR_FIELD) != DISCRIMINATOR_FIELD
+            or (type_field.validation_alias or DISCRIMINATOR_FIELD)
+            != DISCRIMINATOR_FIELD
+        ):
+            return None
+
+        type_values = tuple(
+            value.value if isinstance(value, Enum) else value
+            for value in get_args(type_field.annotation)
+        )
+        if not all(isinstance(value, str) for value in type_values):
+            return None
+        return type_values
+
+    def get_models(self, value: dict) -> tuple[type[BaseModel], ...]:
+        """Get the models that may validate a value.
+
+        Args:
+            value (Dict): Data for the model
+
+        Returns:
+            Tuple[Type[BaseModel]]: The models to try, in order
+
+        """
+        if DISCRIMINATOR_FIELD not in value:
+            return self.untyped + self.type_optional
+
+        type_value = value[DISCRIMINATOR_FIELD]
+        if isinstance(type_value, Enum):
+            type_value = type_value.value
+        if isinstance(type_value, str):
+            return self.by_type.get(type_value, ()) + self.untyped
+
+        # Unexpected `type` value: try them all
+        return self.all_models
+
 
 class ExtendedTypeBaseModel(BaseModel):
     """Pydantic BaseModel with extended type for Fields.
@@ -31,8 +141,47 @@ class ExtendedTypeBaseModel(BaseModel):
         ModelC(**{"object_a": {"name": "bob"}})  # OK > ModelA
         ModelC(**{"object_a": {"name": "bob", "age": 15}})  # OK > ModelB
 
+    The candidate models of each field are resolved once, on the first validation of the field,
+    and indexed by their `type` discriminator so that only the models accepting the `type`
+    of a value are tried. They are resolved again when a new subclass is created.
+
     """
 
+    _fields_candidates: ClassVar[dict[tuple[type, str], FieldCandidates]] = {}
+    _type_dispatch_tables: ClassVar[dict[Any, dict[str, type[BaseModel]]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Invalidate the resolved candidates, as the new subclass may be one of them."""
+        super().__pydantic_init_subclass__(**kwargs)
+        ExtendedTypeBaseModel._fields_candidates.clear()
+        ExtendedTypeBaseModel._type_dispatch_tables.clear()
+
+    @classmethod
+    def get_type_dispatch_table(cls, annotation: Any) -> dict[str, type[BaseModel]]:
+        """Get the model to apply for each `type` value, among the subclasses of an annotation.
+
+        The table is generated on first use. When several models accept the same `type`,
+        the first declared one (the most generic) is used.
+
+        Args:
+            annotation (Any): Annotation of the models to dispatch to
+
+        Returns:
+            Dict[str, Type[BaseModel]]: The model of each `type` value
+
+        """
+        table = cls._type_dispatch_tables.get(annotation)
+        if table is None:
+            table = {}
+            for model in dict.fromkeys(cls._get_subclasses(annotation)):
+                if not (isinstance(model, type) and issubclass(model, BaseModel)):
+                    continue
+                for type_value in FieldCandidates.get_type_values(model=model) or ():
+                    table.setdefault(type_value, model)
+            cls._type_dispatch_tables[annotation] = table
+        return table
+
     @classmethod
     def _get_subclasses(cls, annotation):
         """Get all child classes (subclasses) from a given model.
@@ -55,23 +204,51 @@ class ExtendedTypeBaseModel(BaseModel):
             yield annotation
 
     @classmethod
-    def _get_correct_value(cls, value: Any, annotations: list) -> Any:
+    def _get_field_candidates(
+        cls,
+        field_name: str,
+        field: FieldInfo,
+    ) -> FieldCandidates:
+        """Get the candidate models of a field, resolving them on first use.
+
+        Args:
+            field_name (str): Name of the field
+            field (FieldInfo): The field information
+
+        Returns:
+            FieldCandidates: The indexed candidate models of the field
+
+        """
+        key = (cls, field_name)
+        candidates = cls._fields_candidates.get(key)
+        if candidates is None:
+            models = tuple(
+                annotation
+                for annotation in dict.fromkeys(cls._get_subclasses(field.annotation))
+                if isinstance(annotation, type) and issubclass(annotation, BaseModel)
+            )
+            candidates = FieldCandidates.from_models(models=models)
+            cls._fields_candidates[key] = candidates
+        return candidates
+
+    @classmethod
+    def _get_correct_value(cls, value: Any, candidates: FieldCandidates) -> Any:
         """Get the correct model instance depending on value.
 
         Args:
             value (Any): Data for the model
-            annotations (List): list of models
+            candidates (FieldCandidates): The candidate models of the field
 
         Returns:
             Any: Either returns a model instance with the valid data or the exact passed value
 
         """
-        for each_type in annotations:
-            if issubclass(each_type, BaseModel) and isinstance(value, dict):
-                try:
-                    return each_type(**value)
-                except ValidationError:
-                    pass
+        if not isinstance(value, dict):
+            return value
+
+        for each_type in candidates.get_models(value=value):
+            with suppress(ValidationError):
+                return each_type(**value)
         return value
 
     @field_validator("*", mode="before")
@@ -97,7 +274,7 @@ class ExtendedTypeBaseModel(BaseModel):
         """
         # Get FieldInfo
         field = cls.model_fields.get(
-            extra_info.field_name if extra_info.field_name else "",
+            extra_info.field_name or "",
             None,
         )
 
@@ -107,16 +284,17 @@ class ExtendedTypeBaseModel(BaseModel):
             or isinstance(field.annotation, BaseModel.__class__)
         ):
             # Get all child classes
-            new_annotation = set()
-            new_annotation.update(cls._get_subclasses(field.annotation))
-            new_annotation = list(new_annotation)
+            candidates = cls._get_field_candidates(
+                field_name=extra_info.field_name,
+                field=field,
+            )
 
             # Return correct instance
             if get_origin(field.annotation) is list and isinstance(value, list):
                 return [
-                    cls._get_correct_value(each_value, new_annotation)
+                    cls._get_correct_value(each_value, candidates)
                     for each_value in value
                 ]
 
-            return cls._get_correct_value(value, new_annotation)
+            return cls._get_correct_value(value, candidates)
         return value
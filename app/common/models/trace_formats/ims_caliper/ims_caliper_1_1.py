@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import TYPE_CHECKING, Literal, get_args, get_origin
+from typing import TYPE_CHECKING, Literal, get_origin
 
 from pydantic import BaseModel, Field, field_validator
 from pydantic.fields import FieldInfo
@@ -1463,6 +1463,7 @@ class IMSCaliperModel(BaseModel):
 
         This validator will act as a custom discriminator to apply the correct model to all
         the data values by using the `type` field present in all EventModel instances.
+        The model of each `type` is found in the dispatch table generated once for this version.
 
         Args:
             value (List[EventModel]): `data` field content
@@ -1474,39 +1475,31 @@ class IMSCaliperModel(BaseModel):
         """
         # Get FieldInfo
         field = cls.model_fields.get(
-            extra_info.field_name if extra_info.field_name else "",
+            extra_info.field_name or "",
             None,
         )
 
-        if isinstance(field, FieldInfo):
-            # Get child classes
-            list_event_model = set()
-            list_event_model.update(
-                ExtendedTypeBaseModel._get_subclasses(field.annotation),
+        if (
+            isinstance(field, FieldInfo)
+            and get_origin(field.annotation) is list
+            and isinstance(value, list)
+        ):
+            # Table acting as pydantic's discriminator (to know which model to apply)
+            dispatch_table = ExtendedTypeBaseModel.get_type_dispatch_table(
+                field.annotation,
             )
-            list_event_model = list(list_event_model)
-
-            # Generate a dict to act as pydantic's discriminator (to know with model to apply)
-            dict_discriminator = {}
-            for event_model in list_event_model:
-                key = event_model.model_fields.get("type")
-                key = get_args(key.annotation) if key else None
-                key = key[0] if key else None
-                dict_discriminator[key] = event_model
 
             # Apply correct models
-            if get_origin(field.annotation) is list and isinstance(value, list):
-                new_value = []
-                for each_value in value:
-                    model_value = each_value
-                    if isinstance(each_value, dict) and (
-                        event_model := dict_discriminator.get(
-                            each_value.get("type", ""),
-                            None,
-                        )
-                    ):
-                        model_value = event_model(**each_value)
-                    new_value.append(model_value)
-                return new_value
+            new_value = []
+            for each_value in value:
+                model_value = each_value
+                if (
+                    isinstance(each_value, dict)
+                    and isinstance(type_value := each_value.get("type"), str)
+                    and (event_model := dispatch_table.get(type_value))
+                ):
+                    model_value = event_model(**each_value)
+                new_value.append(model_value)
+            return new_value
 
         return value
@@ -68,10 +68,37 @@ def get_value_from_flat_key(
         Any: Value or None if nothing was found.
 
     """
-    list_key = flat_key.split(".")
-    total_list_key_len = len(list_key)
+    return get_value_from_split_key(
+        dict_element=dict_element,
+        split_key=flat_key.split("."),
+        default_value=default_value,
+        return_copy=return_copy,
+    )
+
+
+def get_value_from_split_key(
+    dict_element: Mapping | Sequence,
+    split_key: Sequence[str],
+    default_value=None,
+    return_copy=True,
+) -> Any:
+    """Get value from a dict element by using an already split flatten key.
+
+    See get_value_from_flat_key: use this one to split a key once and reuse it.
+
+    Args:
+        dict_element (Mapping | Sequence): Dict to navigate
+        split_key (Sequence[str]): Flatten key split on dots (["key1", "key2"])
+        default_value (Any): Default value if ever nothing is found. Default value is None
+        return_copy (bool): Return a copy if type is dict or list. Default value is True
+
+    Returns:
+        Any: Value or None if nothing was found.
+
+    """
+    total_list_key_len = len(split_key)
     value = dict_element if not is_empty(dict_element) else {}
-    for index, key in enumerate(list_key, start=1):
+    for index, key in enumerate(split_key, start=1):
         if key.isnumeric() and isinstance(value, Sequence):
             try:
                 value = value[int(key)]
@@ -133,24 +160,72 @@ def set_value_from_flat_key(
             Defaults to True.
             If overwrite is False, it will not overwrite any non-empty field.
 
-    Raises:
-        ValueError: Raised if error during flat_key splitting.
-
     Returns:
         dict | list: The original dict or list, modified if not overwrite.
 
     """
+    return set_value_from_split_key(
+        dict_list_element=dict_list_element,
+        split_key=split_flat_key(flat_key=flat_key),
+        value=value,
+        overwrite=overwrite,
+    )
+
+
+def split_flat_key(flat_key: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a flatten key (keys separated with dotes) into its keys.
+
+    Keys with brackets (e.g., for extensions) are split into the key and its subkey.
+    An empty flatten key is split into an empty tuple.
+
+    Args:
+        flat_key (str): Flatten key (key1.key2[subkey]).
+
+    Returns:
+        tuple: The (key, subkey) pairs. Subkey is None for keys without brackets.
+            Example: (("key1", None), ("key2", "subkey"))
+
+    """
+    if is_empty(flat_key):
+        return ()
+
+    split_key = []
     # Split the flat_key, but keep keys with brackets intact
-    keys = re.split(r"\.(?![^\[]*\])", flat_key)
+    for full_key in re.split(r"\.(?![^\[]*\])", flat_key):
+        # Handle keys with brackets (e.g., for extensions)
+        match = re.match(r"(.+?)\[(.+)\]", full_key)
+        if match:
+            split_key.append((match.group(1), match.group(2).strip("'\"")))
+        else:
+            split_key.append((full_key.replace(r"\.", "."), None))
+    return tuple(split_key)
 
-    # Error during split
-    if not keys:
-        raise ValueError(
-            "> Empty split not possible, something went wrong while setting dot dict",
-        )
 
+def set_value_from_split_key(
+    dict_list_element: MutableMapping[str, Any] | Sequence,
+    split_key: Sequence[tuple[str, str | None]],
+    value: Any,
+    overwrite: bool = True,
+) -> dict | list:
+    """Set recursively a value into a dict element by using an already split flatten key.
+
+    See set_value_from_flat_key: use this one with split_flat_key to split a key once
+    and reuse it.
+
+    Args:
+        dict_list_element (MutableMapping | Sequence): Dict of list to navigate.
+        split_key (Sequence[tuple[str, str | None]]): Key split with split_flat_key.
+        value (Any): Value to set.
+        overwrite (bool, optional): If True, overwrite existing value if any.
+            Defaults to True.
+            If overwrite is False, it will not overwrite any non-empty field.
+
+    Returns:
+        dict | list: The original dict or list, modified if not overwrite.
+
+    """
     # If flat_key is empty, return the value or the original dict_list_element based on overwrite
-    if is_empty(flat_key):
+    if not split_key:
         return value if overwrite else dict_list_element
 
     # Handle the case where dict_list_element is empty and overwrite is False
@@ -158,14 +233,9 @@ def set_value_from_flat_key(
         return dict_list_element
 
     current = dict_list_element
-    for i, full_key in enumerate(keys):
-        # Handle keys with brackets (e.g., for extensions)
-        match = re.match(r"(.+?)\[(.+)\]", full_key)
-        if match:
-            key, subkey = match.group(1), match.group(2).strip("'\"")
-        else:
-            key, subkey = full_key.replace(r"\.", "."), None
-
+    last_index = len(split_key) - 1
+    for i, (split_key_part, subkey) in enumerate(split_key):
+        key = split_key_part
         try:
             # Handle numeric keys for list indexing
             if key.isnumeric():
@@ -178,7 +248,7 @@ def set_value_from_flat_key(
                 while len(current) <= key:
                     current.append(None)
 
-            if i == len(keys) - 1:
+            if i == last_index:
                 # We've reached the final key
                 if subkey:
                     # Handle extension-like keys
@@ -205,9 +275,8 @@ def set_value_from_flat_key(
                 current = current[key][subkey]
             else:
                 # Determine if the next key is numeric (for list creation)
-                next_key_is_numeric = (
-                    keys[i + 1].isnumeric() if i + 1 < len(keys) else False
-                )
+                next_key, next_subkey = split_key[i + 1]
+                next_key_is_numeric = next_subkey is None and next_key.isnumeric()
                 if isinstance(current, list):
                     if current[key] is None:
                         current[key] = [] if next_key_is_numeric else {}
@@ -332,3 +401,22 @@ def deep_merge(target_dict: dict, merge_dct: Mapping) -> None:
         # In all other cases, replace the target value with the merge value
         else:
             target_dict[key] = value
+
+
+def copy_nested(value: Any) -> Any:
+    """Copy the nested dicts and lists of a value, sharing its other values.
+
+    Faster than copy.deepcopy for JSON-like data, whose other values are immutable.
+
+    Args:
+        value (Any): The value to copy.
+
+    Returns:
+        Any: The copied value.
+
+    """
+    if isinstance(value, dict):
+        return {key: copy_nested(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_nested(item) for item in value]
+    return value
@@ -79,3 +79,43 @@ class ConfigContract(ABC):
         :return: A list of profile names.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def get_mappings_registry_path(self) -> str | PathLike[str]:
+        """Get the path where registered mapping files are stored.
+
+        :return: The path as a string.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_mappings_registry_size(self) -> int:
+        """Get the maximum number of registered mappings kept in memory.
+
+        :return: The maximum number of mappings.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_custom_conversion_processes(self) -> int:
+        """Get the number of processes converting the rows of custom files.
+
+        :return: The number of processes, 0 or 1 to convert in the request worker.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_custom_conversion_threads(self) -> int:
+        """Get the number of custom files converted at once by a worker, in threads.
+
+        :return: The number of threads, apart from the ones of the other requests.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_custom_conversion_chunk_size(self) -> int:
+        """Get the number of rows of custom files converted at once by a process.
+
+        :return: The number of rows.
+        """
+        raise NotImplementedError
@@ -75,6 +75,29 @@ class EnvConfig(ConfigContract):
             return set()
         return {name.strip() for name in names.split(",")}
 
+    def get_mappings_registry_path(self) -> str | os.PathLike[str]:
+        """Inherited from ConfigContract.get_mappings_registry_path."""
+        return self._get(
+            "MAPPINGS_REGISTRY_PATH",
+            Path("data").joinpath("mappings_registry").as_posix(),
+        )
+
+    def get_mappings_registry_size(self) -> int:
+        """Inherited from ConfigContract.get_mappings_registry_size."""
+        return int(self._get("MAPPINGS_REGISTRY_SIZE", "256"))
+
+    def get_custom_conversion_processes(self) -> int:
+        """Inherited from ConfigContract.get_custom_conversion_processes."""
+        return int(self._get("CUSTOM_CONVERSION_PROCESSES", "0"))
+
+    def get_custom_conversion_threads(self) -> int:
+        """Inherited from ConfigContract.get_custom_conversion_threads."""
+        return int(self._get("CUSTOM_CONVERSION_THREADS", "8"))
+
+    def get_custom_conversion_chunk_size(self) -> int:
+        """Inherited from ConfigContract.get_custom_conversion_chunk_size."""
+        return int(self._get("CUSTOM_CONVERSION_CHUNK_SIZE", "1000"))
+
     @staticmethod
     def _get(key: str, default: str | None = None) -> str:
         """Get a value from environment variables with a default.
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+DEFAULT_CACHE_MAXSIZE = 1024
+
+
+@dataclass(frozen=True)
+class ExpressionCacheInfo:
+    """Statistics of an ExpressionCache.
+
+    :param hits: Number of lookups served from the cache
+    :param misses: Number of lookups that had to build the entry
+    :param maxsize: Maximum number of entries kept in the cache
+    :param currsize: Current number of entries in the cache
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ExpressionCache:
+    """Thread-safe bounded LRU cache for compiled expressions.
+
+    The least recently used entry is evicted once the cache is full.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> None:
+        """Initialize the ExpressionCache.
+
+        :param maxsize: Maximum number of entries kept in the cache
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """Get an entry from the cache, or build and store it if missing.
+
+        The builder is called outside the lock: if it raises, nothing is stored.
+
+        :param key: The cache key
+        :param builder: Callable building the entry on a cache miss
+        :return: The cached or newly built entry
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        value = builder()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def info(self) -> ExpressionCacheInfo:
+        """Get the cache statistics.
+
+        :return: An ExpressionCacheInfo snapshot
+        """
+        with self._lock:
+            return ExpressionCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
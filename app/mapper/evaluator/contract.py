@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping
+from functools import partial
 from typing import Any
 
 
@@ -46,3 +47,15 @@ class ExpressionEvaluatorContract(ABC):
         :raises ExpressionEvaluationError: If evaluation fails
         """
         raise NotImplementedError
+
+    def compile_lambda(self, lambda_expr: str) -> Callable[..., Any]:
+        """Compile a lambda expression once into a callable.
+
+        The callable evaluates the lambda with the arguments it is called with.
+        Implementations can override it to compile the lambda ahead of time.
+
+        :param lambda_expr: The lambda expression as a string (e.g., "lambda x, y: x + y")
+        :return: A callable evaluating the lambda
+        :raises ExpressionEvaluationError: If compilation fails
+        """
+        return partial(self.eval_lambda, lambda_expr)
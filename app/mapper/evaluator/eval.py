@@ -1,11 +1,20 @@
 from collections.abc import Callable
-from typing import Any
+from types import CodeType
+from typing import TYPE_CHECKING, Any
 
 from app.infrastructure.logging.contract import LoggerContract
 
+from .cache import ExpressionCache
 from .contract import ExpressionEvaluatorContract
 from .exceptions import ExpressionEvaluationError
 
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+# Process-wide caches, shared by all evaluator instances of a worker
+CODE_CACHE = ExpressionCache()
+LAMBDA_CACHE = ExpressionCache()
+
 
 class EvalExpressionEvaluator(ExpressionEvaluatorContract):
     """Simple implementation of expression evaluation using eval()."""
@@ -48,6 +57,7 @@ class EvalExpressionEvaluator(ExpressionEvaluatorContract):
             "True": True,
             "False": False,
         }
+        self._refresh_globals()
 
     def register_function(self, name: str, func: Callable) -> None:
         """Register a function to be available during expression evaluation.
@@ -66,6 +76,7 @@ class EvalExpressionEvaluator(ExpressionEvaluatorContract):
             raise ValueError(msg)
 
         self.registered_functions[name] = func
+        self._refresh_globals()
 
     def eval_expression(self, expression: str) -> Any:
         """Evaluate a simple expression using eval().
@@ -80,10 +91,16 @@ class EvalExpressionEvaluator(ExpressionEvaluatorContract):
             raise ExpressionEvaluationError(msg)
 
         try:
-            globals_dict = self.registered_functions.copy()
-            globals_dict["__builtins__"] = {}
-
-            return eval(expression, globals_dict, {})  # noqa: S307
+            code = CODE_CACHE.get_or_build(
+                key=expression,
+                # Like eval(), ignore the leading spaces and tabs of the expression
+                builder=lambda: compile(
+                    expression.lstrip(" \t"),
+                    "<expression>",
+                    "eval",
+                ),
+            )
+            return self._eval_code(code=code)
         except Exception as e:
             msg = "Expression evaluation failed"
             self.logger.exception(msg, e, {"expression": expression})
@@ -97,16 +114,57 @@ class EvalExpressionEvaluator(ExpressionEvaluatorContract):
         :return: The result of the lambda evaluation
         :raises ExpressionEvaluationError: If evaluation fails
         """
-        # Compile and evaluate the lambda
-        lambda_func = self.eval_expression(expression=lambda_expr)
+        return self.compile_lambda(lambda_expr=lambda_expr)(*args)
+
+    def compile_lambda(self, lambda_expr: str) -> Callable[..., Any]:
+        """Compile a lambda expression once into a callable.
+
+        :param lambda_expr: The lambda expression as a string (e.g., "lambda x, y: x + y")
+        :return: A callable evaluating the lambda
+        :raises ExpressionEvaluationError: If compilation fails
+        """
+        # Compile and evaluate the lambda once per registered functions set.
+        # The globals are cached along the lambda to keep the key ids alive.
+        lambda_func, _ = LAMBDA_CACHE.get_or_build(
+            key=(lambda_expr, self._functions_key),
+            builder=lambda: (
+                self.eval_expression(expression=lambda_expr),
+                self._globals,
+            ),
+        )
         if not callable(lambda_func):
             msg = "Expression did not evaluate to a callable"
             self.logger.error(msg, {"expression": lambda_expr})
             raise ExpressionEvaluationError(msg)
 
-        try:
-            return lambda_func(*args)
-        except Exception as e:
-            msg = "Lambda evaluation failed"
-            self.logger.exception(msg, e, {"expression": lambda_expr})
-            raise ExpressionEvaluationError(msg) from e
+        def compiled_lambda(*args) -> Any:
+            try:
+                return lambda_func(*args)
+            except Exception as e:
+                msg = "Lambda evaluation failed"
+                self.logger.exception(msg, e, {"expression": lambda_expr})
+                raise ExpressionEvaluationError(msg) from e
+
+        return compiled_lambda
+
+    def _refresh_globals(self) -> None:
+        """Rebuild the evaluation globals after the registered functions changed.
+
+        A new dict is built so that lambdas already cached keep the globals they
+        were created with.
+        """
+        self._globals: dict[str, Any] = {
+            **self.registered_functions,
+            "__builtins__": {},
+        }
+        self._functions_key: Hashable = frozenset(
+            (name, id(func)) for name, func in self.registered_functions.items()
+        )
+
+    def _eval_code(self, code: CodeType) -> Any:
+        """Evaluate a compiled expression with the registered functions.
+
+        :param code: The compiled expression
+        :return: The result of the evaluation
+        """
+        return eval(code, self._globals, {})  # noqa: S307
@@ -8,3 +8,11 @@ class MappingConfigToModelError(MapperError):
 
 class CodeEvaluationError(MapperError):
     """Exception when a Python code in Mapping config fails."""
+
+
+class MappingNotFoundError(MapperError):
+    """Exception when a registered mapping is not found."""
+
+
+class SchemaNotCachedError(MapperError):
+    """Exception when a worker process has no compiled plan for a schema key."""
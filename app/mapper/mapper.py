@@ -1,20 +1,39 @@
+from collections import OrderedDict
+from io import BytesIO
+from threading import Lock
 from typing import BinaryIO
 
-from app.common.extensions.enums import CustomTraceFormatStrEnum
-from app.common.models.trace import Trace
+from app.common.extensions.enums import (
+    CustomTraceFormatOutputMappingEnum,
+    CustomTraceFormatStrEnum,
+)
+from app.common.models.trace import Trace, TraceRecord
 from app.infrastructure.logging.contract import LoggerContract
 
 from .available_functions.mapping_runnable_functions import get_available_functions
 from .evaluator.contract import ExpressionEvaluatorContract
-from .exceptions import MapperError
+from .mapping_compiler import MappingCompiler
 from .mapping_engine import MappingEngine
+from .mapping_file_cache import MappingFileCache
+from .models.mapping_models import MappingPlan
+from .models.mapping_schema import MappingSchema
 from .repositories.contracts.repository import MappingRepository
 
+# Process-wide cache of the uploaded mapping files, keyed by their content hash
+MAPPING_FILE_CACHE = MappingFileCache()
+# Maximum number of compiled plans kept in memory by a mapper
+MAX_PLANS = 256
+
 
 class Mapper:
     """Class responsible for orchestrating the mapping process.
 
-    This class uses a MappingRepository to load schemas and a MappingEngine to perform the actual conversion.
+    This class uses a MappingRepository to load schemas, a MappingCompiler to compile them into plans
+    and a MappingEngine to perform the actual conversion.
+
+    A mapper can be shared by concurrent requests, as long as they get their plan
+    with the get_plan methods and give it to convert. The plans are compiled once
+    per schema and kept in memory.
     """
 
     def __init__(
@@ -31,7 +50,6 @@ class Mapper:
         """
         self.repository = repository
         self.logger = logger
-        self.schema = None
 
         self.expression_evaluator = expression_evaluator
         available_functions = get_available_functions()
@@ -40,49 +58,140 @@ class Mapper:
             "Registering functions for evaluator",
             {"functions": list(available_functions.keys())},
         )
+        self.compiler = MappingCompiler(
+            evaluator=self.expression_evaluator,
+            logger=self.logger,
+        )
+        # The engine is stateless, one is shared by all the conversions
+        self.engine = MappingEngine(
+            evaluator=self.expression_evaluator,
+            logger=self.logger,
+        )
+        # The compiled plans, by identity of their schema
+        self._plans: OrderedDict[int, MappingPlan] = OrderedDict()
+        self._plans_lock = Lock()
 
-    def load_schema_by_file(self, file: BinaryIO) -> None:
-        """Load a mapping schema from a file.
+    def get_plan(self, schema: MappingSchema) -> MappingPlan:
+        """Get the compiled plan of a mapping schema, compiling it on first use.
 
-        :param file: A file-like object containing the mapping schema
+        :param schema: The mapping schema
+        :return: The compiled mapping plan
+        :raises ExpressionEvaluationError: If a lambda of the schema can't be compiled
         """
-        self.schema = self.repository.load_schema_by_file(mapping_file=file)
+        key = id(schema)
+        with self._plans_lock:
+            plan = self._plans.get(key)
+            if plan is not None and plan.schema is schema:
+                self._plans.move_to_end(key)
+                return plan
 
-    def load_schema_by_formats(
+        plan = self.compiler.compile(mapping_schema=schema)
+        with self._plans_lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > MAX_PLANS:
+                self._plans.popitem(last=False)
+        return plan
+
+    def get_plan_by_formats(
         self,
         input_format: CustomTraceFormatStrEnum,
         output_format: CustomTraceFormatStrEnum,
-    ) -> None:
-        """Load a mapping schema based on input and output formats.
+    ) -> MappingPlan:
+        """Get the compiled plan of the mapping between two formats.
 
         :param input_format: The format of the input trace
         :param output_format: The desired output format
+        :return: The compiled mapping plan
         """
-        self.schema = self.repository.load_schema_by_formats(
-            input_format=input_format,
-            output_format=output_format,
+        return self.get_plan(
+            schema=self.repository.load_schema_by_formats(
+                input_format=input_format,
+                output_format=output_format,
+            ),
         )
 
+    def get_plan_by_file(self, file: BinaryIO) -> tuple[MappingPlan, bool]:
+        """Get the compiled plan of a mapping file.
+
+        :param file: A file-like object containing the mapping schema
+        :return: The compiled mapping plan, and True if the schema was loaded from the cache
+        """
+        schema, from_cache = self._load_schema_file(file=file)
+        return self.get_plan(schema=schema), from_cache
+
+    def warmup(self) -> int:
+        """Load and compile the mappings of all the supported formats.
+
+        A mapping failing to load is logged and skipped, to be loaded again on first use.
+
+        :return: The number of mappings loaded
+        """
+        loaded = 0
+        for output_mapping in CustomTraceFormatOutputMappingEnum:
+            # Aliases included, as formats can share a mapping file
+            for input_name in output_mapping.value.__members__:
+                log_context = {
+                    "input_format": input_name,
+                    "output_format": output_mapping.name,
+                }
+                try:
+                    self.get_plan_by_formats(
+                        input_format=CustomTraceFormatStrEnum[input_name],
+                        output_format=CustomTraceFormatStrEnum[output_mapping.name],
+                    )
+                except Exception as e:
+                    self.logger.exception("Mapping warmup failed", e, log_context)
+                    continue
+                loaded += 1
+        self.logger.info("Mappings warmed up", {"mappings": loaded})
+        return loaded
+
+    def _load_schema_file(self, file: BinaryIO) -> tuple[MappingSchema, bool]:
+        """Load a mapping schema from a file, using the mapping file cache.
+
+        Schemas are cached by the hash of the file content:
+        a file already loaded is neither parsed nor validated again.
+
+        :param file: A file-like object containing the mapping schema
+        :return: The mapping schema, and True if it was loaded from the cache
+        """
+        contents = file.read()
+        content_hash = MAPPING_FILE_CACHE.get_content_hash(contents=contents)
+
+        schema = MAPPING_FILE_CACHE.get(content_hash=content_hash)
+        from_cache = schema is not None
+        if schema is None:
+            schema = self.repository.load_schema_by_file(
+                mapping_file=BytesIO(contents),
+            )
+            MAPPING_FILE_CACHE.set(
+                content_hash=content_hash,
+                schema=schema,
+                size=len(contents),
+            )
+
+        self.logger.debug(
+            "Mapping file loaded",
+            {"content_hash": content_hash, "from_cache": from_cache},
+        )
+        return schema, from_cache
+
     def convert(
         self,
-        input_trace: Trace,
+        input_trace: Trace | TraceRecord,
         output_format: CustomTraceFormatStrEnum,
+        plan: MappingPlan,
     ) -> Trace:
         """Convert an input trace to the specified output format.
 
         :param input_trace: The input trace to be converted
         :param output_format: The desired output format
+        :param plan: The compiled mapping plan to apply, from a get_plan method
         :return: The converted trace
         """
-        if not self.schema:
-            raise MapperError("Mapping schema not loaded")
-
-        engine = MappingEngine(
-            logger=self.logger,
-            evaluator=self.expression_evaluator,
-        )
-        return engine.run(
+        return self.engine.run(
             input_trace=input_trace,
-            mapping_to_apply=self.schema,
+            mapping_to_apply=plan,
             output_format=output_format,
         )
@@ -0,0 +1,209 @@
+from functools import partial
+
+from app.common.utils.utils_dict import split_flat_key
+from app.infrastructure.logging.contract import LoggerContract
+
+from .evaluator.contract import ExpressionEvaluatorContract
+from .models.mapping_models import (
+    ConditionPlan,
+    FinalOutputPlan,
+    MainMappingPlan,
+    MappingPlan,
+    OutputKind,
+    OutputPlan,
+    SplitOutputKey,
+    TransformationPlan,
+)
+from .models.mapping_schema import (
+    ConditionOutputMappingModel,
+    MainMappingModel,
+    MappingSchema,
+    OutputMappingModel,
+)
+
+DEFAULT_CONDITION = "default"
+
+
+class MappingCompiler:
+    """Compiles a MappingSchema into an immutable MappingPlan.
+
+    Everything that does not depend on the trace is resolved once here:
+    flat keys are split, lambdas are compiled and static values are precomputed.
+    """
+
+    def __init__(
+        self,
+        evaluator: ExpressionEvaluatorContract,
+        logger: LoggerContract,
+    ) -> None:
+        """Initialize the MappingCompiler.
+
+        :param evaluator: ExpressionEvaluatorContract implementation for Python expressions evaluation
+        :param logger: LoggerContract implementation for logging
+        """
+        self.evaluator = evaluator
+        self.logger = logger
+
+    def compile(self, mapping_schema: MappingSchema) -> MappingPlan:
+        """Compile a mapping schema.
+
+        :param mapping_schema: The mapping schema to compile
+        :return: The executable mapping plan
+        :raises ExpressionEvaluationError: If a lambda of the schema can't be compiled
+        """
+        plan = MappingPlan(
+            schema=mapping_schema,
+            mappings=tuple(
+                self._compile_mapping(mapping=mapping)
+                for mapping in mapping_schema.mappings
+            ),
+            default_values=tuple(
+                self._compile_output(output_model=default_value)
+                for default_value in mapping_schema.default_values
+            ),
+        )
+        self.logger.debug(
+            "Mapping plan compiled",
+            {
+                "input_format": mapping_schema.input_format,
+                "output_format": mapping_schema.output_format,
+            },
+        )
+        return plan
+
+    def _compile_mapping(self, mapping: MainMappingModel) -> MainMappingPlan:
+        """Compile a main mapping.
+
+        :param mapping: The main mapping model
+        :return: The compiled main mapping
+        """
+        return MainMappingPlan(
+            input_keys=tuple(
+                tuple(input_field.split(".")) for input_field in mapping.input_fields
+            ),
+            output=self._compile_output(output_model=mapping.output_fields),
+        )
+
+    def _compile_output(self, output_model: OutputMappingModel) -> OutputPlan:
+        """Compile an output mapping, following the same precedence as its execution.
+
+        :param output_model: The output mapping model
+        :return: The compiled output
+        """
+        output_key = self._split_output_field(output_field=output_model.output_field)
+
+        if output_model.switch:
+            return OutputPlan(
+                kind=OutputKind.SWITCH,
+                output_key=output_key,
+                profile=output_model.profile,
+                switch=tuple(
+                    self._compile_condition(condition=condition)
+                    for condition in output_model.switch
+                ),
+            )
+
+        if output_model.multiple:
+            multiple = tuple(
+                self._compile_output(output_model=sub_output)
+                for sub_output in output_model.multiple
+            )
+            static_outputs = None
+            if not output_model.profile and all(
+                sub_plan.static_outputs is not None for sub_plan in multiple
+            ):
+                static_outputs = tuple(
+                    output
+                    for sub_plan in multiple
+                    for output in sub_plan.static_outputs
+                )
+            return OutputPlan(
+                kind=OutputKind.MULTIPLE,
+                output_key=output_key,
+                profile=output_model.profile,
+                multiple=multiple,
+                static_outputs=static_outputs,
+            )
+
+        if output_model.value:
+            return OutputPlan(
+                kind=OutputKind.VALUE,
+                output_key=output_key,
+                profile=output_model.profile,
+                value=output_model.value,
+                static_outputs=(
+                    None
+                    if output_model.profile
+                    else (
+                        FinalOutputPlan(
+                            output_key=output_key,
+                            value=output_model.value,
+                        ),
+                    )
+                ),
+            )
+
+        if output_model.custom:
+            return OutputPlan(
+                kind=OutputKind.CUSTOM,
+                output_key=output_key,
+                profile=output_model.profile,
+                custom=tuple(
+                    self._compile_transformation(custom_code=custom_code)
+                    for custom_code in output_model.custom
+                ),
+            )
+
+        return OutputPlan(
+            kind=OutputKind.ARGUMENT,
+            output_key=output_key,
+            profile=output_model.profile,
+        )
+
+    def _compile_condition(
+        self,
+        condition: ConditionOutputMappingModel,
+    ) -> ConditionPlan:
+        """Compile a switch condition.
+
+        :param condition: The condition output mapping model
+        :return: The compiled condition
+        """
+        predicate = None
+        if str(condition.condition).lower().strip() != DEFAULT_CONDITION:
+            predicate = self.evaluator.compile_lambda(lambda_expr=condition.condition)
+
+        return ConditionPlan(
+            predicate=predicate,
+            output=self._compile_output(output_model=condition),
+        )
+
+    def _compile_transformation(self, custom_code: str) -> TransformationPlan:
+        """Compile a custom transformation.
+
+        Lambdas are compiled once. Other expressions don't use the input arguments
+        and are evaluated on each run, as their result may change.
+
+        :param custom_code: The custom transformation code
+        :return: The compiled transformation
+        """
+        if custom_code.startswith("lambda"):
+            return TransformationPlan(
+                function=self.evaluator.compile_lambda(lambda_expr=custom_code),
+                unpack_arguments=True,
+            )
+        return TransformationPlan(
+            function=partial(self.evaluator.eval_expression, expression=custom_code),
+            unpack_arguments=False,
+        )
+
+    @staticmethod
+    def _split_output_field(output_field: str | None) -> SplitOutputKey | None:
+        """Split an output field once, None if there is nothing to set.
+
+        :param output_field: The output field
+        :return: The split output field
+        """
+        if not output_field:
+            return None
+        return split_flat_key(flat_key=output_field)
@@ -1,29 +1,48 @@
 from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 from app.common.common_types import JsonType
+from app.common.exceptions import InvalidTraceError
 from app.common.extensions.enums import CustomTraceFormatStrEnum
-from app.common.models.trace import Trace
+from app.common.models.trace import Trace, TraceRecord
 from app.common.utils.utils_dict import (
-    get_value_from_flat_key,
+    copy_nested,
+    get_value_from_split_key,
     remove_empty_elements,
-    set_value_from_flat_key,
+    set_value_from_split_key,
 )
 from app.infrastructure.logging.contract import LoggerContract
 
 from .evaluator.contract import ExpressionEvaluatorContract
-from .models.mapping_models import FinalMappingModel
-from .models.mapping_schema import (
-    ConditionOutputMappingModel,
-    MappingSchema,
-    OutputMappingModel,
+from .models.mapping_models import (
+    ConditionPlan,
+    FinalOutputPlan,
+    MappingPlan,
+    OutputKind,
+    OutputPlan,
+    TransformationPlan,
 )
 
-DEFAULT_CONDITION = "default"
+
+@dataclass(slots=True)
+class MappingContext:
+    """The state of a single run of the mapping engine.
+
+    :param log_context: The context of the run logs
+    :param profile: The DASES profile found in the mapping, if any
+    """
+
+    log_context: dict[str, str] = field(default_factory=dict)
+    profile: str | None = None
 
 
 class MappingEngine:
-    """Handles mapping from an input format to an output format using a config model."""
+    """Handles mapping from an input format to an output format using a config model.
+
+    The engine is stateless: the state of each run is kept in a MappingContext,
+    so that a single engine can run concurrently from several threads.
+    """
 
     def __init__(
         self,
@@ -37,56 +56,61 @@ class MappingEngine:
         """
         self.evaluator = evaluator
         self.logger = logger
-        self.log_context: dict[str, str] = {}
-        self.profile: str | None = None
 
     def run(
         self,
-        input_trace: Trace,
-        mapping_to_apply: MappingSchema,
+        input_trace: Trace | TraceRecord,
+        mapping_to_apply: MappingPlan,
         output_format: CustomTraceFormatStrEnum,
     ) -> Trace:
         """Main function : run the mapping process on the input trace.
 
         :param input_trace: The input trace to map
-        :param mapping_to_apply: The mapping configuration to apply
+        :param mapping_to_apply: The compiled mapping plan to apply
         :param output_format: The desired output format
         :return: The mapped output trace
         """
-        self.log_context = {
-            "input_format": input_trace.format.name,
-            "output_format": output_format.name,
-        }
+        context = MappingContext(
+            log_context={
+                "input_format": input_trace.format.name,
+                "output_format": output_format.name,
+            },
+        )
 
         mapped_data = self._apply_mapping(
             input_trace=input_trace,
-            mapping_schema=mapping_to_apply,
+            mapping_plan=mapping_to_apply,
             output_format=output_format,
+            context=context,
         )
         output_data = self._post_process(
             mapped_data=mapped_data,
-            mapping_schema=mapping_to_apply,
+            mapping_plan=mapping_to_apply,
+            context=context,
         )
         output_trace = self._create_output_trace(
             output_data=output_data,
             output_format=output_format,
+            context=context,
         )
 
-        self.logger.info("Mapping done", self.log_context)
+        self.logger.info("Mapping done", context.log_context)
 
         return output_trace
 
     def _apply_mapping(
         self,
-        input_trace: Trace,
-        mapping_schema: MappingSchema,
+        input_trace: Trace | TraceRecord,
+        mapping_plan: MappingPlan,
         output_format: CustomTraceFormatStrEnum,
+        context: MappingContext,
     ) -> JsonType:
         """Apply the mapping to the input trace.
 
         :param input_trace: The prepared input trace
-        :param mapping_schema: The mapping schema to apply
+        :param mapping_plan: The mapping plan to apply
         :param output_format: The desired output format
+        :param context: The state of the run
         :return: The mapped output trace
         """
         input_data = input_trace.data
@@ -94,15 +118,16 @@ class MappingEngine:
         # We start from the input trace if the formats are the same
         output_data = input_data if input_trace.format == output_format else {}
 
-        for mapping in mapping_schema.mappings:
-            input_values = []
-            for input_field in mapping.input_fields:
-                value = get_value_from_flat_key(input_data, input_field)
-                input_values.append(value)
+        for mapping in mapping_plan.mappings:
+            input_values = [
+                get_value_from_split_key(input_data, input_key)
+                for input_key in mapping.input_keys
+            ]
             output_data = self._build_trace_with_output(
-                output_content=mapping.output_fields,
+                output_content=mapping.output,
                 output_data=output_data,
                 overwrite=True,
+                context=context,
                 arguments=input_values,
             )
         return output_data
@@ -110,37 +135,43 @@ class MappingEngine:
     def _post_process(
         self,
         mapped_data: JsonType,
-        mapping_schema: MappingSchema,
+        mapping_plan: MappingPlan,
+        context: MappingContext,
     ) -> JsonType:
         """Apply post-processing to the mapped data.
 
         :param mapped_data: The mapped data to post-process
-        :param mapping_schema: The mapping schema to apply
+        :param mapping_plan: The mapping plan to apply
+        :param context: The state of the run
         :return: The post-processed data
         """
         output_data = remove_empty_elements(dictionary=mapped_data)
         return self._apply_default_values(
             output_data=output_data,
-            mapping_schema=mapping_schema,
+            mapping_plan=mapping_plan,
+            context=context,
         )
 
     def _apply_default_values(
         self,
         output_data: JsonType,
-        mapping_schema: MappingSchema,
+        mapping_plan: MappingPlan,
+        context: MappingContext,
     ) -> JsonType:
         """Apply default values to the output data.
 
         :param output_data: The output trace to apply default values to
-        :param mapping_schema: The mapping schema to apply
+        :param mapping_plan: The mapping plan to apply
+        :param context: The state of the run
         :return: The output data with default values applied
         """
-        self.logger.debug("Apply mapping default values", self.log_context)
-        for default_value in mapping_schema.default_values:
+        self.logger.debug("Apply mapping default values", context.log_context)
+        for default_value in mapping_plan.default_values:
             output_data = self._build_trace_with_output(
                 output_content=default_value,
                 output_data=output_data,
                 overwrite=False,
+                context=context,
             )
         return output_data
 
@@ -148,149 +179,174 @@ class MappingEngine:
         self,
         output_data: JsonType,
         output_format: CustomTraceFormatStrEnum,
+        context: MappingContext,
     ) -> Trace:
         """Create the final output trace.
 
+        The output data is validated once against the output format,
+        and the trace carries the validated model.
+
         :param output_data: The output data to create the trace from
         :param output_format: The desired output format
+        :param context: The state of the run
         :return: The final output trace
+        :raises InvalidTraceError: If the output data is empty or invalid for the format
         """
-        self.logger.debug("Create output trace", self.log_context)
+        self.logger.debug("Create output trace", context.log_context)
 
-        return Trace(
+        if not output_data:
+            raise InvalidTraceError("Trace data is required")
+        return Trace.from_validated_model(
             data=output_data,
-            format=output_format,
-            profile=self.profile,
+            trace_format=output_format,
+            model=Trace.get_format_model_instance(
+                trace_data=output_data,
+                trace_format=output_format,
+            ),
+            profile=context.profile,
         )
 
     def _build_trace_with_output(
         self,
-        output_content: OutputMappingModel,
+        output_content: OutputPlan,
         output_data: Mapping[str, Any],
         overwrite: bool,
+        context: MappingContext,
         arguments: Sequence[Any] | None = None,
     ) -> dict[str, Any]:
         """Build the output trace based on the output content.
 
-        :param output_content: The output mapping model
+        :param output_content: The compiled output mapping
         :param output_data: The current output trace
         :param overwrite: Whether to overwrite existing values
+        :param context: The state of the run
         :param arguments: Input arguments
         :return: The updated output trace
         """
         if not arguments:
             arguments = []
-        outputs = self._handle_output(output_model=output_content, arguments=arguments)
+        outputs = self._handle_output(
+            output_plan=output_content,
+            arguments=arguments,
+            context=context,
+        )
         for output in outputs:
-            if output.output_field:
-                output_data = set_value_from_flat_key(
+            if output.output_key is not None:
+                # The values of the plan are shared by all the runs, never by the traces
+                output_data = set_value_from_split_key(
                     dict_list_element=output_data,
-                    flat_key=output.output_field,
-                    value=output.value,
+                    split_key=output.output_key,
+                    value=copy_nested(output.value),
                     overwrite=overwrite,
                 )
         return output_data
 
     def _handle_output(
         self,
-        output_model: OutputMappingModel,
+        output_plan: OutputPlan,
         arguments: Sequence[Any],
-    ) -> list[FinalMappingModel]:
-        """Handle the output based on the OutputMappingModel.
+        context: MappingContext,
+    ) -> Sequence[FinalOutputPlan]:
+        """Handle the output based on the compiled output mapping.
 
-        :param output_model: The output mapping model
+        :param output_plan: The compiled output mapping
         :param arguments: Input arguments
-        :return: List of FinalMappingModel instances
+        :param context: The state of the run, keeping the profile found
+        :return: List of FinalOutputPlan instances
         """
-        if output_model.profile:
-            self.log_context = {**self.log_context, "profile": output_model.profile}
-            if self.profile is not None:
-                self.logger.warning("A profile already exists", self.log_context)
-            self.profile = output_model.profile
-            self.logger.info("Profile found", self.log_context)
-
-        if output_model.switch:
-            return self._apply_switch_transformation(
-                switch_value=output_model.switch,
-                arguments=arguments,
-            )
-
-        if output_model.multiple:
-            results = []
-            for sub_output in output_model.multiple:
-                sub_results = self._handle_output(
-                    output_model=sub_output,
+        if output_plan.static_outputs is not None:
+            return output_plan.static_outputs
+
+        if output_plan.profile:
+            context.log_context = {
+                **context.log_context,
+                "profile": output_plan.profile,
+            }
+            if context.profile is not None:
+                self.logger.warning("A profile already exists", context.log_context)
+            context.profile = output_plan.profile
+            self.logger.info("Profile found", context.log_context)
+
+        match output_plan.kind:
+            case OutputKind.SWITCH:
+                return self._apply_switch_transformation(
+                    switch_value=output_plan.switch,
+                    context=context,
                     arguments=arguments,
                 )
-                results.extend(sub_results)
-            return results
-
-        if output_model.value:
-            value = output_model.value
-        elif output_model.custom:
-            value = self._apply_custom_transformation(
-                custom_input=output_model.custom,
-                arguments=arguments,
-            )
-        else:
-            value = arguments[0] if arguments else None
+            case OutputKind.MULTIPLE:
+                results = []
+                for sub_output in output_plan.multiple:
+                    sub_results = self._handle_output(
+                        output_plan=sub_output,
+                        arguments=arguments,
+                        context=context,
+                    )
+                    results.extend(sub_results)
+                return results
+            case OutputKind.VALUE:
+                value = output_plan.value
+            case OutputKind.CUSTOM:
+                value = self._apply_custom_transformation(
+                    custom_input=output_plan.custom,
+                    arguments=arguments,
+                )
+            case _:
+                value = arguments[0] if arguments else None
 
-        return [FinalMappingModel(output_field=output_model.output_field, value=value)]
+        return [FinalOutputPlan(output_key=output_plan.output_key, value=value)]
 
+    @staticmethod
     def _apply_custom_transformation(
-        self,
-        custom_input: Iterable[str],
+        custom_input: Iterable[TransformationPlan],
         arguments: Sequence[Any],
     ) -> Any:
         """Apply a series of custom transformations to the input arguments.
 
-        :param custom_input: Iterable of custom transformation strings
+        :param custom_input: Iterable of compiled custom transformations
         :param arguments: Input arguments for the transformations
         :return: The result of applying all transformations
-        :raises CodeEvaluationError: If there's an error in the custom transformation
+        :raises ExpressionEvaluationError: If there's an error in the custom transformation
         """
         result = arguments
-        for custom_code in custom_input:
-            if custom_code.startswith("lambda"):
-                # Use the evaluator for lambda expressions
-                result = self.evaluator.eval_lambda(custom_code, *result)
+        for transformation in custom_input:
+            if transformation.unpack_arguments:
+                # Lambda expressions take the previous result as arguments
+                result = transformation.function(*result)
             else:
-                # Use the evaluator for regular expressions
-                result = self.evaluator.eval_expression(expression=custom_code)
+                # Regular expressions don't take any argument
+                result = transformation.function()
         return result
 
     def _apply_switch_transformation(
         self,
-        switch_value: Iterable[ConditionOutputMappingModel],
+        switch_value: Iterable[ConditionPlan],
+        context: MappingContext,
         arguments: Sequence[Any] | None = None,
-    ) -> list[FinalMappingModel]:
+    ) -> list[FinalOutputPlan]:
         """Apply a switch transformation based on conditions.
 
-        :param switch_value: Iterable of condition-based output mappings
+        :param switch_value: Iterable of compiled conditions
+        :param context: The state of the run
         :param arguments: Input arguments for the conditions
-        :return: List of FinalMappingModel instances
-        :raises CodeEvaluationError: If there's an error in the lambda condition
+        :return: List of FinalOutputPlan instances
+        :raises ExpressionEvaluationError: If there's an error in the lambda condition
         """
         if not arguments:
             arguments = []
         list_response = []
 
         for condition in switch_value:
-            if str(condition.condition).lower().strip() == DEFAULT_CONDITION:
-                list_response.extend(
-                    self._handle_output(output_model=condition, arguments=arguments),
-                )
-                return list_response
-
-            condition_result = self.evaluator.eval_lambda(
-                condition.condition,
-                *arguments,
-            )
-            if condition_result:
+            # A condition without predicate is the default one
+            if condition.predicate is None or condition.predicate(*arguments):
                 list_response.extend(
-                    self._handle_output(output_model=condition, arguments=arguments),
+                    self._handle_output(
+                        output_plan=condition.output,
+                        arguments=arguments,
+                        context=context,
+                    ),
                 )
                 return list_response
 
-        list_response.append(FinalMappingModel(output_field=None, value=None))
+        list_response.append(FinalOutputPlan(output_key=None, value=None))
         return list_response
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+
+from .models.mapping_schema import MappingSchema
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class MappingFileCache:
+    """Thread-safe LRU cache of mapping schemas, keyed by the hash of their file content.
+
+    The memory used by the cache is capped with the size of the cached mapping files,
+    which is used as an estimation of the size of their schema.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the MappingFileCache.
+
+        :param max_entries: Maximum number of schemas kept in the cache
+        :param max_bytes: Maximum total size of the mapping files of the cached schemas
+        """
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("Cache limits must be positive integers")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[MappingSchema, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def get_content_hash(contents: bytes) -> str:
+        """Get the hash identifying the content of a mapping file.
+
+        :param contents: The content of the mapping file
+        :return: The hexadecimal SHA-256 digest of the content
+        """
+        return sha256(contents).hexdigest()
+
+    def get(self, content_hash: str) -> MappingSchema | None:
+        """Get a cached schema and mark it as recently used.
+
+        :param content_hash: The hash of the mapping file content
+        :return: The cached schema, or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is None:
+                return None
+            self._entries.move_to_end(content_hash)
+            return entry[0]
+
+    def set(self, content_hash: str, schema: MappingSchema, size: int) -> None:
+        """Cache a schema, evicting the least recently used ones if needed.
+
+        A schema bigger than the whole cache is not cached.
+
+        :param content_hash: The hash of the mapping file content
+        :param schema: The validated mapping schema
+        :param size: The size of the mapping file, in bytes
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(content_hash, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+
+            self._entries[content_hash] = (schema, size)
+            self._total_bytes += size
+
+            while (
+                len(self._entries) > self.max_entries
+                or self._total_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Remove all the cached schemas."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
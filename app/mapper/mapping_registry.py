@@ -0,0 +1,148 @@
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+from os import PathLike
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO
+from uuid import uuid4
+
+from app.infrastructure.logging.contract import LoggerContract
+
+from .exceptions import MappingNotFoundError
+from .mapping_file_cache import MappingFileCache
+from .models.mapping_schema import MappingSchema
+from .repositories.contracts.repository import MappingRepository
+
+DEFAULT_MAX_ENTRIES = 256
+MAPPING_FILE_SUFFIX = ".yml"
+MAPPING_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+@dataclass(frozen=True)
+class RegisteredMapping:
+    """A mapping registered on the server.
+
+    :param mapping_id: The identifier to reference the mapping with
+    :param version: The hash of the mapping file content
+    :param schema: The validated mapping schema
+    """
+
+    mapping_id: str
+    version: str
+    schema: MappingSchema
+
+
+class MappingRegistry:
+    """Registry of the mappings uploaded once and referenced by id for conversions.
+
+    Registered mapping files are immutable and stored in a directory shared by all the workers.
+    Each worker keeps the most recently used schemas in memory, and loads the other ones
+    from the directory on demand.
+    """
+
+    def __init__(
+        self,
+        repository: MappingRepository,
+        base_path: str | PathLike[str],
+        logger: LoggerContract,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the MappingRegistry.
+
+        :param repository: The repository used to load and validate the mapping files
+        :param base_path: The directory where the registered mapping files are stored
+        :param logger: LoggerContract implementation for logging
+        :param max_entries: Maximum number of schemas kept in memory
+        """
+        if max_entries <= 0:
+            raise ValueError("Registry max_entries must be a positive integer")
+
+        self.repository = repository
+        self.base_path = Path(base_path)
+        self.logger = logger
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, RegisteredMapping] = OrderedDict()
+        self._lock = Lock()
+
+    def register(self, mapping_file: BinaryIO) -> RegisteredMapping:
+        """Validate and register a mapping file.
+
+        :param mapping_file: A file-like object containing the mapping schema
+        :return: The registered mapping, with its new identifier
+        :raises MappingConfigToModelError: If the mapping file is invalid
+        """
+        contents = mapping_file.read()
+        schema = self.repository.load_schema_by_file(mapping_file=BytesIO(contents))
+
+        registered = RegisteredMapping(
+            mapping_id=uuid4().hex,
+            version=MappingFileCache.get_content_hash(contents=contents),
+            schema=schema,
+        )
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self._get_mapping_path(mapping_id=registered.mapping_id).write_bytes(contents)
+        self._store(registered=registered)
+
+        self.logger.info(
+            "Mapping registered",
+            {"mapping_id": registered.mapping_id, "version": registered.version},
+        )
+        return registered
+
+    def get(self, mapping_id: str) -> RegisteredMapping:
+        """Get a registered mapping, loading it from the registry directory if needed.
+
+        :param mapping_id: The identifier of the mapping
+        :return: The registered mapping
+        :raises MappingNotFoundError: If no mapping is registered with this identifier
+        :raises MappingConfigToModelError: If the stored mapping file is invalid
+        """
+        with self._lock:
+            registered = self._entries.get(mapping_id)
+            if registered is not None:
+                self._entries.move_to_end(mapping_id)
+                return registered
+
+        if not MAPPING_ID_PATTERN.match(mapping_id):
+            raise MappingNotFoundError(f"Mapping {mapping_id} not found")
+
+        try:
+            contents = self._get_mapping_path(mapping_id=mapping_id).read_bytes()
+        except FileNotFoundError as e:
+            raise MappingNotFoundError(f"Mapping {mapping_id} not found") from e
+
+        registered = RegisteredMapping(
+            mapping_id=mapping_id,
+            version=MappingFileCache.get_content_hash(contents=contents),
+            schema=self.repository.load_schema_by_file(
+                mapping_file=BytesIO(contents),
+            ),
+        )
+        self._store(registered=registered)
+
+        self.logger.debug(
+            "Registered mapping loaded",
+            {"mapping_id": mapping_id, "version": registered.version},
+        )
+        return registered
+
+    def _store(self, registered: RegisteredMapping) -> None:
+        """Keep a registered mapping in memory, evicting the least recently used ones.
+
+        :param registered: The registered mapping
+        """
+        with self._lock:
+            self._entries[registered.mapping_id] = registered
+            self._entries.move_to_end(registered.mapping_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_mapping_path(self, mapping_id: str) -> Path:
+        """Get the path of a registered mapping file.
+
+        :param mapping_id: The identifier of the mapping
+        :return: The path of the mapping file
+        """
+        return self.base_path.joinpath(mapping_id).with_suffix(MAPPING_FILE_SUFFIX)
@@ -1,8 +1,105 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum, auto
 from typing import Any
 
-from pydantic import BaseModel
+from .mapping_schema import MappingSchema
 
+# Flatten key split with split_flat_key, e.g. (("context", None), ("extensions", "iri"))
+type SplitOutputKey = tuple[tuple[str, str | None], ...]
 
-class FinalMappingModel(BaseModel):
-    output_field: str | None
+
+class OutputKind(StrEnum):
+    """How the value of an output mapping is computed."""
+
+    SWITCH = auto()
+    MULTIPLE = auto()
+    VALUE = auto()
+    CUSTOM = auto()
+    ARGUMENT = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class TransformationPlan:
+    """A pre-bound custom transformation.
+
+    :param function: The compiled lambda or expression
+    :param unpack_arguments: Whether the previous result is unpacked as arguments (lambdas)
+    """
+
+    function: Callable[..., Any]
+    unpack_arguments: bool
+
+
+@dataclass(frozen=True, slots=True)
+class FinalOutputPlan:
+    """A resolved output: the value to set at an output field.
+
+    :param output_key: The split output field, None if nothing must be set
+    :param value: The value to set
+    """
+
+    output_key: SplitOutputKey | None
     value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class OutputPlan:
+    """Executable form of an OutputMappingModel.
+
+    :param kind: How the value of the output is computed
+    :param output_key: The split output field, None if nothing must be set
+    :param profile: The DASES profile to apply, if any
+    :param value: The static value (VALUE kind)
+    :param custom: The pre-bound transformations (CUSTOM kind)
+    :param switch: The conditional outputs (SWITCH kind)
+    :param multiple: The sub outputs (MULTIPLE kind)
+    :param static_outputs: The precomputed outputs if they do not depend on the trace
+    """
+
+    kind: OutputKind
+    output_key: SplitOutputKey | None
+    profile: str | None = None
+    value: Any = None
+    custom: tuple[TransformationPlan, ...] = ()
+    switch: tuple["ConditionPlan", ...] = ()
+    multiple: tuple["OutputPlan", ...] = ()
+    static_outputs: tuple[FinalOutputPlan, ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionPlan:
+    """Executable form of a ConditionOutputMappingModel.
+
+    :param predicate: The compiled condition lambda, None for the default condition
+    :param output: The output to apply when the condition is met
+    """
+
+    predicate: Callable[..., Any] | None
+    output: OutputPlan
+
+
+@dataclass(frozen=True, slots=True)
+class MainMappingPlan:
+    """Executable form of a MainMappingModel.
+
+    :param input_keys: The input fields, split on dots
+    :param output: The output to apply on the input values
+    """
+
+    input_keys: tuple[tuple[str, ...], ...]
+    output: OutputPlan
+
+
+@dataclass(frozen=True, slots=True)
+class MappingPlan:
+    """Executable form of a MappingSchema, built once and run for every trace.
+
+    :param schema: The compiled mapping schema
+    :param mappings: The compiled mappings
+    :param default_values: The compiled default values
+    """
+
+    schema: MappingSchema
+    mappings: tuple[MainMappingPlan, ...]
+    default_values: tuple[OutputPlan, ...]
@@ -0,0 +1,263 @@
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import cache
+from itertools import batched
+from json import dumps
+from multiprocessing import get_context
+from threading import Lock
+from uuid import uuid4
+
+from app.common.common_types import JsonType
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import TraceRecord
+from app.infrastructure.logging.contract import LoggerContract
+from app.infrastructure.logging.jsonlogger import JsonLogger
+from app.infrastructure.logging.types import LogLevel
+from app.parsers.jsonencoder import CustomJSONEncoder
+
+from .evaluator.eval import EvalExpressionEvaluator
+from .exceptions import SchemaNotCachedError
+from .mapper import Mapper
+from .models.mapping_models import MappingPlan
+from .models.mapping_schema import MappingSchema
+from .repositories.yaml.yaml_repository import YamlMappingRepository
+
+DEFAULT_CHUNK_SIZE = 1000
+# Maximum number of compiled plans kept in memory by a worker process
+MAX_WORKER_PLANS = 16
+# Maximum number of schema keys kept in memory by a converter
+MAX_SCHEMA_KEYS = 64
+
+# The format and data of the traces of a chunk
+type Chunk = tuple[tuple[str, JsonType], ...]
+
+# The compiled plans of a worker process, by key of their schema
+_worker_plans: OrderedDict[str, MappingPlan] = OrderedDict()
+
+
+class ParallelConverter:
+    """Converts traces in a pool of worker processes, keeping their order.
+
+    The traces are sent to the workers in chunks, with the key of the schema
+    to convert them with. The schema itself is only sent with the first chunks
+    of a new schema, and again with the chunks of the workers which miss it.
+    Each worker compiles a schema once, and gives back the chunk as NDJSON lines.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        logger: LoggerContract,
+        log_level: LogLevel,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the ParallelConverter and start its pool of processes.
+
+        :param processes: The number of worker processes
+        :param logger: LoggerContract implementation for logging
+        :param log_level: The log level of the worker processes
+        :param chunk_size: The number of traces sent at once to a worker
+        """
+        if processes <= 0 or chunk_size <= 0:
+            raise ValueError("Processes and chunk size must be positive integers")
+
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.logger = logger
+        self.log_level = log_level
+        # Spawned, as forking a multithreaded server process is unsafe
+        self.executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=get_context("spawn"),
+        )
+        # The keys of the schemas, by identity of the schema
+        self._schema_keys: OrderedDict[int, tuple[MappingSchema, str]] = OrderedDict()
+        self._schema_keys_lock = Lock()
+
+    def convert(
+        self,
+        traces: Iterable[TraceRecord],
+        schema: MappingSchema,
+        output_format: CustomTraceFormatStrEnum,
+    ) -> Iterator[str]:
+        """Convert traces with a mapping schema, in the pool of processes.
+
+        At most two chunks per process are converted ahead of the consumer,
+        and the chunks not converted yet are cancelled if it stops.
+
+        :param traces: The traces to convert
+        :param schema: The mapping schema to convert the traces with
+        :param output_format: The desired output format
+        :return: The NDJSON lines of the converted traces, by chunk, in their order
+        :raises ExpressionEvaluationError: If a trace fails to be converted
+        """
+        schema_key, is_new = self._get_schema_key(schema=schema)
+        log_context = {"schema_key": schema_key, "processes": self.processes}
+        self.logger.info("Parallel conversion start", log_context)
+
+        pending: deque[tuple[Chunk, Future[str]]] = deque()
+        try:
+            # The formats are sent by value, not being picklable as created dynamically
+            items = ((trace.format.value, trace.data) for trace in traces)
+            for index, chunk in enumerate(batched(items, self.chunk_size)):
+                # A new schema is sent with the first chunks, to reach every worker
+                sent_schema = schema if is_new and index < 2 * self.processes else None
+                future = self._submit(
+                    schema_key=schema_key,
+                    schema=sent_schema,
+                    output_format=output_format,
+                    chunk=chunk,
+                )
+                pending.append((chunk, future))
+                if len(pending) >= 2 * self.processes:
+                    yield self._get_result(
+                        schema_key=schema_key,
+                        schema=schema,
+                        output_format=output_format,
+                        item=pending.popleft(),
+                    )
+            while pending:
+                yield self._get_result(
+                    schema_key=schema_key,
+                    schema=schema,
+                    output_format=output_format,
+                    item=pending.popleft(),
+                )
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+        self.logger.info("Parallel conversion end", log_context)
+
+    def _get_schema_key(self, schema: MappingSchema) -> tuple[str, bool]:
+        """Get the key of a mapping schema, created on first use.
+
+        :param schema: The mapping schema
+        :return: The key of the schema, and whether it was just created
+        """
+        with self._schema_keys_lock:
+            entry = self._schema_keys.get(id(schema))
+            if entry is not None and entry[0] is schema:
+                self._schema_keys.move_to_end(id(schema))
+                return entry[1], False
+
+            schema_key = uuid4().hex
+            self._schema_keys[id(schema)] = (schema, schema_key)
+            while len(self._schema_keys) > MAX_SCHEMA_KEYS:
+                self._schema_keys.popitem(last=False)
+            return schema_key, True
+
+    def _submit(
+        self,
+        schema_key: str,
+        schema: MappingSchema | None,
+        output_format: CustomTraceFormatStrEnum,
+        chunk: Chunk,
+    ) -> Future[str]:
+        """Submit a chunk of traces to the pool of processes.
+
+        :param schema_key: The key of the schema
+        :param schema: The mapping schema, None to only send its key
+        :param output_format: The desired output format
+        :param chunk: The format and data of the traces to convert
+        :return: The future NDJSON lines of the converted traces
+        """
+        return self.executor.submit(
+            convert_chunk,
+            schema_key,
+            schema,
+            output_format.value,
+            chunk,
+            self.log_level,
+        )
+
+    def _get_result(
+        self,
+        schema_key: str,
+        schema: MappingSchema,
+        output_format: CustomTraceFormatStrEnum,
+        item: tuple[Chunk, Future[str]],
+    ) -> str:
+        """Get a converted chunk, submitted again with its schema if a worker missed it.
+
+        :param schema_key: The key of the schema
+        :param schema: The mapping schema
+        :param output_format: The desired output format
+        :param item: The chunk of traces and its future result
+        :return: The NDJSON lines of the converted traces
+        """
+        chunk, future = item
+        try:
+            return future.result()
+        except SchemaNotCachedError:
+            self.logger.debug("Schema missing in a worker", {"schema_key": schema_key})
+            return self._submit(
+                schema_key=schema_key,
+                schema=schema,
+                output_format=output_format,
+                chunk=chunk,
+            ).result()
+
+    def shutdown(self) -> None:
+        """Stop the pool of processes, cancelling the chunks not converted yet."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+@cache
+def get_worker_mapper(log_level: LogLevel) -> Mapper:
+    """Get the mapper of the current worker process, created on first use.
+
+    :param log_level: The log level of the mapper
+    :return: The mapper of the worker process
+    """
+    logger = JsonLogger(name=__name__, level=log_level)
+    return Mapper(
+        repository=YamlMappingRepository(logger=logger),
+        expression_evaluator=EvalExpressionEvaluator(logger=logger),
+        logger=logger,
+    )
+
+
+def convert_chunk(
+    schema_key: str,
+    schema: MappingSchema | None,
+    output_format: str,
+    chunk: Iterable[tuple[str, JsonType]],
+    log_level: LogLevel,
+) -> str:
+    """Convert a chunk of traces in a worker process.
+
+    :param schema_key: The key of the schema, to compile it once per worker
+    :param schema: The mapping schema to convert the traces with,
+        None if the worker is expected to have compiled it already
+    :param output_format: The desired output format
+    :param chunk: The format and data of the traces to convert
+    :param log_level: The log level of the worker mapper
+    :return: The NDJSON lines of the converted traces
+    :raises SchemaNotCachedError: If the schema is neither compiled nor sent
+    """
+    mapper = get_worker_mapper(log_level=log_level)
+    plan = _worker_plans.get(schema_key)
+    if plan is None:
+        if schema is None:
+            raise SchemaNotCachedError(schema_key)
+        plan = mapper.get_plan(schema=schema)
+        _worker_plans[schema_key] = plan
+        while len(_worker_plans) > MAX_WORKER_PLANS:
+            _worker_plans.popitem(last=False)
+    _worker_plans.move_to_end(schema_key)
+
+    lines = []
+    output_trace_format = CustomTraceFormatStrEnum(output_format)
+    for trace_format, data in chunk:
+        output_trace = mapper.convert(
+            input_trace=TraceRecord(
+                data=data,
+                format=CustomTraceFormatStrEnum(trace_format),
+            ),
+            output_format=output_trace_format,
+            plan=plan,
+        )
+        lines.append(dumps(obj=output_trace.data, cls=CustomJSONEncoder) + "\n")
+    return "".join(lines)
@@ -1,5 +1,7 @@
+from dataclasses import dataclass
 from pathlib import Path
-from typing import BinaryIO
+from threading import Lock
+from typing import BinaryIO, ClassVar
 
 from yaml import safe_load
 
@@ -15,12 +17,31 @@ from app.mapper.models.mapping_schema import MappingSchema
 from app.mapper.repositories.contracts.repository import MappingRepository
 
 
+@dataclass(frozen=True)
+class CachedMappingSchema:
+    """A mapping schema loaded from a file, with the file stats it was loaded from.
+
+    :param mtime_ns: The modification time of the file, in nanoseconds
+    :param size: The size of the file, in bytes
+    :param schema: The validated mapping schema
+    """
+
+    mtime_ns: int
+    size: int
+    schema: MappingSchema
+
+
 class YamlMappingRepository(MappingRepository):
     """A concrete implementation of MappingRepository that uses YAML configuration files for mapping.
 
     This class handles the loading of mapping schemas from YAML files based on input and output formats.
+    Schemas loaded from the mapping files are cached for the whole process, and reloaded
+    when their file changes.
     """
 
+    schemas_cache: ClassVar[dict[Path, CachedMappingSchema]] = {}
+    schemas_cache_lock: ClassVar[Lock] = Lock()
+
     def __init__(self, logger: LoggerContract) -> None:
         """Initialize the YamlMappingRepository.
 
@@ -45,6 +66,32 @@ class YamlMappingRepository(MappingRepository):
             input_format=input_format,
             output_format=output_format,
         )
+        return self.load_schema_by_path(mapping_path=mapping_path)
+
+    def load_schema_by_path(self, mapping_path: Path) -> MappingSchema:
+        """Load a mapping schema from a YAML file path, using the process-wide cache.
+
+        The cached schema is used as long as the modification time and the size
+        of the file don't change. Otherwise, the file is loaded again and replaces it.
+
+        :param mapping_path: The path to the YAML mapping file
+        :return: The loaded mapping schema
+        :raises MappingConfigToModelException: If the configuration file is invalid or cannot be loaded
+        """
+        cache_key = mapping_path.absolute()
+        file_stat = mapping_path.stat()
+
+        cached = self.schemas_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached.mtime_ns == file_stat.st_mtime_ns
+            and cached.size == file_stat.st_size
+        ):
+            self.logger.debug(
+                "Mapping config loaded from cache",
+                {"path": mapping_path},
+            )
+            return cached.schema
 
         json_config = convert_yaml_file_to_json(yaml_path=mapping_path)
         self.logger.info("Mapping config loaded", {"path": mapping_path})
@@ -55,6 +102,12 @@ class YamlMappingRepository(MappingRepository):
             self.logger.exception("Mapping validation failed", e)
             raise
 
+        with self.schemas_cache_lock:
+            self.schemas_cache[cache_key] = CachedMappingSchema(
+                mtime_ns=file_stat.st_mtime_ns,
+                size=file_stat.st_size,
+                schema=mapping_model,
+            )
         return mapping_model
 
     def load_schema_by_file(self, mapping_file: BinaryIO) -> MappingSchema:
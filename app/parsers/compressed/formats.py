@@ -0,0 +1,150 @@
+import bz2
+import gzip
+import zlib
+from collections.abc import Iterator
+from io import SEEK_SET, BufferedReader, RawIOBase
+from pathlib import PurePosixPath
+from typing import BinaryIO, cast
+from zipfile import BadZipFile, ZipFile
+
+from app.parsers.exceptions import DecompressionError
+from app.parsers.types import CompressionEnum
+
+# Compressions of the files, from their MIME type
+COMPRESSION_MIME_TYPES: dict[str, CompressionEnum] = {
+    "application/gzip": CompressionEnum.GZIP,
+    "application/x-gzip": CompressionEnum.GZIP,
+    "application/x-bzip2": CompressionEnum.BZIP2,
+    "application/zip": CompressionEnum.ZIP,
+    "application/x-zip-compressed": CompressionEnum.ZIP,
+}
+# Compressions of the files, from the first bytes of their content
+COMPRESSION_MAGIC_BYTES: dict[bytes, CompressionEnum] = {
+    b"\x1f\x8b": CompressionEnum.GZIP,
+    # The bzip2 header ends with the block size, from 1 to 9
+    **{f"BZh{level}".encode(): CompressionEnum.BZIP2 for level in range(1, 10)},
+    b"PK\x03\x04": CompressionEnum.ZIP,
+}
+# Number of bytes read to detect the compression of a file
+MAGIC_BYTES_SIZE = max(len(magic_bytes) for magic_bytes in COMPRESSION_MAGIC_BYTES)
+# Errors raised when reading corrupted compressed data
+DECOMPRESSION_ERRORS = (OSError, EOFError, zlib.error, BadZipFile)
+
+
+class DecompressedReader(RawIOBase):
+    """Reader of a decompressed stream, raising a DecompressionError if the data is corrupted.
+
+    Only the errors of the decompression are translated,
+    not the ones raised by the consumers of the stream.
+    """
+
+    def __init__(self, stream: BinaryIO, compression: CompressionEnum) -> None:
+        """Initialize the DecompressedReader.
+
+        :param stream: The decompressed stream
+        :param compression: The compression of the stream
+        """
+        super().__init__()
+        self.stream = stream
+        self.compression = compression
+
+    def readable(self) -> bool:
+        """Inherited from RawIOBase.readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Inherited from RawIOBase.seekable."""
+        return self.stream.seekable()
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Inherited from RawIOBase.readinto.
+
+        :raises DecompressionError: If the compressed data is corrupted
+        """
+        try:
+            return self.stream.readinto(buffer)
+        except DECOMPRESSION_ERRORS as e:
+            msg = f"Unable to decompress {self.compression} file"
+            raise DecompressionError(msg) from e
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """Inherited from RawIOBase.seek, decompressing the stream again to go back.
+
+        :raises DecompressionError: If the compressed data is corrupted
+        """
+        try:
+            return self.stream.seek(offset, whence)
+        except DECOMPRESSION_ERRORS as e:
+            msg = f"Unable to decompress {self.compression} file"
+            raise DecompressionError(msg) from e
+
+    def tell(self) -> int:
+        """Inherited from RawIOBase.tell."""
+        return self.stream.tell()
+
+
+def detect_compression(file: BinaryIO, mime_type: str) -> CompressionEnum | None:
+    """Detect the compression of a file from its first bytes, or its MIME type.
+
+    :param file: The file, read from its current position
+    :param mime_type: The MIME type of the file
+    :return: The compression of the file, None if it is not compressed
+    """
+    position = file.tell()
+    header = file.read(MAGIC_BYTES_SIZE)
+    file.seek(position)
+
+    for magic_bytes, compression in COMPRESSION_MAGIC_BYTES.items():
+        if header.startswith(magic_bytes):
+            return compression
+    return COMPRESSION_MIME_TYPES.get(mime_type)
+
+
+def iter_members(
+    file: BinaryIO,
+    compression: CompressionEnum,
+    filename: str | None,
+) -> Iterator[tuple[str | None, BinaryIO]]:
+    """Iterate over the decompressed members of a compressed file.
+
+    The members are decompressed as they are read, never as a whole.
+    Reading a corrupted member raises a DecompressionError.
+
+    :param file: The compressed file
+    :param compression: The compression of the file
+    :param filename: The name of the compressed file, if known
+    :yield: The name and the decompressed stream of each member,
+        the name of a gzip or bzip2 member being the one of the file without its extension
+    """
+    if compression == CompressionEnum.ZIP:
+        with ZipFile(file) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as member:
+                    yield (
+                        info.filename,
+                        _open_reader(stream=member, compression=compression),
+                    )
+        return
+
+    name = PurePosixPath(filename).stem if filename else None
+    if compression == CompressionEnum.GZIP:
+        stream = gzip.GzipFile(fileobj=file, mode="rb")
+    else:
+        stream = bz2.BZ2File(file, mode="rb")
+    with stream:
+        yield name, _open_reader(stream=stream, compression=compression)
+
+
+def _open_reader(stream: BinaryIO, compression: CompressionEnum) -> BinaryIO:
+    """Open a buffered reader of a decompressed stream.
+
+    :param stream: The decompressed stream
+    :param compression: The compression of the stream
+    :return: The reader, raising a DecompressionError if the data is corrupted
+    """
+    return cast(
+        "BinaryIO",
+        BufferedReader(DecompressedReader(stream=stream, compression=compression)),
+    )
@@ -0,0 +1,139 @@
+from collections.abc import Generator, Mapping
+from concurrent.futures import Executor
+from contextlib import closing
+from pathlib import PurePosixPath
+from typing import BinaryIO
+
+from app.api.schemas import CustomConfigModel
+from app.common.models.trace import TraceRecord
+from app.infrastructure.logging.contract import LoggerContract
+from app.parsers.contracts.parser import Parser
+from app.parsers.exceptions import DecompressionError, ParserFactoryError
+
+from .formats import DECOMPRESSION_ERRORS, detect_compression, iter_members
+
+# MIME types of the decompressed members, from their extension
+EXTENSION_MIME_TYPES = {
+    ".csv": "text/csv",
+    ".json": "application/json",
+    ".ndjson": "application/x-ndjson",
+    ".jsonl": "application/x-ndjson",
+}
+# MIME type of the decompressed members whose type is not known otherwise
+DEFAULT_MIME_TYPE = "text/csv"
+
+
+class DecompressingParser(Parser):
+    """Parser decompressing the compressed files as streams, before parsing them.
+
+    A file is compressed if its first bytes or its MIME type say so.
+    Each member of a compressed file is parsed by the parser of its extension,
+    or else of the MIME type of the file, one member after the other.
+    A file which is not compressed is parsed by the parser of its MIME type.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        logger: LoggerContract,
+        parser_classes: Mapping[str, type[Parser]],
+        mime_type: str,
+        filename: str | None = None,
+        parsing_config: CustomConfigModel | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the DecompressingParser.
+
+        :param logger: LoggerContract implementation for logging
+        :param parser_classes: The parser classes, by MIME type
+        :param mime_type: The MIME type of the file
+        :param filename: The name of the file, if known
+        :param parsing_config: Configuration for the parser
+        :param executor: Pool of processes to parse large local files in,
+            only used for the files which are not compressed
+        """
+        super().__init__(
+            logger=logger,
+            parsing_config=parsing_config,
+            executor=executor,
+        )
+        self.parser_classes = parser_classes
+        self.mime_type = mime_type
+        self.filename = filename
+
+    def parse(self, file: BinaryIO) -> Generator[TraceRecord]:
+        """Parse the given file, decompressed if compressed, and yield its traces.
+
+        :param file: The file to parse
+        :yield: The traces of the file, or of its members one after the other
+        :raises DecompressionError: If the compressed data is corrupted
+        :raises ParserFactoryError: If no parser is registered for a member
+        """
+        compression = detect_compression(file=file, mime_type=self.mime_type)
+        if compression is None:
+            yield from self._get_parser(
+                mime_type=self.mime_type,
+                executor=self.executor,
+            ).parse(file=file)
+            return
+
+        log_context = {"compression": compression, "filename": self.filename}
+        self.logger.info("Decompressing file", log_context)
+        members = iter_members(
+            file=file,
+            compression=compression,
+            filename=self.filename,
+        )
+        with closing(members):
+            while True:
+                # Only the opening of the members is guarded here,
+                # the errors of their reading being raised by the members
+                try:
+                    name, member = next(members)
+                except StopIteration:
+                    break
+                except DECOMPRESSION_ERRORS as e:
+                    msg = f"Unable to decompress {compression} file"
+                    self.logger.exception(msg, e, log_context)
+                    raise DecompressionError(msg) from e
+
+                self.logger.debug("Parsing member", {"name": name})
+                try:
+                    # The members are streams, not files to parse in byte ranges
+                    yield from self._get_parser(
+                        mime_type=self._get_member_mime_type(name=name),
+                    ).parse(file=member)
+                except DecompressionError as e:
+                    self.logger.exception(str(e), e, {**log_context, "member": name})
+                    raise
+
+    def _get_member_mime_type(self, name: str | None) -> str:
+        """Get the MIME type of a member of a compressed file.
+
+        :param name: The name of the member, if known
+        :return: The MIME type of the member extension, else the one of the file,
+            unless it is a compressed one
+        """
+        extension = PurePosixPath(name).suffix.lower() if name else ""
+        if extension in EXTENSION_MIME_TYPES:
+            return EXTENSION_MIME_TYPES[extension]
+        if self.mime_type in self.parser_classes:
+            return self.mime_type
+        return DEFAULT_MIME_TYPE
+
+    def _get_parser(self, mime_type: str, executor: Executor | None = None) -> Parser:
+        """Get a parser instance for the specified MIME type.
+
+        :param mime_type: The MIME type of the content to parse
+        :param executor: Pool of processes to parse large local files in
+        :return: An instance of the appropriate parser
+        :raises ParserFactoryError: If no parser is registered for the given MIME type
+        """
+        parser_class = self.parser_classes.get(mime_type)
+        if parser_class is None:
+            self.logger.error("Parser not found", {"mime_type": mime_type})
+            raise ParserFactoryError(f"Unsupported MIME type: {mime_type}")
+        return parser_class(
+            logger=self.logger,
+            parsing_config=self.parsing_config,
+            executor=executor,
+        )
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from collections.abc import Generator
+from concurrent.futures import Executor
 from typing import BinaryIO
 
 from app.api.schemas import CustomConfigModel
-from app.common.models.trace import Trace
+from app.common.models.trace import TraceRecord
 from app.infrastructure.logging.contract import LoggerContract
 
 
@@ -14,17 +15,21 @@ class Parser(ABC):
         self,
         logger: LoggerContract,
         parsing_config: CustomConfigModel | None = None,
+        executor: Executor | None = None,
     ) -> None:
         """Initialize the parser with optional configuration.
 
         :param logger: LoggerContract implementation for logging
         :param parsing_config: Configuration for the parser
+        :param executor: Pool of processes to parse large local files in,
+            if supported by the parser
         """
         self.logger = logger
         self.parsing_config = parsing_config or CustomConfigModel()
+        self.executor = executor
 
     @abstractmethod
-    def parse(self, file: BinaryIO) -> Generator[Trace]:
+    def parse(self, file: BinaryIO) -> Generator[TraceRecord]:
         """Parse the given file and yield parsed data.
 
         :param file: The file-like object to parse
@@ -0,0 +1,138 @@
+import re
+from collections.abc import Callable, Collection, Iterable, Mapping
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from app.parsers.types import ColumnTypeEnum
+
+# Converts a stripped, non-empty value, None if the value is not of the column type
+ColumnConverter = Callable[[str], Any]
+
+# Dates and datetimes, as "2024-01-02", "02/01/2024" or "2024-01-02T10:00:00"
+DATE_PATTERN = re.compile(r"\d+([-/.])\d+\1\d+")
+# IRIs, starting with their scheme, as "https:" or "mailto:"
+IRI_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+# First characters of the values which may be numbers, besides the digits
+NUMBER_FIRST_CHARS = frozenset("+-.iInNsS")
+
+
+def to_integer(value: str) -> Decimal | None:
+    """Convert an integer value to a normalized Decimal.
+
+    :param value: The value to convert
+    :return: The normalized Decimal, None if the value is not an integer
+    """
+    digits = value[1:] if value[0] in "+-" else value
+    return Decimal(value).normalize() if digits.isdecimal() else None
+
+
+def to_decimal(value: str) -> Decimal | None:
+    """Convert a decimal value to a normalized Decimal.
+
+    :param value: The value to convert
+    :return: The normalized Decimal, None if the value is not a number
+    """
+    try:
+        return Decimal(value).normalize()
+    except InvalidOperation:
+        return None
+
+
+def to_date(value: str) -> str | None:
+    """Keep a date value as is, not being a number.
+
+    :param value: The value to convert
+    :return: The value, None if the value is not a date
+    """
+    return value if DATE_PATTERN.match(value) else None
+
+
+def to_iri(value: str) -> str | None:
+    """Keep an IRI value as is, not being a number.
+
+    :param value: The value to convert
+    :return: The value, None if the value is not an IRI
+    """
+    return value if IRI_PATTERN.match(value) else None
+
+
+def to_string(value: str) -> str | None:
+    """Keep a text value as is, if it can't be a number.
+
+    :param value: The value to convert
+    :return: The value, None if the value may be a number
+    """
+    if value[0].isdecimal() or value[0] in NUMBER_FIRST_CHARS:
+        return None
+    return value
+
+
+def keep_string(value: str) -> str:
+    """Keep a value as is, numbers included.
+
+    :param value: The value to convert
+    :return: The value
+    """
+    return value
+
+
+COLUMN_CONVERTERS: dict[ColumnTypeEnum, ColumnConverter] = {
+    ColumnTypeEnum.INTEGER: to_integer,
+    ColumnTypeEnum.DECIMAL: to_decimal,
+    ColumnTypeEnum.DATE: to_date,
+    ColumnTypeEnum.IRI: to_iri,
+    ColumnTypeEnum.STRING: to_string,
+}
+
+
+def get_column_converters(
+    column_types: Mapping[str, ColumnTypeEnum],
+    kept_columns: Collection[str],
+) -> dict[str, ColumnConverter]:
+    """Get the converter of each column, from its type.
+
+    :param column_types: The type of each column
+    :param kept_columns: The string columns whose values are kept as is, numbers included
+    :return: The converter of each column
+    """
+    return {
+        fieldname: keep_string
+        if fieldname in kept_columns and column_type == ColumnTypeEnum.STRING
+        else COLUMN_CONVERTERS[column_type]
+        for fieldname, column_type in column_types.items()
+    }
+
+
+def infer_column_types(
+    fieldnames: Iterable[str],
+    sample: Iterable[Mapping[str, Any]],
+) -> dict[str, ColumnTypeEnum]:
+    """Infer the type of the columns from a sample of rows.
+
+    The type of a column is the first one, from the most specific,
+    whose converter accepts all its non-empty values in the sample.
+
+    :param fieldnames: The names of the columns
+    :param sample: The sample of rows
+    :return: The type of each column
+    """
+    values: dict[str, list[str]] = {fieldname: [] for fieldname in fieldnames}
+    for row in sample:
+        for fieldname, column_values in values.items():
+            value = row.get(fieldname)
+            if isinstance(value, str) and (value := value.strip()):
+                column_values.append(value)
+
+    return {
+        fieldname: next(
+            (
+                column_type
+                for column_type, converter in COLUMN_CONVERTERS.items()
+                if column_type != ColumnTypeEnum.STRING
+                and column_values
+                and all(converter(value) is not None for value in column_values)
+            ),
+            ColumnTypeEnum.STRING,
+        )
+        for fieldname, column_values in values.items()
+    }
@@ -1,29 +1,57 @@
 import csv
-from collections import OrderedDict
-from collections.abc import Generator, Mapping
+from collections import deque
+from collections.abc import Collection, Generator, Iterable, Iterator, Mapping
 from decimal import Decimal, InvalidOperation
-from io import TextIOWrapper
-from typing import Any, BinaryIO
+from io import StringIO, TextIOWrapper
+from itertools import chain, islice
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from app.common.extensions.enums import CustomTraceFormatStrEnum
-from app.common.models.trace import Trace
+from app.common.models.trace import TraceRecord
 from app.parsers.contracts.parser import Parser
 from app.parsers.exceptions import CSVParsingError, InvalidCSVStructureError
-from app.parsers.types import DelimiterEnum
+from app.parsers.types import ColumnTypeEnum, DelimiterEnum
+
+from .column_types import (
+    ColumnConverter,
+    get_column_converters,
+    infer_column_types,
+)
+from .ranges import (
+    MAX_PENDING_RANGES,
+    RANGE_SIZE,
+    find_record_end,
+    get_local_path,
+    split_ranges,
+    supports_ranges,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# Number of rows from which the types of the columns are inferred
+COLUMN_TYPES_SAMPLE_SIZE = 100
 
 
 class CSVParser(Parser):
     """Parser for CSV files."""
 
-    def parse(self, file: BinaryIO) -> Generator[Trace]:
+    def parse(self, file: BinaryIO) -> Generator[TraceRecord]:
         """Parse the given CSV file and yield parsed rows.
 
+        A large file on local disk is parsed by byte ranges in the pool of processes
+        of the parser, if any.
+
         :param file: The CSV file to parse
         :yield: Parsed rows from the CSV file
         :raises CSVParsingError: If there's an error decoding the file or parsing the CSV
         """
         self.logger.info("Parsing start", {"config": self.parsing_config.model_dump()})
 
+        path = get_local_path(file=file) if self.executor is not None else None
+
         text_io = self._open_file(file=file)
         dialect, has_header = self._detect_csv_properties(file=text_io)
         self.logger.debug("Detected dialect", {"dialect": dialect.__dict__})
@@ -31,11 +59,18 @@ class CSVParser(Parser):
         reader = self._create_csv_reader(file=text_io, dialect=dialect)
         self._validate_csv_structure(reader=reader, file=text_io, has_header=has_header)
 
-        for row in reader:
-            yield Trace(
-                data=self._clean_row(row=row),
-                format=CustomTraceFormatStrEnum.CUSTOM,
+        rows = None
+        if path is not None:
+            rows = self._get_rows_in_ranges(
+                path=path,
+                params=self._get_csv_params(detected_dialect=dialect),
+                fieldnames=reader.fieldnames or [],
             )
+        if rows is None:
+            rows = self._get_rows(reader=reader)
+
+        for row in rows:
+            yield TraceRecord(data=row, format=CustomTraceFormatStrEnum.CUSTOM)
 
         self.logger.info("Parsing end", {"config": self.parsing_config.model_dump()})
 
@@ -97,16 +132,237 @@ class CSVParser(Parser):
             self.logger.exception(msg, e, {"params": params})
             raise CSVParsingError(msg) from e
 
+    def _get_rows(self, reader: csv.DictReader) -> Iterator[dict[str, Any]]:
+        """Get the cleaned rows of a CSV reader.
+
+        :param reader: The CSV DictReader
+        :return: The cleaned rows
+        """
+        sample = list(islice(reader, COLUMN_TYPES_SAMPLE_SIZE))
+        column_types, kept_columns = self._get_column_types(
+            fieldnames=reader.fieldnames or [],
+            sample=sample,
+        )
+        converters = get_column_converters(
+            column_types=column_types,
+            kept_columns=kept_columns,
+        )
+        return (
+            self._clean_row(row=row, converters=converters)
+            for row in chain(sample, reader)
+        )
+
+    def _get_rows_in_ranges(
+        self,
+        path: str,
+        params: dict[str, Any],
+        fieldnames: list[str],
+    ) -> Iterator[dict[str, Any]] | None:
+        """Get the cleaned rows of a CSV file, parsed by byte ranges in processes.
+
+        The file is mapped in memory by each process, to read its range only.
+
+        :param path: The path of the CSV file
+        :param params: The CSV parameters to use for parsing
+        :param fieldnames: The names of the columns, from the header
+        :return: The cleaned rows, None if the file can't be split in byte ranges
+        """
+        encoding = self.parsing_config.encoding
+        if (
+            not encoding
+            or not supports_ranges(encoding=encoding)
+            or params["escapechar"]
+            or params["quoting"] == csv.QUOTE_NONE
+        ):
+            return None
+        quote = params["quotechar"].encode(encoding) if params["quotechar"] else None
+
+        with (
+            Path(path).open("rb") as file,
+            mmap(
+                file.fileno(),
+                0,
+                access=ACCESS_READ,
+            ) as mm,
+        ):
+            header_end = find_record_end(mm=mm, start=0, end=1, quote=quote)
+            ranges = (
+                split_ranges(
+                    mm=mm,
+                    start=header_end,
+                    quote=quote,
+                    range_size=RANGE_SIZE,
+                )
+                if header_end is not None
+                else None
+            )
+            header = mm[:header_end].decode(encoding) if ranges else ""
+            first_range = mm[slice(*ranges[0])].decode(encoding) if ranges else ""
+
+        # The header read by byte ranges must be the one read as text
+        header_fieldnames = next(
+            csv.reader(StringIO(header, newline=None), **params),
+            None,
+        )
+        if not ranges or header_fieldnames != fieldnames:
+            self.logger.warning("Unable to split CSV in byte ranges")
+            return None
+
+        column_types, kept_columns = self._get_column_types(
+            fieldnames=fieldnames,
+            sample=islice(
+                csv.DictReader(
+                    StringIO(first_range, newline=None),
+                    fieldnames=fieldnames,
+                    **params,
+                ),
+                COLUMN_TYPES_SAMPLE_SIZE,
+            ),
+        )
+        self.logger.info("Parsing in byte ranges", {"ranges": len(ranges)})
+
+        return self._iter_ranges(
+            ranges=ranges,
+            args=(path, encoding, params, fieldnames, column_types, kept_columns),
+        )
+
+    def _iter_ranges(
+        self,
+        ranges: Iterable[tuple[int, int]],
+        args: tuple[Any, ...],
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the cleaned rows of byte ranges, parsed in processes.
+
+        At most MAX_PENDING_RANGES ranges are parsed ahead of the consumer,
+        and the ranges not parsed yet are cancelled if it stops.
+
+        :param ranges: The start and end positions of the ranges
+        :param args: The arguments of _parse_range following the range positions
+        :yield: The cleaned rows, in the order of the file
+        """
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        try:
+            for start, end in ranges:
+                pending.append(
+                    self.executor.submit(CSVParser._parse_range, start, end, *args),
+                )
+                if len(pending) >= MAX_PENDING_RANGES:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _parse_range(  # noqa: PLR0913, PLR0917
+        start: int,
+        end: int,
+        path: str,
+        encoding: str,
+        params: dict[str, Any],
+        fieldnames: list[str],
+        column_types: Mapping[str, ColumnTypeEnum],
+        kept_columns: Collection[str],
+    ) -> list[dict[str, Any]]:
+        """Parse a byte range of a CSV file, in a worker process.
+
+        :param start: The position of the first record of the range
+        :param end: The position following the last record of the range
+        :param path: The path of the CSV file
+        :param encoding: The encoding of the CSV file
+        :param params: The CSV parameters to use for parsing
+        :param fieldnames: The names of the columns, from the header
+        :param column_types: The type of each column
+        :param kept_columns: The string columns whose values are kept as is
+        :return: The cleaned rows of the range
+        """
+        with (
+            Path(path).open("rb") as file,
+            mmap(
+                file.fileno(),
+                0,
+                access=ACCESS_READ,
+            ) as mm,
+        ):
+            text = mm[start:end].decode(encoding)
+
+        converters = get_column_converters(
+            column_types=column_types,
+            kept_columns=kept_columns,
+        )
+        reader = csv.DictReader(
+            StringIO(text, newline=None),
+            fieldnames=fieldnames,
+            **params,
+        )
+        return [CSVParser._clean_row(row=row, converters=converters) for row in reader]
+
+    def _get_column_types(
+        self,
+        fieldnames: Iterable[str],
+        sample: Iterable[Mapping[str, Any]],
+    ) -> tuple[dict[str, ColumnTypeEnum], frozenset[str]]:
+        """Get the type of each column, inferred or configured.
+
+        The columns configured as strings keep their values as is, numbers included.
+
+        :param fieldnames: The names of the columns
+        :param sample: The first rows of the file, to infer the types of the columns
+        :return: The type of each column, and the columns whose values are kept as is
+        """
+        overrides = self.parsing_config.column_types or {}
+        column_types = {
+            **infer_column_types(fieldnames=fieldnames, sample=sample),
+            **overrides,
+        }
+        self.logger.debug("Column types", {"column_types": column_types})
+
+        kept_columns = frozenset(
+            fieldname
+            for fieldname, column_type in overrides.items()
+            if column_type == ColumnTypeEnum.STRING
+        )
+        return column_types, kept_columns
+
     @staticmethod
-    def _clean_row(row: Mapping[str, Any]) -> OrderedDict:
+    def _clean_row(
+        row: Mapping[str, Any],
+        converters: Mapping[str, ColumnConverter],
+    ) -> dict[str, Any]:
         """Clean and normalize the values in a row.
 
         :param row: The row to clean
+        :param converters: The converter of each column
         :return: The cleaned row with normalized values
         """
-        return OrderedDict(
-            (k, CSVParser._normalize_value(value=v)) for k, v in row.items()
-        )
+        return {
+            k: CSVParser._convert_value(value=v, converter=converters.get(k))
+            for k, v in row.items()
+        }
+
+    @staticmethod
+    def _convert_value(value: Any, converter: ColumnConverter | None) -> Any:
+        """Convert a single value with the converter of its column.
+
+        The values not of the type of their column are normalized as any value.
+
+        :param value: The value to convert
+        :param converter: The converter of the column of the value
+        :return: The converted value
+        """
+        if not isinstance(value, str):
+            return value
+
+        value = value.strip()
+        if not value:
+            return None
+
+        if converter is not None:
+            converted = converter(value)
+            if converted is not None:
+                return converted
+        return CSVParser._normalize_value(value=value)
 
     @staticmethod
     def _normalize_value(value: Any) -> Any:
@@ -0,0 +1,110 @@
+import codecs
+import os
+from io import UnsupportedOperation
+from mmap import mmap
+from pathlib import Path
+from typing import BinaryIO
+
+# Minimum size of a file parsed in parallel, in bytes
+PARALLEL_MIN_SIZE = 4 * 1024 * 1024
+# Approximate size of the byte ranges parsed by the worker processes, in bytes
+RANGE_SIZE = 1024 * 1024
+# Maximum number of byte ranges parsed ahead of the consumer
+MAX_PENDING_RANGES = 8
+# Encodings in which a newline or quote byte is always a newline or quote character
+RANGE_ENCODINGS = frozenset(
+    {"ascii", "utf-8", "latin-1", "iso8859-15", "cp1252"},
+)
+
+
+def get_local_path(file: BinaryIO) -> str | None:
+    """Get a path to open a large file on local disk with, from another process.
+
+    The path of an unnamed temporary file, as the uploaded files,
+    is the one of its descriptor in the process.
+
+    :param file: The file to get the path of
+    :return: The path of the file, None if the file is small or not on local disk
+    """
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+    if size < PARALLEL_MIN_SIZE:
+        return None
+
+    name = getattr(file, "name", None)
+    if isinstance(name, str) and Path(name).is_file():
+        return name
+
+    try:
+        fd = file.fileno()
+    except (AttributeError, UnsupportedOperation):
+        return None
+    path = Path(f"/proc/{os.getpid()}/fd/{fd}")
+    return str(path) if path.exists() else None
+
+
+def supports_ranges(encoding: str) -> bool:
+    """Check whether a file in an encoding can be split in byte ranges.
+
+    :param encoding: The encoding of the file
+    :return: Whether the file can be split on its newline bytes
+    """
+    try:
+        return codecs.lookup(encoding).name in RANGE_ENCODINGS
+    except LookupError:
+        return False
+
+
+def find_record_end(mm: mmap, start: int, end: int, quote: bytes | None) -> int | None:
+    """Find the first record boundary of a mapped file, from a position.
+
+    A record ends on a newline out of quotes,
+    quotes being assumed only around the quoted fields, and doubled inside them.
+
+    :param mm: The mapped file
+    :param start: The position of a record start, to count the quotes from
+    :param end: The position to find the boundary from
+    :param quote: The quote character, None if the fields are not quoted
+    :return: The position following the record end,
+        None if the quotes of the file are not balanced
+    """
+    size = len(mm)
+    quotes = mm[start:end].count(quote) if quote else 0
+    while end < size and (quotes % 2 or mm[end - 1 : end] != b"\n"):
+        newline = mm.find(b"\n", end)
+        newline = size if newline == -1 else newline + 1
+        quotes += mm[end:newline].count(quote) if quote else 0
+        end = newline
+    return None if quotes % 2 else end
+
+
+def split_ranges(
+    mm: mmap,
+    start: int,
+    quote: bytes | None,
+    range_size: int,
+) -> list[tuple[int, int]] | None:
+    """Split a mapped file in byte ranges ending on record boundaries.
+
+    :param mm: The mapped file
+    :param start: The position of the first record to split from
+    :param quote: The quote character, None if the fields are not quoted
+    :param range_size: The approximate size of the ranges
+    :return: The start and end positions of the ranges,
+        None if the quotes of the file are not balanced
+    """
+    size = len(mm)
+    ranges = []
+    while start < size:
+        end = find_record_end(
+            mm=mm,
+            start=start,
+            end=min(start + range_size, size),
+            quote=quote,
+        )
+        if end is None:
+            return None
+        ranges.append((start, end))
+        start = end
+    return ranges
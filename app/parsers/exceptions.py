@@ -12,3 +12,11 @@ class CSVParsingError(ParserError):
 
 class InvalidCSVStructureError(CSVParsingError):
     """Exception raised when the CSV structure is invalid (e.g., no header or single column)."""
+
+
+class JSONParsingError(ParserError):
+    """Exception raised for errors during JSON or NDJSON parsing."""
+
+
+class DecompressionError(ParserError):
+    """Exception raised when a compressed file can't be decompressed."""
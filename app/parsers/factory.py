@@ -1,12 +1,20 @@
+from concurrent.futures import Executor
+from typing import BinaryIO
+
 from app.api.schemas import CustomConfigModel
 from app.infrastructure.logging.contract import LoggerContract
 
+from .compressed.formats import COMPRESSION_MIME_TYPES, detect_compression
+from .compressed.parser import DecompressingParser
 from .contracts.parser import Parser
 from .csv.parser import CSVParser
 from .exceptions import ParserFactoryError
+from .json.parser import JSONArrayParser, NDJSONParser
 
 MIME_TO_PARSER: dict[str, type[Parser]] = {
     "text/csv": CSVParser,
+    "application/x-ndjson": NDJSONParser,
+    "application/json": JSONArrayParser,
 }
 
 
@@ -23,23 +31,48 @@ class ParserFactory:
         MIME_TO_PARSER[mime_type] = parser_class
 
     @staticmethod
-    def get_parser(
+    def get_parser(  # noqa: PLR0913, PLR0917
         mime_type: str,
         logger: LoggerContract,
         parsing_config: CustomConfigModel | None = None,
+        executor: Executor | None = None,
+        filename: str | None = None,
+        file: BinaryIO | None = None,
     ) -> Parser:
         """Get a parser instance for the specified MIME type.
 
+        The parser decompresses the compressed files, detected by their MIME type
+        or first bytes, before parsing their content. A file of an unknown MIME type,
+        as application/octet-stream, is accepted if its first bytes are compressed ones.
+
         :param mime_type: The MIME type of the content to parse
         :param logger: LoggerContract implementation for logging
         :param parsing_config: Configuration for the parser
+        :param executor: Pool of processes to parse large local files in
+        :param filename: The name of the file, to get the type of its content
+            if compressed
+        :param file: The file to parse, to detect its compression from its first bytes
         :return: An instance of the appropriate parser
-        :raises ParserFactoryError: If no parser is registered for the given MIME type
+        :raises ParserFactoryError: If no parser is registered for the given MIME type,
+            and the file is not compressed
         """
-        parser_class = MIME_TO_PARSER.get(mime_type)
-        if parser_class:
+        if (
+            mime_type in MIME_TO_PARSER
+            or mime_type in COMPRESSION_MIME_TYPES
+            or (
+                file is not None
+                and detect_compression(file=file, mime_type=mime_type) is not None
+            )
+        ):
             logger.info("Parser found", {"mime_type": mime_type})
-            return parser_class(logger=logger, parsing_config=parsing_config)
+            return DecompressingParser(
+                logger=logger,
+                parser_classes=MIME_TO_PARSER,
+                mime_type=mime_type,
+                filename=filename,
+                parsing_config=parsing_config,
+                executor=executor,
+            )
 
         logger.error("Parser not found", {"mime_type": mime_type})
         raise ParserFactoryError(f"Unsupported MIME type: {mime_type}")
@@ -0,0 +1,277 @@
+import re
+from abc import abstractmethod
+from collections.abc import Generator, Iterator
+from io import TextIOWrapper
+from json import JSONDecodeError, JSONDecoder
+from typing import BinaryIO, TextIO
+
+from app.common.common_types import JsonType
+from app.common.exceptions import InvalidTraceError
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace, TraceRecord
+from app.parsers.contracts.parser import Parser
+from app.parsers.exceptions import JSONParsingError
+
+# Number of characters read at once from the file
+CHUNK_SIZE = 64 * 1024
+# Maximum number of characters of a JSON value
+MAX_VALUE_SIZE = 16 * 1024 * 1024
+# First character which is not a JSON whitespace
+NON_WHITESPACE_PATTERN = re.compile(r"[^ \t\n\r]")
+# Characters opening or closing a JSON string, object or array
+STRUCTURE_PATTERN = re.compile(r'["{}[\]]')
+# Characters ending or escaping in a JSON string
+STRING_PATTERN = re.compile(r'["\\]')
+# Characters ending a JSON number or literal
+SCALAR_END_PATTERN = re.compile(r"[ \t\n\r,}\]]")
+
+
+class TextBuffer:
+    """Window over a text file, read by chunks as its characters are consumed.
+
+    The consumed characters are dropped when reading more,
+    so that only the value being decoded is kept in memory.
+    """
+
+    def __init__(
+        self,
+        file: TextIO,
+        chunk_size: int = CHUNK_SIZE,
+        max_value_size: int = MAX_VALUE_SIZE,
+    ) -> None:
+        """Initialize the TextBuffer.
+
+        :param file: The text file to read
+        :param chunk_size: The number of characters read at once
+        :param max_value_size: The maximum number of characters of a value
+        """
+        self.file = file
+        self.chunk_size = chunk_size
+        self.max_value_size = max_value_size
+        self.text = ""
+        self.position = 0
+        self.eof = False
+
+    def read_more(self, size: int) -> bool:
+        """Read more characters from the file, dropping the consumed ones.
+
+        :param size: The number of characters to read
+        :return: False if the end of the file is reached
+        """
+        chunk = "" if self.eof else self.file.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def next_char(self) -> str:
+        """Get the next character which is not a whitespace, without consuming it.
+
+        :return: The character, empty at the end of the file
+        """
+        while (
+            match := NON_WHITESPACE_PATTERN.search(self.text, self.position)
+        ) is None:
+            self.position = len(self.text)
+            if not self.read_more(size=self.chunk_size):
+                return ""
+        self.position = match.start()
+        return match.group()
+
+    def decode_value(self, decoder: JSONDecoder) -> JsonType:
+        """Decode and consume the next JSON value.
+
+        The characters read for a value not complete yet are doubled each time,
+        to decode a large value a few times only. A value which fails to be decoded
+        is only read further if it goes on after the characters read.
+
+        :param decoder: The JSON decoder
+        :return: The decoded value
+        :raises JSONDecodeError: If the value is invalid
+        :raises JSONParsingError: If the value is longer than the maximum size
+        """
+        self.next_char()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.position)
+            except JSONDecodeError:
+                if self._find_value_end() is not None or not self._read_value_more():
+                    raise
+                continue
+            # A number or literal may go on after the characters read
+            if (
+                isinstance(value, dict | list | str)
+                or self._find_value_end() is not None
+                or not self._read_value_more()
+            ):
+                self.position = end
+                return value
+
+    def _read_value_more(self) -> bool:
+        """Read more characters of the value being decoded, as many as already read.
+
+        :return: False if the end of the file is reached
+        :raises JSONParsingError: If the value is longer than the maximum size
+        """
+        size = len(self.text) - self.position
+        if size > self.max_value_size:
+            msg = f"JSON value longer than {self.max_value_size} characters"
+            raise JSONParsingError(msg)
+        return self.read_more(size=max(self.chunk_size, size))
+
+    def _find_value_end(self) -> int | None:
+        """Find the end of the value being decoded, from its strings and brackets only.
+
+        :return: The position after the value, None if it goes on after the characters read
+        """
+        text = self.text
+        if self.position >= len(text):
+            return None
+        if text[self.position] not in '"{[':
+            match = SCALAR_END_PATTERN.search(text, self.position)
+            return match.start() if match else None
+
+        index = self.position
+        depth = 0
+        while (match := STRUCTURE_PATTERN.search(text, index)) is not None:
+            index = match.end()
+            char = match.group()
+            if char == '"':
+                while (match := STRING_PATTERN.search(text, index)) is not None:
+                    # An escaped character is skipped
+                    index = match.end() + (match.group() == "\\")
+                    if match.group() == '"':
+                        break
+                else:
+                    return None
+            else:
+                depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return index
+        return None
+
+
+class JSONTracesParser(Parser):
+    """Base class for the parsers of files of JSON traces.
+
+    The traces are in the configured input format, or in the format detected
+    for each of them, custom if no format matches.
+    """
+
+    def parse(self, file: BinaryIO) -> Generator[TraceRecord]:
+        """Parse the given file and yield its traces, one at a time.
+
+        :param file: The file to parse
+        :yield: The traces of the file
+        :raises JSONParsingError: If the file is not valid JSON, or a trace not an object
+        """
+        self.logger.info("Parsing start", {"config": self.parsing_config.model_dump()})
+
+        text_io = TextIOWrapper(buffer=file, encoding=self.parsing_config.encoding)
+        for index, data in enumerate(self._iter_values(file=text_io)):
+            yield self._get_record(data=data, index=index)
+
+        self.logger.info("Parsing end", {"config": self.parsing_config.model_dump()})
+
+    @abstractmethod
+    def _iter_values(self, file: TextIO) -> Iterator[JsonType]:
+        """Iterate over the JSON values of the traces of a file.
+
+        :param file: The text file to parse
+        :yield: The values of the traces
+        :raises JSONParsingError: If the file is not valid JSON
+        """
+        raise NotImplementedError
+
+    def _get_record(self, data: JsonType, index: int) -> TraceRecord:
+        """Create the trace record of a JSON value, validated against its format.
+
+        :param data: The value of the trace
+        :param index: The index of the trace in the file
+        :return: The trace record, in the configured or detected format
+        :raises JSONParsingError: If the value is not a JSON object
+        :raises InvalidTraceError: If the value is empty,
+            or invalid for the configured format
+        """
+        if not isinstance(data, dict):
+            msg = f"JSON trace {index} must be an object, not {type(data).__name__}"
+            self.logger.error(msg, {"index": index})
+            raise JSONParsingError(msg)
+        if not data:
+            raise InvalidTraceError("Trace data is required")
+
+        input_format = self.parsing_config.input_format
+        if input_format is not None:
+            Trace.validate_format(trace_data=data, trace_format=input_format)
+        else:
+            input_format = (
+                Trace.detect_format(data=data) or CustomTraceFormatStrEnum.CUSTOM
+            )
+        return TraceRecord(data=data, format=input_format)
+
+
+class NDJSONParser(JSONTracesParser):
+    """Parser for NDJSON files, with one trace per line."""
+
+    def _iter_values(self, file: TextIO) -> Iterator[JsonType]:
+        """Inherited from JSONTracesParser._iter_values."""
+        decoder = JSONDecoder()
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                value = decoder.decode(line)
+            except JSONDecodeError as e:
+                msg = "Invalid JSON line"
+                self.logger.exception(msg, e)
+                raise JSONParsingError(msg) from e
+            yield value
+
+
+class JSONArrayParser(JSONTracesParser):
+    """Parser for JSON files holding an array of traces.
+
+    The file is decoded one element at a time, never loading the whole array.
+    """
+
+    def _iter_values(self, file: TextIO) -> Iterator[JsonType]:
+        """Inherited from JSONTracesParser._iter_values."""
+        buffer = TextBuffer(file=file)
+        decoder = JSONDecoder()
+
+        if buffer.next_char() != "[":
+            msg = "JSON file must hold an array of traces"
+            self.logger.error(msg)
+            raise JSONParsingError(msg)
+        buffer.position += 1
+
+        if buffer.next_char() == "]":
+            buffer.position += 1
+        else:
+            while True:
+                try:
+                    value = buffer.decode_value(decoder=decoder)
+                except JSONDecodeError as e:
+                    msg = "Invalid JSON array element"
+                    self.logger.exception(msg, e)
+                    raise JSONParsingError(msg) from e
+                except JSONParsingError as e:
+                    self.logger.exception("JSON array element too large", e)
+                    raise
+                yield value
+
+                separator = buffer.next_char()
+                buffer.position += 1
+                if separator == "]":
+                    break
+                if separator != ",":
+                    msg = "Invalid JSON array separator"
+                    self.logger.error(msg)
+                    raise JSONParsingError(msg)
+
+        if buffer.next_char():
+            msg = "Unexpected data after the JSON array"
+            self.logger.error(msg)
+            raise JSONParsingError(msg)
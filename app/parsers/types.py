@@ -28,3 +28,21 @@ class QuotingEnum(Enum):
     MINIMAL = csv.QUOTE_MINIMAL
     NONE = csv.QUOTE_NONE
     NONNUMERIC = csv.QUOTE_NONNUMERIC
+
+
+class ColumnTypeEnum(StrEnum):
+    """Enumeration of the types of the CSV columns."""
+
+    INTEGER = "integer"
+    DECIMAL = "decimal"
+    DATE = "date"
+    IRI = "iri"
+    STRING = "string"
+
+
+class CompressionEnum(StrEnum):
+    """Enumeration of the compressions of the uploaded files."""
+
+    GZIP = "gzip"
+    BZIP2 = "bz2"
+    ZIP = "zip"
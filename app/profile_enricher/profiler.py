@@ -1,7 +1,7 @@
 from app.common.models.trace import Trace
 
 from .exceptions import ProfilerError
-from .profiler_types import ValidationError, ValidationRecommendation
+from .profiler_types import ProfilingResult, ValidationError, ValidationRecommendation
 from .repositories.contracts.repository import ProfileRepository
 
 
@@ -62,6 +62,22 @@ class Profiler:
             trace=trace,
         )
 
+    def enrich_and_validate_trace(self, trace: Trace) -> ProfilingResult:
+        """Enrich a trace, then validate it and generate its recommendations.
+
+        :param trace: The original trace to enrich
+        :return: The errors and recommendations of the enriched trace
+        """
+        if not trace.profile:
+            raise ProfilerError("No profile associated with the trace")
+        group_name, template_name = self._parse_profile(profile=trace.profile)
+
+        return self.repository.enrich_and_validate_trace(
+            group_name=group_name,
+            template_name=template_name,
+            trace=trace,
+        )
+
     @staticmethod
     def _parse_profile(profile: str) -> tuple[str, str]:
         """Parse a profile identifier in the format 'group_name.template_name'.
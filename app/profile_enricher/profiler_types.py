@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -27,3 +27,15 @@ class ValidationError(ValidationResult):
 
 class ValidationRecommendation(ValidationResult):
     """Represents a recommended rule in a profile that was not met by the trace."""
+
+
+@dataclass(frozen=True)
+class ProfilingResult:
+    """Represents the outcome of enriching and validating a trace against its profile.
+
+    :param errors: The errors of the enriched trace. An empty list indicates a valid trace
+    :param recommendations: The recommended rules not met by the enriched trace
+    """
+
+    errors: list[ValidationError] = field(default_factory=list)
+    recommendations: list[ValidationRecommendation] = field(default_factory=list)
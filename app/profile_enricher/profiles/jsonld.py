@@ -10,6 +10,7 @@ Constants are also provided for standard URLs used in profiles.
 
 import re
 from abc import ABC
+from collections.abc import Hashable
 from datetime import datetime
 from enum import StrEnum
 from typing import Annotated, Any, Literal, Union, get_args, get_origin
@@ -18,6 +19,7 @@ from pydantic import (
     AnyUrl,
     BaseModel,
     Field,
+    PrivateAttr,
     ValidationInfo,
     field_validator,
     model_validator,
@@ -30,6 +32,22 @@ PROFILE_CONFORMS_TO_URL = "https://w3id.org/xapi/profiles#1.0"
 LOCATION_PATTERN = r"^[\$@]([.\[].*)?$"
 
 
+def to_hashable(value: Any) -> Hashable:
+    """Get a hashable form of a JSON value, to look it up in sets of values.
+
+    Objects and arrays are converted to frozensets and tuples tagged with their type,
+    so that the forms of two values are equal only if the values are equal.
+
+    :param value: The JSON value
+    :return: The value itself if hashable, its hashable form otherwise
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((key, to_hashable(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return list, tuple(to_hashable(item) for item in value)
+    return value
+
+
 class CustomBaseModel(BaseModel):
     @model_validator(mode="before")
     @classmethod
@@ -280,6 +298,24 @@ class StatementTemplateRule(CustomBaseModel):
     none: list[str] | None = None
     scope_note: LanguageMap | None = Field(None, alias="scopeNote")
 
+    _values_sets: dict[str, frozenset[Hashable]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Build the sets of the 'any', 'all' and 'none' values, once for all the checks."""
+        self._values_sets = {
+            check_type: frozenset(to_hashable(value) for value in values)
+            for check_type in ("any", "all", "none")
+            if (values := getattr(self, check_type)) is not None
+        }
+
+    def get_values_set(self, check_type: str) -> frozenset[Hashable]:
+        """Get the set of the values of the 'any', 'all' or 'none' check of the rule.
+
+        :param check_type: The check type, "any", "all" or "none"
+        :return: The hashable forms of the values, empty if the rule has no such check
+        """
+        return self._values_sets.get(check_type, frozenset())
+
     @field_validator("location", "selector")
     @staticmethod
     def validate_jsonpath(value: str | None) -> str | None:
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from app.common.models.trace import Trace
 from app.profile_enricher.profiler_types import (
+    ProfilingResult,
     ValidationError,
     ValidationRecommendation,
 )
@@ -54,3 +55,19 @@ class ProfileRepository(ABC):
         :return: A list of ValidationRecommendation objects
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def enrich_and_validate_trace(
+        self,
+        group_name: str,
+        template_name: str,
+        trace: Trace,
+    ) -> ProfilingResult:
+        """Enrich a trace, then validate it and generate its recommendations in a single pass.
+
+        :param group_name: The group name of the profile
+        :param template_name: The template name within the profile
+        :param trace: The original trace to enrich
+        :return: The errors and recommendations of the enriched trace
+        """
+        raise NotImplementedError
@@ -3,12 +3,14 @@ from app.common.utils.utils_dict import deep_merge
 from app.infrastructure.config.contract import ConfigContract
 from app.infrastructure.logging.contract import LoggerContract
 from app.profile_enricher.profiler_types import (
+    ProfilingResult,
     ValidationError,
     ValidationRecommendation,
 )
 from app.profile_enricher.repositories.contracts.repository import ProfileRepository
 
 from .profile_loader import ProfileLoader
+from .profile_registry import ProfileRegistry
 from .trace_enricher import TraceEnricher
 from .trace_validator import TraceValidator
 
@@ -16,14 +18,24 @@ from .trace_validator import TraceValidator
 class JsonLdProfileRepository(ProfileRepository):
     """A repository for handling JSON-LD profiles."""
 
-    def __init__(self, logger: LoggerContract, config: ConfigContract) -> None:
+    def __init__(
+        self,
+        logger: LoggerContract,
+        config: ConfigContract,
+        profile_registry: ProfileRegistry | None = None,
+    ) -> None:
         """Initialize the JsonLdProfileRepository.
 
         :param logger: LoggerContract implementation for logging
         :param config: ConfigContract implementation for config
+        :param profile_registry: The registry of the loaded profiles, shared by the repositories.
+            A registry of its own is used if not provided
         """
         self.logger = logger
-        self.profile_loader = ProfileLoader(logger=logger, config=config)
+        self.profile_registry = profile_registry or ProfileRegistry(
+            profile_loader=ProfileLoader(logger=logger, config=config),
+            logger=logger,
+        )
         self.trace_enricher = TraceEnricher(logger=logger)
         self.trace_validator = TraceValidator(logger=logger)
 
@@ -40,7 +52,7 @@ class JsonLdProfileRepository(ProfileRepository):
         """
         # Get the correct template model depending on group and template names
         try:
-            template = self.profile_loader.load_template(
+            template = self.profile_registry.get_template(
                 group_name=group_name,
                 template_name=template_name,
             )
@@ -57,6 +69,7 @@ class JsonLdProfileRepository(ProfileRepository):
 
         # Merge recursively the original trace with enriched data
         deep_merge(target_dict=trace.data, merge_dct=enriched_data)
+        trace.reset_model()
         self.logger.info("Trace enriched successfully", {"template": template_name})
 
     def validate_trace(
@@ -78,7 +91,7 @@ class JsonLdProfileRepository(ProfileRepository):
         """
         # Get the correct template model depending on group and template names
         try:
-            template = self.profile_loader.load_template(
+            template = self.profile_registry.get_template(
                 group_name=group_name,
                 template_name=template_name,
             )
@@ -106,7 +119,7 @@ class JsonLdProfileRepository(ProfileRepository):
         """
         # Get the correct template model depending on group and template names
         try:
-            template = self.profile_loader.load_template(
+            template = self.profile_registry.get_template(
                 group_name=group_name,
                 template_name=template_name,
             )
@@ -115,3 +128,60 @@ class JsonLdProfileRepository(ProfileRepository):
             return []
 
         return self.trace_validator.get_recommendations(template=template, trace=trace)
+
+    def enrich_and_validate_trace(
+        self,
+        group_name: str,
+        template_name: str,
+        trace: Trace,
+    ) -> ProfilingResult:
+        """Enrich a trace, then validate it and generate its recommendations.
+
+        The rule locations are looked up once in the trace for the three operations,
+        only the ones changed by the enrichment are looked up again.
+
+        :param group_name: The group name of the profile
+        :param template_name: The template name within the profile
+        :param trace: The trace to enrich and validate
+        :return: The errors and recommendations of the enriched trace
+        :raises TemplateNotFoundError: If the specified template is not found
+        :raises ProfileNotFoundError: If the profile is not found
+        :raises InvalidJsonError: If the profile JSON is invalid
+        :raises ProfileValidationError: If the profile fails validation
+        """
+        # Get the correct template model depending on group and template names
+        try:
+            template = self.profile_registry.get_template(
+                group_name=group_name,
+                template_name=template_name,
+            )
+        except Exception as e:
+            self.logger.exception("Error while loading template", e)
+            return ProfilingResult()
+
+        rules_values = self.trace_validator.get_rules_values(
+            template=template,
+            data=trace.data,
+        )
+
+        # Build enriched data with template data and merge it in the original trace
+        enriched_data = self.trace_enricher.get_enriched_data(
+            group_name=group_name,
+            template=template,
+            trace=trace,
+            rules_values=rules_values,
+        )
+        deep_merge(target_dict=trace.data, merge_dct=enriched_data)
+        trace.reset_model()
+        self.logger.info("Trace enriched successfully", {"template": template_name})
+
+        rules_values = self.trace_validator.update_rules_values(
+            rules_values=rules_values,
+            data=trace.data,
+            patch=enriched_data,
+        )
+        errors, recommendations = self.trace_validator.evaluate_rules(
+            template=template,
+            rules_values=rules_values,
+        )
+        return ProfilingResult(errors=errors, recommendations=recommendations)
@@ -1,5 +1,4 @@
 import json
-from functools import cache
 from os import PathLike
 from pathlib import Path
 from urllib.error import HTTPError, URLError
@@ -15,9 +14,8 @@ from app.profile_enricher.exceptions import (
     InvalidJsonError,
     ProfileNotFoundError,
     ProfileValidationError,
-    TemplateNotFoundError,
 )
-from app.profile_enricher.profiles.jsonld import Profile, StatementTemplate
+from app.profile_enricher.profiles.jsonld import Profile
 
 
 class ProfileLoader:
@@ -40,14 +38,11 @@ class ProfileLoader:
 
         self.download_timeout = config.get_download_timeout()
 
-    @cache
-    def load_template(self, group_name: str, template_name: str) -> StatementTemplate:
-        """Load a template from cache or from file if not cached.
+    def load_profile(self, group_name: str) -> Profile:
+        """Load a profile from its file, downloading the file first if not exists.
 
         :param group_name: The group name of the profile
-        :param template_name: The template name within the profile
-        :return: The loaded StatementTemplate
-        :raises TemplateNotFoundError: If the specified template is not found
+        :return: The loaded Profile
         :raises ProfileNotFoundError: If the profile is not found
         :raises InvalidJsonError: If the profile JSON is invalid
         :raises ProfileValidationError: If the profile fails validation
@@ -56,7 +51,6 @@ class ProfileLoader:
         file_path = self.base_path.joinpath(f"{group_name}.jsonld")
         log_context = {
             "group": group_name,
-            "template": template_name,
             "file": file_path,
         }
         self.logger.debug("Load profile file", log_context)
@@ -74,20 +68,7 @@ class ProfileLoader:
             self.save_profile_file(file_path, profile_json)
 
         self.logger.info("Profile loaded", log_context)
-
-        # Then, retrieve the correct template in the profile
-        template = self._get_template_in_profile(
-            profile=profile,
-            template_name=template_name,
-        )
-        if template is None:
-            self.logger.warning("Template not found", log_context)
-            raise TemplateNotFoundError(
-                f"Template '{template_name}' not found in profile '{group_name}'",
-            )
-
-        self.logger.info("Template found", log_context)
-        return template
+        return profile
 
     def read_profile_file(self, file_path: str | PathLike[str]) -> JsonType:
         """Load a profile file from the file system.
@@ -200,27 +181,3 @@ class ProfileLoader:
         except (TypeError, ValueError) as e:
             self.logger.exception("Invalid data type in profile", e)
             raise ProfileValidationError("Invalid data type in profile") from e
-
-    @staticmethod
-    def _get_template_in_profile(
-        profile: Profile,
-        template_name: str,
-    ) -> StatementTemplate | None:
-        """Get a specific template from a profile.
-
-        :param profile: The profile containing templates
-        :param template_name: The name of the template to retrieve
-        :return: The found template, or None if not found
-        """
-        if profile.templates is None:
-            return None
-        for profile_template in profile.templates:
-            # Example: accessed-page in http://schema.dases.eu/xapi/profile/common/templates/accessed-page
-            if (
-                str(profile_template.id)
-                .rstrip("/")
-                .casefold()
-                .endswith(template_name.casefold())
-            ):
-                return profile_template
-        return None
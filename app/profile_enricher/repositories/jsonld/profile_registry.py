@@ -0,0 +1,168 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from threading import Lock
+
+from app.infrastructure.logging.contract import LoggerContract
+from app.profile_enricher.exceptions import TemplateNotFoundError
+from app.profile_enricher.profiles.jsonld import Profile, StatementTemplate
+
+from .profile_loader import ProfileLoader
+
+
+@dataclass(frozen=True)
+class ProfileTemplates:
+    """The templates of a loaded profile, indexed for lookups by name.
+
+    :param profile: The loaded profile
+    :param by_iri: The templates by normalized IRI
+    :param by_name: The templates by normalized short name, the last segment of their IRI
+    """
+
+    profile: Profile
+    by_iri: Mapping[str, StatementTemplate]
+    by_name: Mapping[str, StatementTemplate]
+
+    @classmethod
+    def from_profile(cls, profile: Profile) -> "ProfileTemplates":
+        """Index the templates of a profile.
+
+        When several templates share a key, the first one declared in the profile is kept.
+
+        :param profile: The loaded profile
+        :return: The indexed templates of the profile
+        """
+        by_iri: dict[str, StatementTemplate] = {}
+        by_name: dict[str, StatementTemplate] = {}
+        for template in profile.templates or []:
+            # Example: accessed-page in http://schema.dases.eu/xapi/profile/common/templates/accessed-page
+            iri = cls.normalize(str(template.id).rstrip("/"))
+            by_iri.setdefault(iri, template)
+            by_name.setdefault(iri.rsplit("/", 1)[-1], template)
+        return cls(profile=profile, by_iri=by_iri, by_name=by_name)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalize a template name or IRI for case-insensitive lookups.
+
+        :param name: The template name or IRI
+        :return: The normalized key
+        """
+        return name.casefold()
+
+    def get_template(self, template_name: str) -> StatementTemplate | None:
+        """Get a template by its short name or IRI.
+
+        A name matching neither is looked up as the end of the template IRIs,
+        to find templates referenced with a partial path.
+
+        :param template_name: The short name or IRI of the template
+        :return: The found template, or None if not found
+        """
+        key = self.normalize(template_name)
+        template = self.by_iri.get(key) or self.by_name.get(key)
+        if template is not None:
+            return template
+        return next(
+            (template for iri, template in self.by_iri.items() if iri.endswith(key)),
+            None,
+        )
+
+
+class ProfileRegistry:
+    """Registry of the loaded profiles, shared by all the requests of the application.
+
+    Each profile is loaded and validated once, on first use, then its templates are served
+    from memory.
+    """
+
+    def __init__(self, profile_loader: ProfileLoader, logger: LoggerContract) -> None:
+        """Initialize the ProfileRegistry.
+
+        :param profile_loader: The loader used to read or download the profiles
+        :param logger: LoggerContract implementation for logging
+        """
+        self.profile_loader = profile_loader
+        self.logger = logger
+        self._profiles: dict[str, ProfileTemplates] = {}
+        self._locks: dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def get_profile_templates(self, group_name: str) -> ProfileTemplates:
+        """Get the indexed templates of a profile, loading the profile if not loaded yet.
+
+        A profile failing to load is not kept, so that it is loaded again on next use.
+
+        :param group_name: The group name of the profile
+        :return: The indexed templates of the profile
+        :raises ProfileNotFoundError: If the profile is not found
+        :raises InvalidJsonError: If the profile JSON is invalid
+        :raises ProfileValidationError: If the profile fails validation
+        """
+        profile_templates = self._profiles.get(group_name)
+        if profile_templates is not None:
+            return profile_templates
+
+        # Load each profile once, without blocking the lookups in other profiles
+        with self._lock:
+            group_lock = self._locks.setdefault(group_name, Lock())
+        with group_lock:
+            profile_templates = self._profiles.get(group_name)
+            if profile_templates is None:
+                profile_templates = ProfileTemplates.from_profile(
+                    profile=self.profile_loader.load_profile(group_name=group_name),
+                )
+                self._profiles[group_name] = profile_templates
+        return profile_templates
+
+    def get_template(self, group_name: str, template_name: str) -> StatementTemplate:
+        """Get a template of a profile.
+
+        :param group_name: The group name of the profile
+        :param template_name: The short name or IRI of the template within the profile
+        :return: The found StatementTemplate
+        :raises TemplateNotFoundError: If the specified template is not found
+        :raises ProfileNotFoundError: If the profile is not found
+        :raises InvalidJsonError: If the profile JSON is invalid
+        :raises ProfileValidationError: If the profile fails validation
+        """
+        log_context = {"group": group_name, "template": template_name}
+
+        template = self.get_profile_templates(group_name=group_name).get_template(
+            template_name=template_name,
+        )
+        if template is None:
+            self.logger.warning("Template not found", log_context)
+            raise TemplateNotFoundError(
+                f"Template '{template_name}' not found in profile '{group_name}'",
+            )
+
+        self.logger.debug("Template found", log_context)
+        return template
+
+    def warmup(self, group_names: Iterable[str]) -> int:
+        """Load the profiles of the given groups.
+
+        A profile failing to load is logged and skipped, to be loaded again on first use.
+
+        :param group_names: The group names of the profiles
+        :return: The number of profiles loaded
+        """
+        loaded = 0
+        for group_name in group_names:
+            try:
+                self.get_profile_templates(group_name=group_name)
+            except Exception as e:
+                self.logger.exception(
+                    "Profile warmup failed",
+                    e,
+                    {"group": group_name},
+                )
+                continue
+            loaded += 1
+        self.logger.info("Profiles warmed up", {"profiles": loaded})
+        return loaded
+
+    def clear(self) -> None:
+        """Remove all the loaded profiles, to load them again on next use."""
+        with self._lock:
+            self._profiles.clear()
@@ -1,20 +1,122 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
 from app.common.common_types import JsonType
 from app.common.models.trace import Trace
-from app.common.utils.utils_dict import deep_merge, get_nested_from_flat
+from app.common.utils.utils_dict import copy_nested, deep_merge, get_nested_from_flat
 from app.infrastructure.logging.contract import LoggerContract
 from app.profile_enricher.profiles.jsonld import PresenceTypeEnum, StatementTemplate
 from app.profile_enricher.utils.jsonpath import JSONPathUtils
 
+if TYPE_CHECKING:
+    from .trace_validator import RuleValues
+
 # Constants
 CONTEXT_ACTIVITIES_CATEGORY_ID = "https://w3id.org/xapi"
 CONTEXT_ACTIVITIES_CATEGORY_DEFINITION_TYPE = (
     "http://adlnet.gov/expapi/activities/profile"
 )
+MAX_PATCHES_PER_TEMPLATE = 64
+
+
+@dataclass(frozen=True)
+class TemplateEnrichment:
+    """The enrichment data of a template, computed once per group and template.
+
+    The data of the template itself is always added to the traces, while the data
+    of a rule is added only when the location of the rule is missing in the trace.
+    The nested patch of each combination of filled rules is built once, then copied.
+
+    :param template: The template of the enrichment
+    :param template_data: The flat data of the template
+    :param rules_data: For each rule of the template, the data filling its location,
+        None if the rule doesn't fill its location
+    :param patches: The nested patches already built, by indexes of the filled rules
+    """
+
+    template: StatementTemplate
+    template_data: dict[str, Any]
+    rules_data: tuple[dict[str, Any] | None, ...]
+    patches: dict[tuple[int, ...], JsonType] = field(default_factory=dict)
+
+    @classmethod
+    def from_template(
+        cls,
+        group_name: str,
+        template: StatementTemplate,
+    ) -> "TemplateEnrichment":
+        """Compute the enrichment data of a template.
+
+        :param group_name: The group name of the template
+        :param template: The template to use for enrichment
+        :return: The enrichment data of the template
+        """
+        template_data = {
+            "verb.id": str(template.verb),
+            "verb.display.en-US": template.pref_label.en,
+            "object.definition.type": str(template.object_activity_type),
+            "context.contextActivities.category": [
+                {
+                    "id": f"{CONTEXT_ACTIVITIES_CATEGORY_ID}/{group_name}",
+                    "definition": {
+                        "type": CONTEXT_ACTIVITIES_CATEGORY_DEFINITION_TYPE,
+                    },
+                },
+            ],
+        }
+
+        rules_data = []
+        for rule in template.rules or []:
+            value = None
+            if (
+                rule.presence
+                in {PresenceTypeEnum.RECOMMENDED, PresenceTypeEnum.INCLUDED}
+                and rule.location
+            ):
+                # Enriched more for rules with only one value
+                if rule.any and len(rule.any) == 1:
+                    value = rule.any[0]
+                elif rule.all and len(rule.all) == 1:
+                    value = rule.all[0]
+            rules_data.append(
+                JSONPathUtils.path_to_dict(rule.location, value) if value else None,
+            )
+
+        return cls(
+            template=template,
+            template_data=template_data,
+            rules_data=tuple(rules_data),
+        )
+
+    def get_patch(self, filled_rules: tuple[int, ...]) -> JsonType:
+        """Get the nested patch enriching a trace.
+
+        :param filled_rules: The indexes of the rules whose location is filled
+        :return: A copy of the nested patch, to merge in the trace
+        """
+        patch = self.patches.get(filled_rules)
+        if patch is None:
+            rules_enriched_data = {}
+            for index in filled_rules:
+                deep_merge(
+                    target_dict=rules_enriched_data,
+                    merge_dct=copy_nested(self.rules_data[index]),
+                )
+            patch = get_nested_from_flat(
+                flat_field={**self.template_data, **rules_enriched_data},
+            )
+            if len(self.patches) < MAX_PATCHES_PER_TEMPLATE:
+                self.patches[filled_rules] = patch
+        return copy_nested(patch)
 
 
 class TraceEnricher:
     """Class responsible for enriching traces based on templates."""
 
+    # The enrichment data of the templates, shared by all the enrichers
+    _enrichments: ClassVar[dict[tuple[str, str], TemplateEnrichment]] = {}
+
     def __init__(self, logger: LoggerContract) -> None:
         """Initialize the TraceEnricher.
 
@@ -27,12 +129,15 @@ class TraceEnricher:
         group_name: str,
         template: StatementTemplate,
         trace: Trace,
+        rules_values: Sequence["RuleValues"] | None = None,
     ) -> JsonType:
         """Get enriched data based on the given template.
 
         :param group_name: The group name of the template
         :param template: The template to use for enrichment
         :param trace: The trace that needs to be enriched
+        :param rules_values: The values already extracted from the trace for each rule
+            of the template, to not look the rule locations up again
         :return: The enriched data
         """
         log_context = {
@@ -41,52 +146,65 @@ class TraceEnricher:
         }
         self.logger.debug("Start enrich trace", log_context)
 
-        # Build enriched data with template data
-        enriched_data = {
-            "verb.id": str(template.verb),
-            "verb.display.en-US": template.pref_label.en,
-            "object.definition.type": str(template.object_activity_type),
-            "context.contextActivities.category": [
-                {
-                    "id": f"{CONTEXT_ACTIVITIES_CATEGORY_ID}/{group_name}",
-                    "definition": {
-                        "type": CONTEXT_ACTIVITIES_CATEGORY_DEFINITION_TYPE,
-                    },
-                },
-            ],
-        }
+        enrichment = self.get_template_enrichment(
+            group_name=group_name,
+            template=template,
+        )
+        filled_rules = self._get_filled_rules(
+            enrichment=enrichment,
+            trace=trace,
+            rules_values=rules_values,
+        )
+        return enrichment.get_patch(filled_rules=filled_rules)
 
-        # Enriched more for rules with only one value
-        if template.rules:
-            enriched_data.update(
-                self._enrich_with_rules(template=template, trace=trace),
-            )
+    @classmethod
+    def get_template_enrichment(
+        cls,
+        group_name: str,
+        template: StatementTemplate,
+    ) -> TemplateEnrichment:
+        """Get the enrichment data of a template, computed on first use.
 
-        return get_nested_from_flat(flat_field=enriched_data)
+        The data is computed again for a template reloaded with the same id.
 
-    def _enrich_with_rules(self, template: StatementTemplate, trace: Trace) -> JsonType:
-        """Get enriched data based on the template's rules than contain only one value.
+        :param group_name: The group name of the template
+        :param template: The template to use for enrichment
+        :return: The enrichment data of the template
+        """
+        key = (group_name, str(template.id))
+        enrichment = cls._enrichments.get(key)
+        if enrichment is None or enrichment.template is not template:
+            enrichment = TemplateEnrichment.from_template(
+                group_name=group_name,
+                template=template,
+            )
+            cls._enrichments[key] = enrichment
+        return enrichment
+
+    def _get_filled_rules(
+        self,
+        enrichment: TemplateEnrichment,
+        trace: Trace,
+        rules_values: Sequence["RuleValues"] | None = None,
+    ) -> tuple[int, ...]:
+        """Get the rules filling their location, as it is missing in the trace.
 
-        :param template: The template to use for enrichment.
+        :param enrichment: The enrichment data of the template
         :param trace: The trace that needs to be enriched.
-        :return: The enriched data.
+        :param rules_values: The values already extracted from the trace for each rule.
+        :return: The indexes of the rules filling their location.
         """
-        enriched_data = {}
-        for rule in template.rules:
+        filled_rules = []
+        for index, rule_data in enumerate(enrichment.rules_data):
+            if rule_data is None:
+                continue
+            rule = enrichment.template.rules[index]
             if (
-                rule.presence
-                in {PresenceTypeEnum.RECOMMENDED, PresenceTypeEnum.INCLUDED}
-                and rule.location
-                and not JSONPathUtils.path_exists(path=rule.location, data=trace.data)
+                rules_values[index].location_found
+                if rules_values is not None
+                else JSONPathUtils.path_exists(path=rule.location, data=trace.data)
             ):
-                value = None
-                if rule.any and len(rule.any) == 1:
-                    value = rule.any[0]
-                elif rule.all and len(rule.all) == 1:
-                    value = rule.all[0]
-
-                if value:
-                    self.logger.debug("1-value rule found", {"rule": rule.location})
-                    rule_data = JSONPathUtils.path_to_dict(rule.location, value)
-                    deep_merge(target_dict=enriched_data, merge_dct=rule_data)
-        return enriched_data
+                continue
+            self.logger.debug("1-value rule found", {"rule": rule.location})
+            filled_rules.append(index)
+        return tuple(filled_rules)
@@ -1,4 +1,6 @@
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from app.common.common_types import JsonType
@@ -13,6 +15,7 @@ from app.profile_enricher.profiles.jsonld import (
     PresenceTypeEnum,
     StatementTemplate,
     StatementTemplateRule,
+    to_hashable,
 )
 from app.profile_enricher.utils.jsonpath import JSONPathUtils
 
@@ -20,6 +23,20 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
+@dataclass(frozen=True)
+class RuleValues:
+    """The values extracted from a trace for a template rule.
+
+    :param rule: The template rule
+    :param location_found: Whether the location of the rule matches anything in the trace
+    :param values: The values at the location of the rule, refined by its selector
+    """
+
+    rule: StatementTemplateRule
+    location_found: bool
+    values: list[Any]
+
+
 class TraceValidator:
     """Class responsible for validating traces against templates."""
 
@@ -29,7 +46,10 @@ class TraceValidator:
         :param logger: The logger instance for logging operations.
         """
         self.logger = logger
-        self.rule_checks: dict[str, Callable[[Iterable[Any], Iterable[Any]], bool]] = {
+        self.rule_checks: dict[
+            str,
+            Callable[[AbstractSet[Hashable], Iterable[Any]], bool],
+        ] = {
             "any": self._check_any,
             "all": self._check_all,
             "none": self._check_none,
@@ -90,6 +110,90 @@ class TraceValidator:
             ValidationRecommendation(**result.__dict__) for result in validation_results
         ]
 
+    def evaluate_rules(
+        self,
+        template: StatementTemplate,
+        rules_values: Iterable[RuleValues],
+    ) -> tuple[list[ValidationError], list[ValidationRecommendation]]:
+        """Validate a trace and generate its recommendations in a single pass over the rules.
+
+        :param template: The template to validate against
+        :param rules_values: The values extracted from the trace for each rule of the template
+        :return: The ValidationError and the ValidationRecommendation objects of the trace
+        """
+        log_context = {"template": template.id}
+        self.logger.debug("Start trace rules evaluation", log_context)
+
+        rule_types = set(PresenceTypeEnum)
+        errors: list[ValidationError] = []
+        recommendations: list[ValidationRecommendation] = []
+        for rule_values in rules_values:
+            validation_results = self._validate_rule(
+                rule=rule_values.rule,
+                values=rule_values.values,
+                rule_types=rule_types,
+            )
+            if rule_values.rule.presence == PresenceTypeEnum.RECOMMENDED:
+                recommendations.extend(
+                    ValidationRecommendation(**result.__dict__)
+                    for result in validation_results
+                )
+            else:
+                errors.extend(
+                    ValidationError(**result.__dict__) for result in validation_results
+                )
+
+        if not errors:
+            self.logger.debug("Trace validated successfully", log_context)
+        if not recommendations:
+            self.logger.debug("No trace recommendations", log_context)
+
+        return errors, recommendations
+
+    def get_rules_values(
+        self,
+        template: StatementTemplate,
+        data: JsonType,
+    ) -> list[RuleValues]:
+        """Extract the values of a trace for each rule of a template.
+
+        :param template: The template containing the rules
+        :param data: The trace data to extract values from
+        :return: The extracted values, in the order of the template rules
+        """
+        return [
+            self._get_rule_values(rule=rule, data=data) for rule in template.rules or []
+        ]
+
+    def update_rules_values(
+        self,
+        rules_values: Sequence[RuleValues],
+        data: JsonType,
+        patch: Mapping[str, Any],
+    ) -> list[RuleValues]:
+        """Extract again the values of the rules whose location was changed by a patch.
+
+        A rule is extracted again when its location and a patched field are on the same branch,
+        the other rules keep their values.
+
+        :param rules_values: The values extracted from the trace before it was patched
+        :param data: The patched trace data
+        :param patch: The nested data merged in the trace
+        :return: The values of the rules in the patched trace, in the same order
+        """
+        patched_paths = list(self._iter_patched_paths(patch=patch))
+        return [
+            (
+                self._get_rule_values(rule=rule_values.rule, data=data)
+                if self._is_location_patched(
+                    location=rule_values.rule.location,
+                    patched_paths=patched_paths,
+                )
+                else rule_values
+            )
+            for rule_values in rules_values
+        ]
+
     def _apply_rules(
         self,
         template: StatementTemplate,
@@ -103,18 +207,15 @@ class TraceValidator:
         :param rule_types: A set of PresenceTypeEnum values indicating which types of rules to apply
         :return: A list of ValidationResult objects representing the outcome of applying the rules
         """
-        if not template.rules:
-            return []
-
         validation_results: list[ValidationResult] = []
 
-        for rule in template.rules:
-            # Apply the JSONPath to retrieve the field values to check
-            values = self._get_values_for_rule(rule=rule, trace=trace)
-
-            # Validate the rule
+        for rule_values in self.get_rules_values(template=template, data=trace.data):
             validation_results.extend(
-                self._validate_rule(rule=rule, values=values, rule_types=rule_types),
+                self._validate_rule(
+                    rule=rule_values.rule,
+                    values=rule_values.values,
+                    rule_types=rule_types,
+                ),
             )
 
         return validation_results
@@ -168,7 +269,10 @@ class TraceValidator:
         # Check the "any" / "all" / "none" rules
         for check_type, check_method in self.rule_checks.items():
             rule_values = getattr(rule, check_type)
-            if rule_values and not check_method(rule_values, values):
+            if rule_values and not check_method(
+                rule.get_values_set(check_type=check_type),
+                values,
+            ):
                 self.logger.debug(
                     "Found rule presence validation",
                     {**log_context, "type": check_type},
@@ -190,56 +294,57 @@ class TraceValidator:
         return validation_results
 
     @staticmethod
-    def _check_any(any_values: Iterable[Any], values: Iterable[Any]) -> bool:
+    def _check_any(any_values: AbstractSet[Hashable], values: Iterable[Any]) -> bool:
         """Check if any of the required values are present.
 
-        :param any_values: The required values
+        :param any_values: The hashable forms of the required values
         :param values: The values to check
         :return: True if any required value is present, False otherwise
         """
-        return any(v in any_values for v in values)
+        return any(to_hashable(v) in any_values for v in values)
 
     @staticmethod
-    def _check_all(all_values: Iterable[Any], values: Iterable[Any]) -> bool:
+    def _check_all(all_values: AbstractSet[Hashable], values: Iterable[Any]) -> bool:
         """Check if all the required values are present.
 
-        :param all_values: The required values
+        :param all_values: The hashable forms of the required values
         :param values: The values to check
         :return: True if all required values are present, False otherwise
         """
-        return all(v in values for v in all_values)
+        return all_values <= {to_hashable(v) for v in values}
 
     @staticmethod
-    def _check_none(none_values: Iterable[Any], values: Iterable[Any]) -> bool:
+    def _check_none(none_values: AbstractSet[Hashable], values: Iterable[Any]) -> bool:
         """Check if none of the prohibited values are present.
 
-        :param none_values: The prohibited values
+        :param none_values: The hashable forms of the prohibited values
         :param values: The values to check
         :return: True if no prohibited value is present, False otherwise
         """
-        return not any(v in none_values for v in values)
+        return none_values.isdisjoint(to_hashable(v) for v in values)
 
-    def _get_values_for_rule(
+    def _get_rule_values(
         self,
         rule: StatementTemplateRule,
-        trace: Trace,
-    ) -> list[Any]:
+        data: JsonType,
+    ) -> RuleValues:
         """Extract values from the trace that are relevant to a specific rule.
 
         This method applies the JSONPath specified in the rule to the trace,
         and if a selector is present, further refines the extracted values.
 
-        :param trace: The trace data to extract values from
         :param rule: The StatementTemplateRule specifying how to extract values
-        :return: A list of extracted values relevant to the rule
+        :param data: The trace data to extract values from
+        :return: The extracted values relevant to the rule
         """
-        values = self._apply_jsonpath(data=trace.data, path=rule.location)
+        results = JSONPathUtils.compile_jsonpath(rule.location).find(data)
+        values = self._flatten_results(results=results)
         if rule.selector:
             values = self._apply_selector(values=values, selector=rule.selector)
-        return values
+        return RuleValues(rule=rule, location_found=bool(results), values=values)
 
-    @staticmethod
-    def _apply_jsonpath(data: JsonType, path: str) -> list[Any]:
+    @classmethod
+    def _apply_jsonpath(cls, data: JsonType, path: str) -> list[Any]:
         """Apply a JSONPath expression to data and return the results.
 
         :param data: The data to apply the JSONPath to
@@ -247,16 +352,58 @@ class TraceValidator:
         :return: The results of applying the JSONPath
         :raises ValueError: If the JSONPath is invalid
         """
-        results = JSONPathUtils.parse_jsonpath(path).find(data)
-        # Flatten the list if the result is a list of lists
+        return cls._flatten_results(
+            results=JSONPathUtils.compile_jsonpath(path).find(data),
+        )
+
+    @staticmethod
+    def _flatten_results(results: Iterable[Any]) -> list[Any]:
+        """Flatten the values matched by a JSONPath expression which are lists.
+
+        :param results: The values matched by a JSONPath expression
+        :return: The flattened values
+        """
         return [
             item
             for result in results
-            for item in (
-                result.value if isinstance(result.value, list) else [result.value]
-            )
+            for item in (result if isinstance(result, list) else [result])
         ]
 
+    @classmethod
+    def _iter_patched_paths(
+        cls,
+        patch: Mapping[str, Any],
+        prefix: tuple[str, ...] = (),
+    ) -> Iterator[tuple[str, ...]]:
+        """Iterate over the keys leading to the values set by a nested patch.
+
+        :param patch: The nested patch
+        :param prefix: The keys leading to the patch
+        :return: An iterator over the keys of each patched value
+        """
+        for key, value in patch.items():
+            if isinstance(value, Mapping) and value:
+                yield from cls._iter_patched_paths(patch=value, prefix=(*prefix, key))
+            else:
+                yield (*prefix, key)
+
+    @staticmethod
+    def _is_location_patched(
+        location: str,
+        patched_paths: Iterable[tuple[str, ...]],
+    ) -> bool:
+        """Check whether the values at a location may have been changed by a patch.
+
+        :param location: The JSONPath location of a rule
+        :param patched_paths: The keys of each patched value
+        :return: True if the location and a patched value are on the same branch
+        """
+        location_prefix = JSONPathUtils.get_static_prefix(path=location)
+        return any(
+            location_prefix[: len(path)] == path[: len(location_prefix)]
+            for path in patched_paths
+        )
+
     def _apply_selector(self, values: Sequence[Any], selector: str) -> list[Any]:
         """Apply a selector to a sequence of values and return the results.
 
@@ -0,0 +1,118 @@
+from time import perf_counter
+
+from dotenv import load_dotenv
+
+from app.infrastructure.config.envconfig import EnvConfig
+from app.infrastructure.logging.jsonlogger import JsonLogger
+from app.profile_enricher.exceptions import ProfilerError
+from app.profile_enricher.repositories.jsonld.profile_loader import ProfileLoader
+from app.profile_enricher.utils.jsonpath import JSONPathUtils
+
+ITERATIONS = 2000
+
+# A statement with values at the usual locations of the DASES profiles rules
+STATEMENT = {
+    "actor": {
+        "objectType": "Agent",
+        "account": {"name": "learner", "homePage": "https://lms.example.com"},
+    },
+    "verb": {
+        "id": "https://w3id.org/xapi/netc/verbs/accessed",
+        "display": {"en-US": "accessed"},
+    },
+    "object": {
+        "id": "https://lms.example.com/course/1",
+        "definition": {
+            "type": "https://w3id.org/xapi/acrossx/activities/webpage",
+            "name": {"en": "Course"},
+            "extensions": {"https://w3id.org/xapi/acrossx/extensions/type": "course"},
+        },
+    },
+    "result": {"completion": True, "success": True, "score": {"scaled": 0.8}},
+    "context": {
+        "contextActivities": {
+            "parent": [{"id": "https://lms.example.com/program/1"}],
+            "category": [
+                {
+                    "id": "https://w3id.org/xapi/lms",
+                    "definition": {
+                        "type": "http://adlnet.gov/expapi/activities/profile",
+                    },
+                },
+            ],
+        },
+        "extensions": {"http://schema.dases.eu/xapi/profile/common/extensions/x": 1},
+    },
+    "timestamp": "2024-01-01T00:00:00Z",
+}
+
+
+def benchmark(paths: list[str], iterations: int = ITERATIONS) -> tuple[float, float]:
+    """Time the evaluation of JSONPath expressions with jsonpath_ng and compiled.
+
+    :param paths: The JSONPath expressions to evaluate on the statement
+    :param iterations: The number of evaluations of all the expressions
+    :return: The durations with jsonpath_ng and with the compiled expressions, in seconds
+    """
+    parsed = [JSONPathUtils.parse_jsonpath(path) for path in paths]
+    compiled = [JSONPathUtils.compile_jsonpath(path) for path in paths]
+
+    start = perf_counter()
+    for _ in range(iterations):
+        for expression in parsed:
+            [match.value for match in expression.find(STATEMENT)]
+    jsonpath_ng_duration = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(iterations):
+        for compiled_path in compiled:
+            compiled_path.find(STATEMENT)
+    compiled_duration = perf_counter() - start
+
+    return jsonpath_ng_duration, compiled_duration
+
+
+def main() -> None:
+    """Main function to run the benchmark on the rules of the configured profiles."""
+    load_dotenv(dotenv_path=".env", verbose=True)
+    env_config = EnvConfig()
+
+    json_logger = JsonLogger(name=__name__, level=env_config.get_log_level())
+    profile_loader = ProfileLoader(logger=json_logger, config=env_config)
+
+    paths: set[str] = set()
+    for profile_name in env_config.get_profiles_names():
+        try:
+            profile = profile_loader.load_profile(group_name=profile_name)
+        except ProfilerError as e:
+            json_logger.exception(
+                "Failed to load profile",
+                e,
+                {"profile": profile_name},
+            )
+            continue
+        for template in profile.templates or []:
+            for rule in template.rules or []:
+                paths.add(rule.location)
+                if rule.selector:
+                    paths.add(rule.selector)
+
+    compiled_paths = [
+        path for path in paths if JSONPathUtils.compile_jsonpath(path).steps is not None
+    ]
+    jsonpath_ng_duration, compiled_duration = benchmark(paths=sorted(paths))
+    json_logger.info(
+        "JSONPath benchmark completed",
+        {
+            "paths": len(paths),
+            "compiled_paths": len(compiled_paths),
+            "iterations": ITERATIONS,
+            "jsonpath_ng_seconds": round(jsonpath_ng_duration, 4),
+            "compiled_seconds": round(compiled_duration, 4),
+            "speedup": round(jsonpath_ng_duration / compiled_duration, 1),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,141 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from functools import cache
-from typing import Any
+from typing import Any, Self
 
 import jsonpath_ng
+from jsonpath_ng.jsonpath import Child, Fields, Root, Slice, This
+
+type PathStep = str | None
+
+
+@dataclass(frozen=True)
+class CompiledJSONPath:
+    """A JSONPath expression compiled to the plain steps leading to its values.
+
+    Expressions made of fields (`$.a.b`, `$.a['iri']`) and `[*]` only are evaluated directly
+    on the JSON data, without building jsonpath_ng matches. The other expressions are evaluated
+    with jsonpath_ng.
+
+    :param expression: The parsed JSONPath expression
+    :param steps: The fields to follow, None for `[*]`, or None if the expression is not compiled
+    """
+
+    expression: jsonpath_ng.JSONPath
+    steps: tuple[PathStep, ...] | None = None
+
+    @classmethod
+    def from_expression(cls, expression: jsonpath_ng.JSONPath) -> Self:
+        """Compile a parsed JSONPath expression, if made of supported steps only.
+
+        :param expression: The parsed JSONPath expression
+        :return: The compiled JSONPath expression
+        """
+        base, nodes = _unchain(expression=expression)
+        if not isinstance(base, Root | This):
+            return cls(expression=expression)
+
+        steps: list[PathStep] = []
+        for node in nodes:
+            step = _get_step(node=node)
+            if step is _UNSUPPORTED:
+                return cls(expression=expression)
+            steps.append(step)
+        return cls(expression=expression, steps=tuple(steps))
+
+    def find(self, data: Any) -> list[Any]:
+        """Get the values matched by the expression.
+
+        The values are the ones of the matches found by jsonpath_ng, in the same order.
+
+        :param data: The data to apply the JSONPath to
+        :return: The matched values
+        """
+        if self.steps is None:
+            return [match.value for match in self.expression.find(data)]
+
+        # Follow the fields while there is a single value, the usual case
+        value = data
+        for index, step in enumerate(self.steps):
+            if step is None:
+                return self._find_in_values(values=[value], start=index)
+            if not isinstance(value, dict) or step not in value:
+                return []
+            value = value[step]
+        return [value]
+
+    def _find_in_values(self, values: list[Any], start: int) -> list[Any]:
+        """Get the values matched by the steps of the expression from a given step.
+
+        :param values: The values matched by the previous steps
+        :param start: The index of the first step to apply
+        :return: The matched values
+        """
+        for step in self.steps[start:]:
+            if step is None:
+                values = [item for value in values for item in _get_items(value=value)]
+            else:
+                values = [
+                    value[step]
+                    for value in values
+                    if isinstance(value, dict) and step in value
+                ]
+            if not values:
+                break
+        return values
+
+
+_UNSUPPORTED = object()
+
+
+def _unchain(
+    expression: jsonpath_ng.JSONPath,
+) -> tuple[jsonpath_ng.JSONPath, list[jsonpath_ng.JSONPath]]:
+    """Split a JSONPath expression into its base node and the nodes applied to it, in order.
+
+    :param expression: The parsed JSONPath expression
+    :return: The base node and the nodes applied to it
+    """
+    nodes = []
+    node = expression
+    while isinstance(node, Child):
+        nodes.append(node.right)
+        node = node.left
+    nodes.reverse()
+    return node, nodes
+
+
+def _get_step(node: jsonpath_ng.JSONPath) -> PathStep | object:
+    """Get the plain step of a JSONPath node.
+
+    :param node: The JSONPath node, applied to the result of the previous nodes
+    :return: The field name, None for `[*]`, or _UNSUPPORTED for any other node
+    """
+    if isinstance(node, Fields) and len(node.fields) == 1 and node.fields[0] != "*":
+        return node.fields[0]
+    if (
+        isinstance(node, Slice)
+        and node.start is None
+        and node.end is None
+        and node.step is None
+    ):
+        return None
+    return _UNSUPPORTED
+
+
+def _get_items(value: Any) -> Sequence[Any]:
+    """Get the items matched by `[*]` on a value, as jsonpath_ng does.
+
+    Empty values match nothing, and objects or scalars match themselves.
+
+    :param value: The value to get the items of
+    :return: The matched items
+    """
+    if not value:
+        return []
+    if isinstance(value, dict | int | str):
+        return [value]
+    return [value[index] for index in range(len(value))]
 
 
 class JSONPathUtils:
@@ -22,6 +155,42 @@ class JSONPathUtils:
         except Exception as e:
             raise ValueError(f"Invalid JSONPath: {path}") from e
 
+    @staticmethod
+    @cache
+    def compile_jsonpath(path: str) -> CompiledJSONPath:
+        """Compile and cache a JSONPath expression.
+
+        :param path: The JSONPath expression to compile
+        :return: Compiled JSONPath object
+        :raises ValueError: If the JSONPath is invalid
+        """
+        return CompiledJSONPath.from_expression(
+            expression=JSONPathUtils.parse_jsonpath(path),
+        )
+
+    @staticmethod
+    @cache
+    def get_static_prefix(path: str) -> tuple[str, ...]:
+        """Get the keys leading to the first non-static part of a JSONPath expression.
+
+        Example: ('context', 'contextActivities', 'category') for $.context.contextActivities.category[*].id
+
+        :param path: The JSONPath expression
+        :return: The keys of the static prefix of the path, empty if the path doesn't start with one
+        :raises ValueError: If the JSONPath is invalid
+        """
+        base, nodes = _unchain(expression=JSONPathUtils.parse_jsonpath(path))
+        if not isinstance(base, Root):
+            return ()
+
+        prefix: list[str] = []
+        for node in nodes:
+            step = _get_step(node=node)
+            if not isinstance(step, str):
+                break
+            prefix.append(step)
+        return tuple(prefix)
+
     @staticmethod
     def path_exists(path: str, data: Mapping[str, Any]) -> bool:
         """Check if a value exists at the specified JSONPath.
@@ -30,7 +199,7 @@ class JSONPathUtils:
         :param path: The JSONPath expression
         :return: True if a value exists, False otherwise
         """
-        return bool(JSONPathUtils.parse_jsonpath(path).find(data))
+        return bool(JSONPathUtils.compile_jsonpath(path).find(data))
 
     @staticmethod
     def path_to_dict(path: str, value: str) -> dict[str, Any]:
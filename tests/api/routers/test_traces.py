@@ -0,0 +1,117 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.main import app
+from app.mapper.mapper import Mapper
+
+MATOMO_TRACE = {
+    "visitorId": "1",
+    "siteName": "site",
+    "actionDetails": {
+        "title": "Home",
+        "url": "http://example.com",
+        "timestamp": 1,
+        "timeSpent": 1,
+    },
+    "interactions": 1,
+    "languageCode": "en",
+    "browserName": "Firefox",
+    "visitIp": "127.0.0.1",
+}
+XAPI_STATEMENT = {
+    "actor": {"account": {"name": "bob", "homePage": "https://lms.example.com"}},
+    "verb": {"id": "http://adlnet.gov/expapi/verbs/attempted"},
+    "object": {"id": "https://lms.example.com/page"},
+}
+BATCH_ITEMS = [
+    {"input_trace": MATOMO_TRACE},
+    {"input_trace": {"unknown": 1}},
+    {"input_trace": XAPI_STATEMENT},
+    {"input_trace": MATOMO_TRACE, "input_format": "xapi"},
+    {"input_trace": XAPI_STATEMENT, "input_format": "xapi"},
+]
+
+
+class MappingFailedError(ValueError):
+    """Error of a known exception subclass, raised by a failing conversion."""
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """Create a client of the application, without any profile to download."""
+    monkeypatch.setenv("PROFILES_NAMES", "")
+    monkeypatch.setenv("PROFILES_BASE_PATH", str(tmp_path / "profiles"))
+    monkeypatch.setenv("MAPPINGS_REGISTRY_PATH", str(tmp_path / "mappings"))
+    monkeypatch.setenv("LOG_LEVEL", "critical")
+    with TestClient(app) as client:
+        yield client
+
+
+class TestTransformInputTraces:
+    """Test suite for the /convert/batch endpoint."""
+
+    def test_results_in_order(self, client: TestClient) -> None:
+        """Test that the results of a batch of mixed formats follow the input order."""
+        response = client.post("/convert/batch", json={"traces": BATCH_ITEMS})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [
+            result["meta"] and result["meta"]["input_format"] for result in results
+        ] == [
+            "matomo",
+            None,
+            "xapi",
+            None,
+            "xapi",
+        ]
+        assert results[0]["output_trace"]["actor"]["account"]["name"] == "1"
+        assert results[2]["output_trace"]["actor"]["account"]["name"] == "bob"
+
+    def test_errors_isolated(self, client: TestClient) -> None:
+        """Test that each trace gives the result it gives on its own."""
+        results = client.post("/convert/batch", json={"traces": BATCH_ITEMS}).json()[
+            "results"
+        ]
+
+        for item, result in zip(BATCH_ITEMS, results, strict=True):
+            response = client.post("/convert", json=item)
+            if response.status_code == 200:
+                assert result["error"] is None
+                assert result["meta"] == response.json()["meta"]
+            else:
+                assert result["output_trace"] is None
+                assert result["error"] == {
+                    "status_code": response.status_code,
+                    "cause": None,
+                    **response.json(),
+                }
+
+    def test_error_subclass_status(
+        self,
+        client: TestClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the error of a known exception subclass has the status of its parent."""
+        convert = Mapper.convert
+
+        def failing_convert(self: Mapper, **kwargs: object) -> object:
+            if kwargs["input_trace"].data == XAPI_STATEMENT:
+                raise MappingFailedError("mapping failed")
+            return convert(self, **kwargs)
+
+        monkeypatch.setattr(Mapper, "convert", failing_convert)
+        items = [{"input_trace": MATOMO_TRACE}, {"input_trace": XAPI_STATEMENT}]
+
+        results = client.post("/convert/batch", json={"traces": items}).json()[
+            "results"
+        ]
+        response = client.post("/convert", json=items[1])
+
+        assert results[0]["error"] is None
+        assert response.status_code == 400
+        assert results[1]["error"]["status_code"] == response.status_code
+        assert results[1]["error"]["detail"] == response.json()["detail"]
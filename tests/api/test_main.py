@@ -0,0 +1,24 @@
+from unittest.mock import Mock
+
+from app.api.main import warmup
+from app.api.readiness import Readiness
+
+
+class TestWarmup:
+    """Test suite for the warmup of the application."""
+
+    def test_ready_after_failure(self, mock_logger: Mock) -> None:
+        """Test that the application is flagged as ready even if the warmup fails."""
+        readiness = Readiness()
+        mapper = Mock()
+        mapper.warmup.side_effect = OSError("disk error")
+
+        warmup(
+            mapper=mapper,
+            profile_registry=Mock(),
+            readiness=readiness,
+            logger=mock_logger,
+        )
+
+        assert readiness.is_ready
+        mock_logger.exception.assert_called_once()
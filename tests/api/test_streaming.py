@@ -0,0 +1,119 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import anyio
+import pytest
+
+from app.api.streaming import iter_lines_batches, iterate_in_thread
+
+
+async def iter_chunks(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    """Yield the chunks of a stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect_batches(chunks: list[bytes]) -> list[list[bytes]]:
+    """Collect the batches of lines of a stream."""
+    return [batch async for batch in iter_lines_batches(chunks=iter_chunks(chunks))]
+
+
+class TestIterLinesBatches:
+    """Test suite for iter_lines_batches function."""
+
+    @pytest.mark.parametrize(
+        ("chunks", "expected_batches"),
+        [
+            ([b'{"a": 1}\n{"b": 2}\n'], [[b'{"a": 1}', b'{"b": 2}']]),
+            ([b'{"a": 1}\n{"b"', b": 2}\n"], [[b'{"a": 1}'], [b'{"b": 2}']]),
+            ([b'{"a"', b": 1}", b'\n{"b": 2}'], [[b'{"a": 1}'], [b'{"b": 2}']]),
+            ([b'\n  \n{"a": 1}\r\n', b"\n"], [[b'{"a": 1}\r']]),
+            ([b"", b"\n"], []),
+        ],
+    )
+    def test_batches(
+        self,
+        chunks: list[bytes],
+        expected_batches: list[list[bytes]],
+    ) -> None:
+        """Test that the lines split across chunks are joined, blank lines skipped."""
+        assert asyncio.run(collect_batches(chunks=chunks)) == expected_batches
+
+
+class TestIterateInThread:
+    """Test suite for iterate_in_thread function."""
+
+    def test_chunks(self) -> None:
+        """Test that the texts are yielded in chunks of about the chunk size."""
+        texts = [f"line {i}\n" for i in range(100)]
+
+        async def collect() -> list[bytes]:
+            return [
+                chunk
+                async for chunk in iterate_in_thread(
+                    texts=iter(texts),
+                    chunk_size=50,
+                    max_buffered_chunks=2,
+                )
+            ]
+
+        chunks = asyncio.run(collect())
+
+        assert b"".join(chunks) == "".join(texts).encode()
+        assert all(len(chunk) >= 50 for chunk in chunks[:-1])
+        assert all(len(chunk) < 50 + 8 for chunk in chunks)
+
+    def test_stop_producing(self) -> None:
+        """Test that the thread stops producing once the chunks are not consumed."""
+        produced: list[int] = []
+
+        def generate() -> Iterator[str]:
+            for i in range(1000):
+                produced.append(i)
+                yield f"{i}\n"
+
+        async def consume_first() -> bytes:
+            chunks = iterate_in_thread(
+                texts=generate(),
+                chunk_size=1,
+                max_buffered_chunks=1,
+            )
+            first = await anext(chunks)
+            await chunks.aclose()
+            return first
+
+        assert asyncio.run(consume_first()) == b"0\n"
+        assert len(produced) < 10
+
+    def test_error_raised(self) -> None:
+        """Test that an error of the texts is raised after the chunks produced before."""
+
+        def generate() -> Iterator[str]:
+            yield "first\n"
+            raise ValueError("Invalid line")
+
+        async def consume() -> bytes:
+            chunks = iterate_in_thread(texts=generate(), chunk_size=1)
+            first = await anext(chunks)
+            with pytest.raises(ValueError, match="Invalid line"):
+                await anext(chunks)
+            return first
+
+        assert asyncio.run(consume()) == b"first\n"
+
+    def test_limiter(self) -> None:
+        """Test that the texts are produced in a thread of the given limiter only."""
+
+        async def collect_borrowed_tokens() -> list[tuple[int, int]]:
+            limiter = anyio.CapacityLimiter(1)
+            default_limiter = anyio.to_thread.current_default_thread_limiter()
+            return [
+                (limiter.borrowed_tokens, default_limiter.borrowed_tokens)
+                async for _ in iterate_in_thread(
+                    texts=iter(["first\n", "second\n"]),
+                    chunk_size=1,
+                    limiter=limiter,
+                )
+            ]
+
+        assert anyio.run(collect_borrowed_tokens)[0] == (1, 0)
@@ -0,0 +1,56 @@
+from typing import Any
+
+import pytest
+
+from app.common.models.format_discriminator import (
+    FORMAT_DISCRIMINATORS,
+    discriminate_xapi,
+)
+from app.common.models.trace_formats import (
+    IMSCaliperSensorModel1_1,
+    IMSCaliperSensorModel1_2,
+)
+
+CONTEXT_1_1 = "http://purl.imsglobal.org/ctx/caliper/v1p1"
+CONTEXT_1_2 = "http://purl.imsglobal.org/ctx/caliper/v1p2"
+
+
+class TestFormatDiscriminator:
+    """Test suite for format discriminators."""
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({"dataVersion": CONTEXT_1_1}, (True, False)),
+            ({"dataVersion": CONTEXT_1_2}, (False, True)),
+            (
+                {
+                    "dataVersion": "1.2",
+                    "data": [{"type": "Event", "@context": CONTEXT_1_2}],
+                },
+                (False, True),
+            ),
+            ({"dataVersion": "1.2", "data": [{"@context": CONTEXT_1_2}]}, (None, None)),
+            ({"dataVersion": "1.2", "data": [{"type": "Event"}]}, (None, None)),
+            ({"dataVersion": ["list"], "data": "text"}, (None, None)),
+            (["dataVersion"], (False, False)),
+        ],
+    )
+    def test_caliper(self, data: Any, expected: tuple[bool | None, ...]) -> None:
+        """Test that a Caliper version is identified by its data version, else its context."""
+        assert (
+            FORMAT_DISCRIMINATORS[IMSCaliperSensorModel1_1](data),
+            FORMAT_DISCRIMINATORS[IMSCaliperSensorModel1_2](data),
+        ) == expected
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({"actor": {}, "verb": {}, "object": {}, "id": "1"}, True),
+            ({"actor": {}, "verb": {}}, False),
+            (["actor", "verb", "object"], False),
+        ],
+    )
+    def test_xapi(self, data: Any, expected: bool) -> None:
+        """Test that an xAPI statement is identified by its actor, verb and object."""
+        assert discriminate_xapi(data=data) is expected
@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
+
+from app.common.models.format_signature import FormatSignature, get_format_signature
+
+
+class RequiredAliasModel(BaseModel):
+    visitor_id: str = Field(alias="visitorId")
+    name: str
+    country: str | None = None
+
+
+class ForbidModel(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    learner_id: str | None = Field(default=None, alias="learnerId")
+
+
+class AliasChoicesModel(BaseModel):
+    name: str = Field(validation_alias=AliasChoices("name", "fullName"))
+
+
+class BeforeValidatorModel(BaseModel):
+    name: str
+
+    @model_validator(mode="before")
+    @classmethod
+    def rename(cls, values: Any) -> Any:
+        return {"name": values.get("fullName")}
+
+
+class TestFormatSignature:
+    """Test suite for format signatures."""
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({"visitorId": "1", "name": "bob"}, True),
+            ({"visitorId": "1", "name": "bob", "other": 1}, True),
+            ({"visitor_id": "1", "name": "bob"}, False),
+            ({"visitorId": "1"}, False),
+            (["visitorId", "name"], False),
+        ],
+    )
+    def test_required_keys(self, data: Any, expected: bool) -> None:
+        """Test that all the required keys must be present."""
+        signature = get_format_signature(model=RequiredAliasModel)
+
+        assert signature.may_match(data=data) is expected
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({}, True),
+            ({"learnerId": "1"}, True),
+            ({"learner_id": "1"}, True),
+            ({"learner_id": "1", "other": 1}, False),
+        ],
+    )
+    def test_allowed_keys(self, data: Any, expected: bool) -> None:
+        """Test that extra keys are rejected for models forbidding them."""
+        signature = get_format_signature(model=ForbidModel)
+
+        assert signature.may_match(data=data) is expected
+
+    @pytest.mark.parametrize("model", [AliasChoicesModel, BeforeValidatorModel])
+    def test_not_exact(self, model: type[BaseModel]) -> None:
+        """Test that models which may change their input keys match any trace."""
+        signature = get_format_signature(model=model)
+
+        assert signature == FormatSignature(is_exact=False)
+        assert signature.may_match(data={"fullName": "bob"})
@@ -0,0 +1,180 @@
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from app.common.exceptions import InvalidTraceError
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace
+from app.common.models.trace_formats import MatomoDataModel
+
+MATOMO_TRACE = {
+    "visitorId": "1",
+    "siteName": "site",
+    "actionDetails": {
+        "title": "Home",
+        "url": "http://example.com",
+        "timestamp": 1,
+        "timeSpent": 1,
+    },
+    "interactions": 1,
+    "languageCode": "en",
+    "browserName": "Firefox",
+    "visitIp": "127.0.0.1",
+}
+XAPI_STATEMENT = {
+    "actor": {"account": {"name": "bob", "homePage": "https://lms.example.com"}},
+    "verb": {"id": "http://adlnet.gov/expapi/verbs/attempted"},
+    "object": {"id": "https://lms.example.com/page"},
+}
+CALIPER_ENVELOPE = {
+    "sensor": "https://example.com/sensors/1",
+    "dataVersion": "http://purl.imsglobal.org/ctx/caliper/v1p2",
+    "sendTime": "2024-04-26T14:30:01.000Z",
+    "data": [
+        {
+            "id": "urn:uuid:12345678-1234-5678-1234-567812345678",
+            "type": "NavigationEvent",
+            "action": "NavigatedTo",
+            "actor": {"id": "https://example.com/users/1", "type": "Person"},
+            "object": {"id": "https://example.com/pages/1", "type": "WebPage"},
+            "eventTime": "2024-04-26T14:30:00.000Z",
+        },
+    ],
+}
+
+
+@pytest.fixture
+def validated_formats(
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[CustomTraceFormatStrEnum]:
+    """Record the formats the traces are validated against."""
+    validated = []
+    get_format_model_instance = Trace.get_format_model_instance
+
+    def spy(trace_data: Any, trace_format: CustomTraceFormatStrEnum) -> BaseModel:
+        validated.append(trace_format)
+        return get_format_model_instance(
+            trace_data=trace_data,
+            trace_format=trace_format,
+        )
+
+    monkeypatch.setattr(Trace, "get_format_model_instance", staticmethod(spy))
+    return validated
+
+
+class TestTraceDetectFormat:
+    """Test suite for Trace.detect_format."""
+
+    def test_skip_formats_not_matching(
+        self,
+        validated_formats: list[CustomTraceFormatStrEnum],
+    ) -> None:
+        """Test that formats whose signature or discriminator don't match are not validated."""
+        assert Trace.detect_format(data={"unknown": 1}) is None
+        assert validated_formats == []
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (XAPI_STATEMENT, CustomTraceFormatStrEnum.XAPI),
+            (CALIPER_ENVELOPE, CustomTraceFormatStrEnum.IMSCALIPER1_2),
+        ],
+    )
+    def test_identified_format_validated_only(
+        self,
+        validated_formats: list[CustomTraceFormatStrEnum],
+        data: dict,
+        expected: CustomTraceFormatStrEnum,
+    ) -> None:
+        """Test that a format identified by its discriminator is the only one validated."""
+        assert Trace.detect_format(data=data) == expected
+        assert validated_formats == [expected]
+
+    def test_ambiguous_formats_in_order(
+        self,
+        validated_formats: list[CustomTraceFormatStrEnum],
+    ) -> None:
+        """Test that the formats are validated in order when none is identified."""
+        data = {**CALIPER_ENVELOPE, "dataVersion": "1.2"}
+
+        assert Trace.detect_format(data=data) == CustomTraceFormatStrEnum.IMSCALIPER1_1
+        assert validated_formats == [CustomTraceFormatStrEnum.IMSCALIPER1_1]
+
+    def test_ruled_out_format_not_validated(
+        self,
+        validated_formats: list[CustomTraceFormatStrEnum],
+    ) -> None:
+        """Test that an invalid trace is not validated against a format ruled out."""
+        data = {**CALIPER_ENVELOPE, "data": [{"type": "Unknown"}]}
+
+        assert Trace.detect_format(data=data) is None
+        assert validated_formats == [CustomTraceFormatStrEnum.IMSCALIPER1_2]
+
+    def test_detect_matomo(self) -> None:
+        """Test that a Matomo trace is still detected."""
+        assert Trace.detect_format(data=MATOMO_TRACE) == CustomTraceFormatStrEnum.MATOMO
+
+
+class TestTraceModel:
+    """Test suite for the format model instance kept with a Trace."""
+
+    @pytest.mark.parametrize("trace_format", [None, CustomTraceFormatStrEnum.MATOMO])
+    def test_model_validated_once(
+        self,
+        validated_formats: list[CustomTraceFormatStrEnum],
+        trace_format: CustomTraceFormatStrEnum | None,
+    ) -> None:
+        """Test that the model validated on creation is reused."""
+        trace = Trace(data=MATOMO_TRACE, format=trace_format)
+
+        assert isinstance(trace.model, MatomoDataModel)
+        assert trace.model is trace.model
+        assert validated_formats == [CustomTraceFormatStrEnum.MATOMO]
+
+    def test_from_validated_model(
+        self,
+        validated_formats: list[CustomTraceFormatStrEnum],
+    ) -> None:
+        """Test that a trace created from a validated model is not validated again."""
+        model = MatomoDataModel(**MATOMO_TRACE)
+
+        trace = Trace.from_validated_model(
+            data=MATOMO_TRACE,
+            trace_format=CustomTraceFormatStrEnum.MATOMO,
+            model=model,
+        )
+
+        assert trace.model is model
+        assert trace.format == CustomTraceFormatStrEnum.MATOMO
+        assert validated_formats == []
+
+    def test_model_validated_on_access(self) -> None:
+        """Test that a trace created without validation is validated on model access."""
+        trace = Trace.model_construct(
+            data={"unknown": 1},
+            format=CustomTraceFormatStrEnum.MATOMO,
+        )
+
+        with pytest.raises(InvalidTraceError):
+            _ = trace.model
+
+
+class TestTraceValidation:
+    """Test suite for the validation of a Trace."""
+
+    def test_validate_trace_instance(self) -> None:
+        """Test that an existing trace is validated as is."""
+        trace = Trace(data=MATOMO_TRACE)
+
+        assert Trace.model_validate(trace) is trace
+
+    def test_trace_field_from_instance(self) -> None:
+        """Test that a model field of type Trace accepts an existing trace."""
+
+        class TraceHolder(BaseModel):
+            t: Trace
+
+        trace = Trace(data=MATOMO_TRACE)
+
+        assert TraceHolder(t=trace).t is trace
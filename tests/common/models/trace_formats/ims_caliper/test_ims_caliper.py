@@ -0,0 +1,61 @@
+import json
+from types import ModuleType
+from typing import get_args
+
+import pytest
+from pydantic import ValidationError
+
+from app.common.models.trace_formats.base import ExtendedTypeBaseModel
+from app.common.models.trace_formats.ims_caliper import (
+    ims_caliper_1_1,
+    ims_caliper_1_2,
+)
+
+NAVIGATION_EVENT = {
+    "id": "urn:uuid:12345678-1234-5678-1234-567812345678",
+    "type": "NavigationEvent",
+    "action": "NavigatedTo",
+    "actor": {"id": "https://example.com/users/1", "type": "Person"},
+    "object": {"id": "https://example.com/pages/1", "type": "WebPage"},
+    "eventTime": "2024-04-26T14:30:00.000Z",
+}
+
+
+def build_envelope(*data: dict) -> dict:
+    """Build a Caliper envelope."""
+    return {
+        "sensor": "https://example.com/sensors/1",
+        "dataVersion": "http://purl.imsglobal.org/ctx/caliper/v1p2",
+        "sendTime": "2024-04-26T14:30:01.000Z",
+        "data": list(data),
+    }
+
+
+@pytest.mark.parametrize("version", [ims_caliper_1_1, ims_caliper_1_2])
+class TestIMSCaliperModel:
+    """Test suite for the IMSCaliperModel type dispatch of each Caliper version."""
+
+    def test_dispatch_table(self, version: ModuleType) -> None:
+        """Test that each type term is dispatched to a model accepting it."""
+        table = ExtendedTypeBaseModel.get_type_dispatch_table(
+            version.IMSCaliperModel.model_fields["data"].annotation,
+        )
+
+        assert table[version.TypeTermEnum.EVENT] is version.EventModel
+        for type_value, model in table.items():
+            assert type_value in get_args(model.model_fields["type"].annotation)
+
+    def test_data_dispatched(self, version: ModuleType) -> None:
+        """Test that the data are validated with the model of their type."""
+        envelope = version.IMSCaliperModel(**build_envelope(NAVIGATION_EVENT))
+
+        assert type(envelope.data[0]) is version.NavigationEventModel
+
+    @pytest.mark.parametrize("type_value", [["NavigationEvent"], {"a": 1}])
+    def test_unhashable_type(self, version: ModuleType, type_value: object) -> None:
+        """Test that an invalid type is a validation error."""
+        event = json.loads(json.dumps(NAVIGATION_EVENT))
+        event["type"] = type_value
+
+        with pytest.raises(ValidationError):
+            version.IMSCaliperModel(**build_envelope(event))
@@ -0,0 +1,140 @@
+from typing import Literal
+
+import pytest
+from pydantic import BaseModel, Field
+
+from app.common.models.trace_formats.base import ExtendedTypeBaseModel, FieldCandidates
+
+
+class ModelA(BaseModel):
+    name: str
+
+
+class ModelB(ModelA):
+    name: str = Field(default="default")
+    age: float
+
+
+class ModelC(ExtendedTypeBaseModel):
+    object_a: ModelA
+
+
+class EntityModel(ExtendedTypeBaseModel):
+    type: str
+    id: str
+
+
+class PersonModel(EntityModel):
+    type: Literal["Person"]
+
+
+class GroupModel(EntityModel):
+    type: Literal["Group", "Organization"] = "Group"
+
+
+class EventModel(ExtendedTypeBaseModel):
+    actor: EntityModel | str
+    members: list[EntityModel] = Field(default_factory=list)
+
+
+class TestExtendedTypeBaseModel:
+    """Test suite for ExtendedTypeBaseModel class."""
+
+    @pytest.mark.parametrize(
+        ("object_a", "expected_type"),
+        [
+            ({"age": 15}, ModelB),
+            ({"name": "bob"}, ModelA),
+        ],
+    )
+    def test_subclass_detection(
+        self,
+        object_a: dict,
+        expected_type: type[BaseModel],
+    ) -> None:
+        """Test that the subclass valid for the data is used."""
+        assert isinstance(ModelC(object_a=object_a).object_a, expected_type)
+
+    @pytest.mark.parametrize(
+        ("actor", "expected_type"),
+        [
+            ({"type": "Person", "id": "1"}, PersonModel),
+            ({"type": "Organization", "id": "1"}, GroupModel),
+            ({"type": "Software", "id": "1"}, EntityModel),
+        ],
+    )
+    def test_discriminator(
+        self,
+        actor: dict,
+        expected_type: type[BaseModel],
+    ) -> None:
+        """Test that the model is chosen from the `type` of the data."""
+        event = EventModel(actor=actor, members=[actor])
+
+        assert type(event.actor) is expected_type
+        assert type(event.members[0]) is expected_type
+
+    def test_not_a_dict(self) -> None:
+        """Test that values which are not dicts are validated as is."""
+        assert EventModel(actor="urn:actor").actor == "urn:actor"
+
+    def test_candidates_refreshed_on_new_subclass(self) -> None:
+        """Test that a subclass created after a first validation is a candidate."""
+        EventModel(actor={"type": "Person", "id": "1"})
+
+        class SoftwareModel(EntityModel):
+            type: Literal["Software"]
+
+        event = EventModel(actor={"type": "Software", "id": "1"})
+
+        assert type(event.actor) is SoftwareModel
+
+
+class TestFieldCandidates:
+    """Test suite for FieldCandidates class."""
+
+    @pytest.fixture
+    def candidates(self) -> FieldCandidates:
+        """Index the entity models."""
+        return FieldCandidates.from_models(
+            models=(EntityModel, PersonModel, GroupModel),
+        )
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ({"type": "Person"}, (PersonModel, EntityModel)),
+            ({"type": "Organization"}, (GroupModel, EntityModel)),
+            ({"type": "Unknown"}, (EntityModel,)),
+            ({}, (EntityModel, GroupModel)),
+            ({"type": 1}, (EntityModel, PersonModel, GroupModel)),
+        ],
+    )
+    def test_get_models(
+        self,
+        candidates: FieldCandidates,
+        value: dict,
+        expected: tuple[type[BaseModel], ...],
+    ) -> None:
+        """Test that only the models accepting the `type` of the value are tried."""
+        assert candidates.get_models(value=value) == expected
+
+
+class TestTypeDispatchTable:
+    """Test suite for ExtendedTypeBaseModel.get_type_dispatch_table."""
+
+    def test_first_declared_model(self) -> None:
+        """Test that each `type` is dispatched to the first model declaring it."""
+        table = ExtendedTypeBaseModel.get_type_dispatch_table(EntityModel | str)
+
+        assert table["Person"] is PersonModel
+        assert table["Group"] is GroupModel
+        assert table["Organization"] is GroupModel
+
+    def test_generated_once(self) -> None:
+        """Test that the table is generated once per annotation."""
+        annotation = list[EntityModel]
+
+        assert ExtendedTypeBaseModel.get_type_dispatch_table(
+            annotation,
+        ) is ExtendedTypeBaseModel.get_type_dispatch_table(annotation)
@@ -0,0 +1,52 @@
+import pytest
+
+from app.mapper.evaluator.cache import ExpressionCache
+
+
+class TestExpressionCache:
+    """Test suite for ExpressionCache class."""
+
+    def test_get_or_build_hit_and_miss(self) -> None:
+        """Test that the builder is only called on a cache miss."""
+        cache = ExpressionCache(maxsize=2)
+        calls = []
+
+        def builder() -> str:
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_build("key", builder) == "value"
+        assert cache.get_or_build("key", builder) == "value"
+
+        info = cache.info()
+        assert len(calls) == 1
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_least_recently_used_eviction(self) -> None:
+        """Test that the least recently used entry is evicted when full."""
+        cache = ExpressionCache(maxsize=2)
+        cache.get_or_build("a", lambda: 1)
+        cache.get_or_build("b", lambda: 2)
+        cache.get_or_build("a", lambda: 1)
+        cache.get_or_build("c", lambda: 3)
+
+        assert cache.info().currsize == 2
+        assert cache.get_or_build("b", lambda: "rebuilt") == "rebuilt"
+        assert cache.get_or_build("a", lambda: "rebuilt") == "rebuilt"
+
+    def test_builder_error_is_not_cached(self) -> None:
+        """Test that a failing builder does not store any entry."""
+        cache = ExpressionCache()
+
+        def failing_builder() -> None:
+            raise SyntaxError("invalid")
+
+        with pytest.raises(SyntaxError):
+            cache.get_or_build("key", failing_builder)
+
+        assert cache.info().currsize == 0
+
+    def test_invalid_maxsize(self) -> None:
+        """Test that a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError, match="positive integer"):
+            ExpressionCache(maxsize=0)
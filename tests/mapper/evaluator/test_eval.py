@@ -2,7 +2,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.mapper.evaluator.eval import LAMBDA_CACHE, EvalExpressionEvaluator
 from app.mapper.evaluator.exceptions import ExpressionEvaluationError
 
 
@@ -200,3 +200,41 @@ class TestEvalExpressionEvaluator:
         assert expression_evaluator.eval_lambda("lambda: no_args()") == 42
         assert expression_evaluator.eval_lambda("lambda: var_args(1, 2, 3)") == 6
         assert expression_evaluator.eval_lambda("lambda: keyword_args(a=1, b=2)") == 2
+
+    def test_eval_lambda_compiled_once(
+        self,
+        expression_evaluator: EvalExpressionEvaluator,
+    ) -> None:
+        """Test that a lambda is compiled once and reused on next calls."""
+        lambda_expr = "lambda x: x + 'compiled_once'"
+        before = LAMBDA_CACHE.info()
+
+        results = [
+            expression_evaluator.eval_lambda(lambda_expr, str(i)) for i in range(3)
+        ]
+
+        after = LAMBDA_CACHE.info()
+        assert results == ["0compiled_once", "1compiled_once", "2compiled_once"]
+        assert after.misses - before.misses == 1
+        assert after.hits - before.hits == 2
+
+    def test_eval_lambda_cache_per_registered_functions(
+        self,
+        mock_logger: Mock,
+    ) -> None:
+        """Test that cached lambdas are not shared across different registered functions."""
+        first = EvalExpressionEvaluator(logger=mock_logger)
+        first.register_function("answer", lambda: 1)
+        second = EvalExpressionEvaluator(logger=mock_logger)
+        second.register_function("answer", lambda: 2)
+
+        assert first.eval_lambda("lambda: answer()") == 1
+        assert second.eval_lambda("lambda: answer()") == 2
+
+    def test_eval_lambda_leading_whitespace(
+        self,
+        expression_evaluator: EvalExpressionEvaluator,
+    ) -> None:
+        """Test that leading whitespace is ignored, like with eval()."""
+        result = expression_evaluator.eval_lambda("  lambda x: x.upper()", "a")
+        assert result == "A"
@@ -0,0 +1,75 @@
+import os
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+
+MAPPING_TEMPLATE = """
+version: 1.0
+input_format: "custom"
+output_format: "xapi"
+mappings:
+  - input_fields: ["{input_field}"]
+    output_fields:
+      output_field: "actor.name"
+metadata:
+  author: "Test"
+  date:
+    publication: "2024-01-01"
+    update: "2024-01-01"
+"""
+
+
+class TestYamlMappingRepository:
+    """Test suite for YamlMappingRepository class."""
+
+    @pytest.fixture
+    def repository(self, mock_logger: Mock) -> Generator[YamlMappingRepository]:
+        """Create an instance of YamlMappingRepository with an empty schemas cache."""
+        YamlMappingRepository.schemas_cache.clear()
+        yield YamlMappingRepository(logger=mock_logger)
+        YamlMappingRepository.schemas_cache.clear()
+
+    @pytest.fixture
+    def mapping_path(self, tmp_path: Path) -> Path:
+        """Create a mapping file."""
+        path = tmp_path / "mapping.yml"
+        path.write_text(MAPPING_TEMPLATE.format(input_field="name"), encoding="utf-8")
+        return path
+
+    def test_load_schema_by_path_cached(
+        self,
+        repository: YamlMappingRepository,
+        mapping_path: Path,
+        mock_logger: Mock,
+    ) -> None:
+        """Test that an unchanged mapping file is parsed only once."""
+        first = repository.load_schema_by_path(mapping_path=mapping_path)
+        second = YamlMappingRepository(logger=mock_logger).load_schema_by_path(
+            mapping_path=mapping_path,
+        )
+
+        assert first is second
+
+    def test_load_schema_by_path_reloaded_on_change(
+        self,
+        repository: YamlMappingRepository,
+        mapping_path: Path,
+    ) -> None:
+        """Test that a modified mapping file replaces the cached schema."""
+        first = repository.load_schema_by_path(mapping_path=mapping_path)
+
+        mapping_path.write_text(
+            MAPPING_TEMPLATE.format(input_field="username"),
+            encoding="utf-8",
+        )
+        stat = mapping_path.stat()
+        os.utime(mapping_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = repository.load_schema_by_path(mapping_path=mapping_path)
+
+        assert first is not second
+        assert second.mappings[0].input_fields == ["username"]
@@ -0,0 +1,96 @@
+from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
+
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace
+from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.mapper.mapper import Mapper
+from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+
+MAPPING_FILE = b"""
+version: 1.0
+input_format: "custom"
+output_format: "xapi"
+mappings:
+  - input_fields: ["name"]
+    output_fields:
+      output_field: "actor.account.name"
+  - input_fields: ["page"]
+    output_fields:
+      output_field: "object.id"
+default_values:
+  - output_field: "actor.account.homePage"
+    value: "https://lms.example.com"
+  - output_field: "verb.id"
+    value: "http://adlnet.gov/expapi/verbs/attempted"
+metadata:
+  author: "Test"
+  date:
+    publication: "2024-01-01"
+    update: "2024-01-01"
+"""
+
+
+class TestMapper:
+    """Test suite for Mapper class."""
+
+    @pytest.fixture
+    def mapper(self, mock_logger: Mock) -> Mapper:
+        """Create a Mapper using the YAML repository."""
+        return Mapper(
+            repository=YamlMappingRepository(logger=mock_logger),
+            expression_evaluator=EvalExpressionEvaluator(logger=mock_logger),
+            logger=mock_logger,
+        )
+
+    def test_plan_compiled_once(
+        self,
+        mapper: Mapper,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the plan of a schema is compiled once."""
+        compile_schema = Mock(wraps=mapper.compiler.compile)
+        monkeypatch.setattr(mapper.compiler, "compile", compile_schema)
+
+        first = mapper.get_plan_by_formats(
+            input_format=CustomTraceFormatStrEnum.XAPI,
+            output_format=CustomTraceFormatStrEnum.XAPI,
+        )
+        second = mapper.get_plan_by_formats(
+            input_format=CustomTraceFormatStrEnum.XAPI,
+            output_format=CustomTraceFormatStrEnum.XAPI,
+        )
+
+        assert first is second
+        compile_schema.assert_called_once()
+
+    def test_convert_with_plan(self, mapper: Mapper) -> None:
+        """Test that a trace is converted with the plan of a mapping file."""
+        plan, from_cache = mapper.get_plan_by_file(file=BytesIO(MAPPING_FILE))
+
+        output_trace = mapper.convert(
+            input_trace=Trace.model_construct(
+                data={"name": "bob", "page": "https://lms.example.com/page"},
+                format=CustomTraceFormatStrEnum.CUSTOM,
+            ),
+            output_format=CustomTraceFormatStrEnum.XAPI,
+            plan=plan,
+        )
+
+        assert isinstance(from_cache, bool)
+        assert output_trace.data["actor"]["account"]["name"] == "bob"
+
+    def test_warmup(self, mapper: Mapper, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the warmup compiles the mappings of all the supported formats."""
+        assert mapper.warmup() == 5
+
+        compile_schema = Mock(wraps=mapper.compiler.compile)
+        monkeypatch.setattr(mapper.compiler, "compile", compile_schema)
+        mapper.get_plan_by_formats(
+            input_format=CustomTraceFormatStrEnum.IMSCALIPER1_2,
+            output_format=CustomTraceFormatStrEnum.XAPI,
+        )
+
+        compile_schema.assert_not_called()
@@ -0,0 +1,138 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.mapper.evaluator.exceptions import ExpressionEvaluationError
+from app.mapper.mapping_compiler import MappingCompiler
+from app.mapper.models.mapping_models import OutputKind
+from app.mapper.models.mapping_schema import MappingSchema
+
+METADATA = {
+    "author": "Test",
+    "date": {"publication": "2024-01-01", "update": "2024-01-01"},
+}
+
+
+def build_schema(
+    mappings: list[dict], default_values: list[dict] | None = None
+) -> MappingSchema:
+    """Build a mapping schema from mappings and default values."""
+    return MappingSchema(
+        version=1.0,
+        input_format="custom",
+        output_format="xapi",
+        mappings=mappings,
+        default_values=default_values or [],
+        metadata=METADATA,
+    )
+
+
+class TestMappingCompiler:
+    """Test suite for MappingCompiler class."""
+
+    @pytest.fixture
+    def compiler(self, mock_logger: Mock) -> MappingCompiler:
+        """Create an instance of MappingCompiler for testing."""
+        return MappingCompiler(
+            evaluator=EvalExpressionEvaluator(logger=mock_logger),
+            logger=mock_logger,
+        )
+
+    def test_compile_split_keys(self, compiler: MappingCompiler) -> None:
+        """Test that input and output fields are split once."""
+        plan = compiler.compile(
+            build_schema(
+                [
+                    {
+                        "input_fields": ["a.b.0"],
+                        "output_fields": {
+                            "output_field": "context.extensions[http://x.y/z]"
+                        },
+                    },
+                ],
+            ),
+        )
+
+        mapping = plan.mappings[0]
+        assert mapping.input_keys == (("a", "b", "0"),)
+        assert mapping.output.kind == OutputKind.ARGUMENT
+        assert mapping.output.output_key == (
+            ("context", None),
+            ("extensions", "http://x.y/z"),
+        )
+
+    def test_compile_static_outputs(self, compiler: MappingCompiler) -> None:
+        """Test that static values are precomputed, unless a profile is set."""
+        plan = compiler.compile(
+            build_schema(
+                [
+                    {
+                        "input_fields": ["a"],
+                        "output_fields": {
+                            "multiple": [
+                                {"output_field": "version", "value": "1.0.0"},
+                                {"output_field": "verb.id", "value": "http://verb"},
+                            ],
+                        },
+                    },
+                    {
+                        "input_fields": ["a"],
+                        "output_fields": {
+                            "output_field": "a",
+                            "value": "b",
+                            "profile": "lms.x",
+                        },
+                    },
+                ],
+            ),
+        )
+
+        static_outputs = plan.mappings[0].output.static_outputs
+        assert [output.value for output in static_outputs] == ["1.0.0", "http://verb"]
+        assert plan.mappings[1].output.static_outputs is None
+
+    def test_compile_switch(self, compiler: MappingCompiler) -> None:
+        """Test that switch conditions are compiled and the default one has no predicate."""
+        plan = compiler.compile(
+            build_schema(
+                [
+                    {
+                        "input_fields": ["a"],
+                        "output_fields": {
+                            "switch": [
+                                {
+                                    "condition": "lambda a: a == 1",
+                                    "output_field": "x",
+                                    "value": "one",
+                                },
+                                {
+                                    "condition": " Default ",
+                                    "output_field": "x",
+                                    "value": "other",
+                                },
+                            ],
+                        },
+                    },
+                ],
+            ),
+        )
+
+        first, default = plan.mappings[0].output.switch
+        assert first.predicate(1)
+        assert not first.predicate(2)
+        assert default.predicate is None
+
+    def test_compile_invalid_lambda(self, compiler: MappingCompiler) -> None:
+        """Test that an invalid lambda fails at compile time."""
+        schema = build_schema(
+            [
+                {
+                    "input_fields": ["a"],
+                    "output_fields": {"output_field": "x", "custom": ["lambda a: a +"]},
+                },
+            ],
+        )
+
+        with pytest.raises(ExpressionEvaluationError):
+            compiler.compile(schema)
@@ -0,0 +1,151 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace
+from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.mapper.mapping_compiler import MappingCompiler
+from app.mapper.mapping_engine import MappingEngine
+from app.mapper.models.mapping_models import MappingPlan
+from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+
+PROFILE = "lms.accessed-page"
+
+MAPPING_FILE = b"""
+version: 1.0
+input_format: "custom"
+output_format: "xapi"
+mappings:
+  - input_fields: ["name"]
+    output_fields:
+      output_field: "actor.account.name"
+  - input_fields: ["page"]
+    output_fields:
+      output_field: "object.id"
+  - input_fields: ["page"]
+    output_fields:
+      output_field: "object.definition"
+      value: {"name": {"en-US": "Page"}}
+  - input_fields: ["name"]
+    output_fields:
+      switch:
+        - condition: "lambda name: name.startswith('profiled')"
+          output_field: "verb.id"
+          value: "https://w3id.org/xapi/netc/verbs/accessed"
+          profile: "lms.accessed-page"
+        - condition: "default"
+          output_field: "verb.id"
+          value: "http://adlnet.gov/expapi/verbs/attempted"
+default_values:
+  - output_field: "actor.account.homePage"
+    value: "https://lms.example.com"
+  - output_field: "verb.display"
+    value: {"en-US": "attempted"}
+metadata:
+  author: "Test"
+  date:
+    publication: "2024-01-01"
+    update: "2024-01-01"
+"""
+
+
+class TestMappingEngine:
+    """Test suite for MappingEngine class."""
+
+    @pytest.fixture
+    def plan(self, mock_logger: Mock) -> MappingPlan:
+        """Compile the mapping plan, with a profile in a switch branch."""
+        evaluator = EvalExpressionEvaluator(logger=mock_logger)
+        schema = YamlMappingRepository(logger=mock_logger).load_schema_by_file(
+            mapping_file=BytesIO(MAPPING_FILE),
+        )
+        return MappingCompiler(evaluator=evaluator, logger=mock_logger).compile(
+            mapping_schema=schema,
+        )
+
+    @pytest.fixture
+    def engine(self, mock_logger: Mock) -> MappingEngine:
+        """Create a MappingEngine."""
+        return MappingEngine(
+            evaluator=EvalExpressionEvaluator(logger=mock_logger),
+            logger=mock_logger,
+        )
+
+    def run(self, engine: MappingEngine, plan: MappingPlan, name: str) -> Trace:
+        """Run the engine on a custom trace."""
+        return engine.run(
+            input_trace=Trace.model_construct(
+                data={"name": name, "page": "https://lms.example.com/page"},
+                format=CustomTraceFormatStrEnum.CUSTOM,
+            ),
+            mapping_to_apply=plan,
+            output_format=CustomTraceFormatStrEnum.XAPI,
+        )
+
+    def test_profile_not_kept_between_runs(
+        self,
+        engine: MappingEngine,
+        plan: MappingPlan,
+    ) -> None:
+        """Test that the profile of a run doesn't leak into the next run."""
+        assert self.run(engine=engine, plan=plan, name="profiled").profile == PROFILE
+        assert self.run(engine=engine, plan=plan, name="other").profile is None
+
+    def test_concurrent_runs(self, engine: MappingEngine, plan: MappingPlan) -> None:
+        """Test that a single engine can run concurrently from several threads."""
+        names = [f"profiled-{i}" if i % 2 else f"other-{i}" for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            traces = list(
+                executor.map(
+                    lambda name: self.run(engine=engine, plan=plan, name=name),
+                    names,
+                ),
+            )
+
+        for name, trace in zip(names, traces, strict=True):
+            assert trace.data["actor"]["account"]["name"] == name
+            assert trace.profile == (PROFILE if name.startswith("profiled") else None)
+
+    def test_plan_values_copied(self, engine: MappingEngine, plan: MappingPlan) -> None:
+        """Test that changing an output trace doesn't change the next ones."""
+        trace = self.run(engine=engine, plan=plan, name="other")
+        trace.data["verb"]["display"]["fr-FR"] = "essayé"
+        trace.data["object"]["definition"]["name"]["fr-FR"] = "Page"
+
+        trace = self.run(engine=engine, plan=plan, name="other")
+
+        assert trace.data["verb"]["display"] == {"en-US": "attempted"}
+        assert trace.data["object"]["definition"] == {"name": {"en-US": "Page"}}
+
+    def test_output_validated_once(
+        self,
+        engine: MappingEngine,
+        plan: MappingPlan,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the output trace carries the model validated on creation."""
+        models = []
+        get_format_model_instance = Trace.get_format_model_instance
+
+        def spy(trace_data: Any, trace_format: CustomTraceFormatStrEnum) -> BaseModel:
+            models.append(
+                get_format_model_instance(
+                    trace_data=trace_data,
+                    trace_format=trace_format,
+                ),
+            )
+            return models[-1]
+
+        monkeypatch.setattr(Trace, "get_format_model_instance", staticmethod(spy))
+
+        trace = self.run(engine=engine, plan=plan, name="other")
+
+        assert len(models) == 1
+        assert trace.model is models[0]
+        assert len(models) == 1
@@ -0,0 +1,113 @@
+from collections.abc import Generator
+from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
+
+from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.mapper.mapper import MAPPING_FILE_CACHE, Mapper
+from app.mapper.mapping_file_cache import MappingFileCache
+from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+
+MAPPING_FILE = b"""
+version: 1.0
+input_format: "custom"
+output_format: "xapi"
+mappings:
+  - input_fields: ["name"]
+    output_fields:
+      output_field: "actor.name"
+metadata:
+  author: "Test"
+  date:
+    publication: "2024-01-01"
+    update: "2024-01-01"
+"""
+
+
+class TestMappingFileCache:
+    """Test suite for MappingFileCache class."""
+
+    def test_get_missing(self) -> None:
+        """Test that a missing schema returns None."""
+        assert MappingFileCache().get(content_hash="missing") is None
+
+    def test_evict_least_recently_used(self) -> None:
+        """Test that the least recently used schema is evicted when full."""
+        cache = MappingFileCache(max_entries=2)
+        first, second, third = Mock(), Mock(), Mock()
+        cache.set(content_hash="first", schema=first, size=1)
+        cache.set(content_hash="second", schema=second, size=1)
+        cache.get(content_hash="first")
+        cache.set(content_hash="third", schema=third, size=1)
+
+        assert cache.get(content_hash="first") is first
+        assert cache.get(content_hash="second") is None
+        assert cache.get(content_hash="third") is third
+
+    def test_evict_on_max_bytes(self) -> None:
+        """Test that schemas are evicted when the memory cap is reached."""
+        cache = MappingFileCache(max_bytes=10)
+        cache.set(content_hash="first", schema=Mock(), size=6)
+        cache.set(content_hash="second", schema=Mock(), size=6)
+
+        assert cache.get(content_hash="first") is None
+        assert cache.get(content_hash="second") is not None
+
+    def test_too_big_not_cached(self) -> None:
+        """Test that a schema bigger than the cache is not cached."""
+        cache = MappingFileCache(max_bytes=10)
+        cache.set(content_hash="big", schema=Mock(), size=11)
+
+        assert cache.get(content_hash="big") is None
+
+    def test_invalid_limits(self) -> None:
+        """Test that the cache limits must be positive."""
+        with pytest.raises(ValueError, match="positive"):
+            MappingFileCache(max_entries=0)
+
+
+class TestMapperGetPlanByFile:
+    """Test suite for the mapping file cache of Mapper.get_plan_by_file."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Generator[None]:
+        """Empty the mapping file cache around each test."""
+        MAPPING_FILE_CACHE.clear()
+        yield
+        MAPPING_FILE_CACHE.clear()
+
+    def build_mapper(self, logger: Mock) -> Mapper:
+        """Create a Mapper using the YAML repository."""
+        return Mapper(
+            repository=YamlMappingRepository(logger=logger),
+            expression_evaluator=EvalExpressionEvaluator(logger=logger),
+            logger=logger,
+        )
+
+    def test_same_content_loaded_once(self, mock_logger: Mock) -> None:
+        """Test that an uploaded mapping file is parsed and validated only once."""
+        first_mapper = self.build_mapper(logger=mock_logger)
+        second_mapper = self.build_mapper(logger=mock_logger)
+
+        first_plan, first_from_cache = first_mapper.get_plan_by_file(
+            file=BytesIO(MAPPING_FILE),
+        )
+        second_plan, second_from_cache = second_mapper.get_plan_by_file(
+            file=BytesIO(MAPPING_FILE),
+        )
+
+        assert first_from_cache is False
+        assert second_from_cache is True
+        assert first_plan.schema is second_plan.schema
+
+    def test_different_content_not_shared(self, mock_logger: Mock) -> None:
+        """Test that a modified mapping file is loaded again."""
+        mapper = self.build_mapper(logger=mock_logger)
+        first_plan, _ = mapper.get_plan_by_file(file=BytesIO(MAPPING_FILE))
+
+        modified = MAPPING_FILE.replace(b"actor.name", b"actor.mbox")
+        plan, from_cache = mapper.get_plan_by_file(file=BytesIO(modified))
+
+        assert from_cache is False
+        assert plan.schema is not first_plan.schema
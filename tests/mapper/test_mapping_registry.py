@@ -0,0 +1,124 @@
+from hashlib import sha256
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.mapper.exceptions import MappingConfigToModelError, MappingNotFoundError
+from app.mapper.mapping_registry import MappingRegistry
+from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+
+MAPPING_FILE = b"""
+version: 1.0
+input_format: "custom"
+output_format: "xapi"
+mappings:
+  - input_fields: ["name"]
+    output_fields:
+      output_field: "actor.name"
+metadata:
+  author: "Test"
+  date:
+    publication: "2024-01-01"
+    update: "2024-01-01"
+"""
+
+
+class TestMappingRegistry:
+    """Test suite for MappingRegistry class."""
+
+    def build_registry(
+        self,
+        tmp_path: Path,
+        logger: Mock,
+        max_entries: int = 8,
+    ) -> MappingRegistry:
+        """Create a MappingRegistry storing its mappings in a temporary directory."""
+        return MappingRegistry(
+            repository=YamlMappingRepository(logger=logger),
+            base_path=tmp_path / "registry",
+            logger=logger,
+            max_entries=max_entries,
+        )
+
+    def test_register_and_get(self, tmp_path: Path, mock_logger: Mock) -> None:
+        """Test that a registered mapping is served from memory."""
+        registry = self.build_registry(tmp_path=tmp_path, logger=mock_logger)
+
+        registered = registry.register(mapping_file=BytesIO(MAPPING_FILE))
+
+        assert registry.get(mapping_id=registered.mapping_id) is registered
+        assert registered.version == sha256(MAPPING_FILE).hexdigest()
+
+    def test_same_content_same_version(
+        self,
+        tmp_path: Path,
+        mock_logger: Mock,
+    ) -> None:
+        """Test that the version only depends on the mapping file content."""
+        registry = self.build_registry(tmp_path=tmp_path, logger=mock_logger)
+
+        first = registry.register(mapping_file=BytesIO(MAPPING_FILE))
+        second = registry.register(mapping_file=BytesIO(MAPPING_FILE))
+
+        assert first.mapping_id != second.mapping_id
+        assert first.version == second.version
+
+    def test_get_shared_between_registries(
+        self,
+        tmp_path: Path,
+        mock_logger: Mock,
+    ) -> None:
+        """Test that a mapping registered by another worker is loaded from disk."""
+        registered = self.build_registry(
+            tmp_path=tmp_path,
+            logger=mock_logger,
+        ).register(mapping_file=BytesIO(MAPPING_FILE))
+
+        loaded = self.build_registry(tmp_path=tmp_path, logger=mock_logger).get(
+            mapping_id=registered.mapping_id,
+        )
+
+        assert loaded.version == registered.version
+        assert loaded.schema == registered.schema
+
+    def test_evicted_mapping_reloaded(
+        self,
+        tmp_path: Path,
+        mock_logger: Mock,
+    ) -> None:
+        """Test that an evicted mapping is still available from disk."""
+        registry = self.build_registry(
+            tmp_path=tmp_path,
+            logger=mock_logger,
+            max_entries=1,
+        )
+        first = registry.register(mapping_file=BytesIO(MAPPING_FILE))
+        registry.register(mapping_file=BytesIO(MAPPING_FILE))
+
+        reloaded = registry.get(mapping_id=first.mapping_id)
+
+        assert reloaded is not first
+        assert reloaded.version == first.version
+
+    @pytest.mark.parametrize("mapping_id", ["0" * 32, "../mapping", ""])
+    def test_get_unknown(
+        self,
+        tmp_path: Path,
+        mock_logger: Mock,
+        mapping_id: str,
+    ) -> None:
+        """Test that an unknown or malformed id raises MappingNotFoundError."""
+        registry = self.build_registry(tmp_path=tmp_path, logger=mock_logger)
+
+        with pytest.raises(MappingNotFoundError):
+            registry.get(mapping_id=mapping_id)
+
+    def test_register_invalid(self, tmp_path: Path, mock_logger: Mock) -> None:
+        """Test that an invalid mapping file is not registered."""
+        registry = self.build_registry(tmp_path=tmp_path, logger=mock_logger)
+
+        with pytest.raises(MappingConfigToModelError):
+            registry.register(mapping_file=BytesIO(b"version: 1.0"))
+        assert not (tmp_path / "registry").exists()
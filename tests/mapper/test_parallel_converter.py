@@ -0,0 +1,196 @@
+from collections.abc import Iterator
+from io import BytesIO
+from json import dumps
+from unittest.mock import Mock
+
+import pytest
+
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import TraceRecord
+from app.infrastructure.logging.types import LogLevel
+from app.mapper.evaluator.eval import EvalExpressionEvaluator
+from app.mapper.exceptions import SchemaNotCachedError
+from app.mapper.mapper import Mapper
+from app.mapper.parallel_converter import ParallelConverter, convert_chunk
+from app.mapper.repositories.yaml.yaml_repository import YamlMappingRepository
+from app.parsers.jsonencoder import CustomJSONEncoder
+
+MAPPING_FILE = b"""
+version: 1.0
+input_format: "custom"
+output_format: "xapi"
+mappings:
+  - input_fields: ["name"]
+    output_fields:
+      output_field: "actor.account.name"
+  - input_fields: ["page"]
+    output_fields:
+      output_field: "object.id"
+default_values:
+  - output_field: "actor.account.homePage"
+    value: "https://lms.example.com"
+  - output_field: "verb.id"
+    value: "http://adlnet.gov/expapi/verbs/attempted"
+metadata:
+  author: "Test"
+  date:
+    publication: "2024-01-01"
+    update: "2024-01-01"
+"""
+
+
+def get_traces(count: int) -> list[TraceRecord]:
+    """Create custom traces to convert with the mapping file."""
+    return [
+        TraceRecord(
+            data={
+                "name": f"user{index}",
+                "page": f"https://lms.example.com/{index}",
+            },
+            format=CustomTraceFormatStrEnum.CUSTOM,
+        )
+        for index in range(count)
+    ]
+
+
+class TestParallelConverter:
+    """Test suite for ParallelConverter class."""
+
+    @pytest.fixture
+    def mapper(self, mock_logger: Mock) -> Mapper:
+        """Create a Mapper using the YAML repository."""
+        return Mapper(
+            repository=YamlMappingRepository(logger=mock_logger),
+            expression_evaluator=EvalExpressionEvaluator(logger=mock_logger),
+            logger=mock_logger,
+        )
+
+    @pytest.fixture
+    def converter(self, mock_logger: Mock) -> Iterator[ParallelConverter]:
+        """Create a ParallelConverter with two processes and small chunks."""
+        converter = ParallelConverter(
+            processes=2,
+            logger=mock_logger,
+            log_level=LogLevel.CRITICAL,
+            chunk_size=7,
+        )
+        yield converter
+        converter.shutdown()
+
+    def test_same_output_in_order(
+        self,
+        mapper: Mapper,
+        converter: ParallelConverter,
+    ) -> None:
+        """Test that the output is the one of a sequential conversion, in order."""
+        plan, _ = mapper.get_plan_by_file(file=BytesIO(MAPPING_FILE))
+        traces = get_traces(count=50)
+        expected = "".join(
+            dumps(
+                obj=mapper.convert(
+                    input_trace=trace,
+                    output_format=CustomTraceFormatStrEnum.XAPI,
+                    plan=plan,
+                ).data,
+                cls=CustomJSONEncoder,
+            )
+            + "\n"
+            for trace in traces
+        )
+
+        chunks = list(
+            converter.convert(
+                traces=iter(traces),
+                schema=plan.schema,
+                output_format=CustomTraceFormatStrEnum.XAPI,
+            ),
+        )
+
+        assert len(chunks) == 8
+        assert "".join(chunks) == expected
+
+    def test_schema_sent_once(
+        self,
+        mapper: Mapper,
+        mock_logger: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a schema is only sent with the first chunks of its first conversion."""
+        plan, _ = mapper.get_plan_by_file(file=BytesIO(MAPPING_FILE))
+        converter = ParallelConverter(
+            processes=1,
+            logger=mock_logger,
+            log_level=LogLevel.CRITICAL,
+            chunk_size=7,
+        )
+        submit = Mock(wraps=converter.executor.submit)
+        monkeypatch.setattr(converter.executor, "submit", submit)
+
+        try:
+            for _ in range(2):
+                list(
+                    converter.convert(
+                        traces=iter(get_traces(count=70)),
+                        schema=plan.schema,
+                        output_format=CustomTraceFormatStrEnum.XAPI,
+                    ),
+                )
+        finally:
+            converter.shutdown()
+
+        sent_schemas = [call.args[2] for call in submit.call_args_list]
+        assert len(sent_schemas) == 20
+        assert sent_schemas[:2] == [plan.schema] * 2
+        assert sent_schemas[2:] == [None] * 18
+
+    def test_schema_sent_again(
+        self,
+        mapper: Mapper,
+        converter: ParallelConverter,
+        mock_logger: Mock,
+    ) -> None:
+        """Test that the chunks of workers missing the schema are sent again with it."""
+        plan, _ = mapper.get_plan_by_file(file=BytesIO(MAPPING_FILE))
+        traces = get_traces(count=20)
+        expected = "".join(
+            converter.convert(
+                traces=iter(traces),
+                schema=plan.schema,
+                output_format=CustomTraceFormatStrEnum.XAPI,
+            ),
+        )
+        # New workers, which have not compiled the schema
+        converter.shutdown()
+        converter.executor = ParallelConverter(
+            processes=2,
+            logger=mock_logger,
+            log_level=LogLevel.CRITICAL,
+        ).executor
+
+        chunks = converter.convert(
+            traces=iter(traces),
+            schema=plan.schema,
+            output_format=CustomTraceFormatStrEnum.XAPI,
+        )
+
+        assert "".join(chunks) == expected
+
+    def test_schema_not_cached(self) -> None:
+        """Test that a worker refuses a schema key it has not compiled."""
+        with pytest.raises(SchemaNotCachedError):
+            convert_chunk(
+                schema_key="unknown",
+                schema=None,
+                output_format="xapi",
+                chunk=[],
+                log_level=LogLevel.CRITICAL,
+            )
+
+    def test_invalid_processes(self, mock_logger: Mock) -> None:
+        """Test that a pool without processes is refused."""
+        with pytest.raises(ValueError, match="positive"):
+            ParallelConverter(
+                processes=0,
+                logger=mock_logger,
+                log_level=LogLevel.CRITICAL,
+            )
@@ -0,0 +1,134 @@
+import bz2
+import gzip
+from io import BytesIO
+from json import dumps
+from typing import Any
+from unittest.mock import Mock
+from zipfile import ZipFile
+
+import pytest
+
+from app.parsers.csv.parser import CSVParser
+from app.parsers.exceptions import DecompressionError, ParserFactoryError
+from app.parsers.factory import ParserFactory
+
+CSV_FILE = (
+    b"name,page\nbob,https://lms.example.com/a\nalice,https://lms.example.com/b\n"
+)
+CSV_ROWS = [
+    {"name": "bob", "page": "https://lms.example.com/a"},
+    {"name": "alice", "page": "https://lms.example.com/b"},
+]
+
+
+def zip_file(members: dict[str, bytes]) -> BytesIO:
+    """Create a zip archive of the given members."""
+    file = BytesIO()
+    with ZipFile(file, mode="w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    file.seek(0)
+    return file
+
+
+class TestDecompressingParser:
+    """Test suite for DecompressingParser class."""
+
+    @pytest.mark.parametrize("mime_type", ["text/csv", "application/gzip"])
+    def test_gzip(self, mock_logger: Mock, mime_type: str) -> None:
+        """Test that a gzip file is detected by its first bytes or its MIME type."""
+        parser = ParserFactory.get_parser(mime_type=mime_type, logger=mock_logger)
+
+        traces = list(parser.parse(file=BytesIO(gzip.compress(CSV_FILE))))
+
+        assert [trace.data for trace in traces] == CSV_ROWS
+
+    def test_bzip2_member_type(self, mock_logger: Mock) -> None:
+        """Test that the content type is given by the name of the compressed file."""
+        parser = ParserFactory.get_parser(
+            mime_type="application/x-bzip2",
+            logger=mock_logger,
+            filename="export.ndjson.bz2",
+        )
+        content = "\n".join(dumps(row) for row in CSV_ROWS).encode()
+
+        traces = list(parser.parse(file=BytesIO(bz2.compress(content))))
+
+        assert [trace.data for trace in traces] == CSV_ROWS
+
+    def test_zip_members(self, mock_logger: Mock) -> None:
+        """Test that the members of a zip archive are parsed one after the other."""
+        file = zip_file(
+            {
+                "exports/": b"",
+                "exports/first.csv": CSV_FILE,
+                "exports/second.json": dumps([{"id": 1}]).encode(),
+            },
+        )
+        parser = ParserFactory.get_parser(
+            mime_type="application/zip",
+            logger=mock_logger,
+        )
+
+        traces = list(parser.parse(file=file))
+
+        assert [trace.data for trace in traces] == [*CSV_ROWS, {"id": 1}]
+
+    def test_not_compressed(self, mock_logger: Mock) -> None:
+        """Test that a file which is not compressed is parsed as is."""
+        parser = ParserFactory.get_parser(mime_type="text/csv", logger=mock_logger)
+
+        traces = list(parser.parse(file=BytesIO(CSV_FILE)))
+
+        assert [trace.data for trace in traces] == CSV_ROWS
+
+    @pytest.mark.parametrize("compress", [gzip.compress, bz2.compress])
+    def test_corrupted(self, mock_logger: Mock, compress: Any) -> None:
+        """Test that corrupted compressed data raises a decompression error."""
+        content = compress(CSV_FILE * 100)
+        parser = ParserFactory.get_parser(mime_type="text/csv", logger=mock_logger)
+
+        with pytest.raises(DecompressionError):
+            list(parser.parse(file=BytesIO(content[: len(content) // 2])))
+
+    def test_member_error_not_decompression(
+        self,
+        mock_logger: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an error raised while parsing a member is not a decompression one."""
+        monkeypatch.setattr(
+            CSVParser,
+            "parse",
+            Mock(side_effect=OSError("parsing failed")),
+        )
+        parser = ParserFactory.get_parser(mime_type="text/csv", logger=mock_logger)
+
+        with pytest.raises(OSError, match="parsing failed") as error:
+            list(parser.parse(file=BytesIO(gzip.compress(CSV_FILE))))
+        assert not isinstance(error.value, DecompressionError)
+
+    def test_unknown_mime_type_compressed(self, mock_logger: Mock) -> None:
+        """Test that a compressed file of an unknown MIME type is detected by its first bytes."""
+        file = BytesIO(gzip.compress(CSV_FILE))
+        parser = ParserFactory.get_parser(
+            mime_type="application/octet-stream",
+            logger=mock_logger,
+            filename="export.csv.gz",
+            file=file,
+        )
+
+        traces = list(parser.parse(file=file))
+
+        assert [trace.data for trace in traces] == CSV_ROWS
+
+    def test_unsupported_mime_type(self, mock_logger: Mock) -> None:
+        """Test that a MIME type without parser nor compression is rejected."""
+        with pytest.raises(ParserFactoryError):
+            ParserFactory.get_parser(mime_type="text/plain", logger=mock_logger)
+        with pytest.raises(ParserFactoryError):
+            ParserFactory.get_parser(
+                mime_type="application/octet-stream",
+                logger=mock_logger,
+                file=BytesIO(CSV_FILE),
+            )
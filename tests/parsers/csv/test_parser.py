@@ -0,0 +1,173 @@
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, InvalidOperation
+from io import BytesIO
+from multiprocessing import get_context
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.api.schemas import CustomConfigModel
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace, TraceRecord
+from app.parsers.csv.column_types import COLUMN_CONVERTERS, infer_column_types
+from app.parsers.csv.parser import CSVParser
+from app.parsers.types import ColumnTypeEnum
+
+CSV_FILE = b"""id,score,date,page,name
+007,1.50,2024-01-02,https://lms.example.com/a,bob
+12,2,2024-01-03T10:00:00Z,https://lms.example.com/b,alice
+,1e3,02/01/2024,mailto:bob@example.com, 42
+"""
+
+
+def normalize(value: str) -> Decimal | str:
+    """Normalize a value as a number, or keep it as is."""
+    try:
+        return Decimal(value).normalize()
+    except InvalidOperation:
+        return value
+
+
+class TestCSVParser:
+    """Test suite for CSVParser class."""
+
+    def test_column_types_inferred(self) -> None:
+        """Test that the most specific type accepting all the values is inferred."""
+        rows = [
+            {"id": "007", "score": "1.50", "date": "2024-01-02", "page": "urn:a"},
+            {"id": "", "score": "2", "date": "2024/01/03", "page": "text"},
+        ]
+
+        assert infer_column_types(
+            fieldnames=["id", "score", "date", "page", "empty"],
+            sample=rows,
+        ) == {
+            "id": ColumnTypeEnum.INTEGER,
+            "score": ColumnTypeEnum.DECIMAL,
+            "date": ColumnTypeEnum.DATE,
+            "page": ColumnTypeEnum.STRING,
+            "empty": ColumnTypeEnum.STRING,
+        }
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "12",
+            "007",
+            "-3",
+            "+",
+            "1.50",
+            "1e5",
+            "1_000",
+            "NaN",
+            "nan3",
+            "sNaN",
+            "-inf",
+            "١٢٣",
+            "info",
+            "2024-01-02",
+            "1.2.3",
+            "12:30",
+            "https://lms.example.com",
+            "text",
+        ],
+    )
+    def test_converters_as_normalization(self, value: str) -> None:
+        """Test that the converters give the normalized value, or fail."""
+        expected = normalize(value=value)
+
+        for converter in COLUMN_CONVERTERS.values():
+            converted = converter(value)
+            if converted is not None:
+                assert type(converted) is type(expected)
+                assert str(converted) == str(expected)
+
+    def test_parse(self, mock_logger: Mock) -> None:
+        """Test that the values failing the type of their column are normalized."""
+        parser = CSVParser(logger=mock_logger)
+
+        rows = [trace.data for trace in parser.parse(file=BytesIO(CSV_FILE))]
+
+        assert rows[0]["id"] == Decimal(7)
+        assert rows[1]["score"] == Decimal(2)
+        assert rows[2]["id"] is None
+        assert rows[2]["score"] == Decimal(1000)
+        assert rows[2]["date"] == "02/01/2024"
+        assert rows[2]["page"] == "mailto:bob@example.com"
+        assert rows[2]["name"] == Decimal(42)
+
+    def test_parse_records_not_validated(
+        self,
+        mock_logger: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the rows are yielded as records, never validated as traces."""
+        get_format_model_instance = Mock()
+        monkeypatch.setattr(
+            Trace,
+            "get_format_model_instance",
+            get_format_model_instance,
+        )
+
+        traces = list(CSVParser(logger=mock_logger).parse(file=BytesIO(CSV_FILE)))
+
+        assert all(isinstance(trace, TraceRecord) for trace in traces)
+        assert {trace.format for trace in traces} == {CustomTraceFormatStrEnum.CUSTOM}
+        get_format_model_instance.assert_not_called()
+
+    def test_parse_with_column_types(self, mock_logger: Mock) -> None:
+        """Test that the values of a column configured as string are kept as is."""
+        parser = CSVParser(
+            logger=mock_logger,
+            parsing_config=CustomConfigModel(
+                column_types={"id": "string", "name": "string"},
+            ),
+        )
+
+        rows = [trace.data for trace in parser.parse(file=BytesIO(CSV_FILE))]
+
+        assert [row["id"] for row in rows] == ["007", "12", None]
+        assert rows[2]["name"] == "42"
+        assert rows[0]["score"] == Decimal("1.5")
+
+    def test_parse_in_ranges(
+        self,
+        mock_logger: Mock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a file parsed by byte ranges in processes gives the same rows."""
+        monkeypatch.setattr("app.parsers.csv.ranges.PARALLEL_MIN_SIZE", 0)
+        monkeypatch.setattr("app.parsers.csv.parser.RANGE_SIZE", 64)
+        path = tmp_path / "file.csv"
+        path.write_bytes(
+            b"id,score,text\r\n"
+            + b"".join(
+                b'%d,%d.50,"line\r\n%d, ""quoted"""\r\n' % (index, index, index)
+                for index in range(100)
+            ),
+        )
+        expected = [
+            trace.data
+            for trace in CSVParser(logger=mock_logger).parse(
+                file=BytesIO(path.read_bytes()),
+            )
+        ]
+
+        with (
+            ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn")) as pool,
+            path.open("rb") as file,
+        ):
+            rows = [
+                trace.data
+                for trace in CSVParser(logger=mock_logger, executor=pool).parse(
+                    file=file,
+                )
+            ]
+
+        assert any(
+            call.args[0] == "Parsing in byte ranges" and call.args[1]["ranges"] > 1
+            for call in mock_logger.info.call_args_list
+        )
+        assert rows == expected
@@ -0,0 +1,35 @@
+from collections.abc import Iterator
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+
+import pytest
+
+from app.parsers.csv.ranges import split_ranges
+
+CSV_FILE = b'id,text\n1,"a\nb"\n2,"c ""d"" e"\n3,f\n'
+
+
+class TestSplitRanges:
+    """Test suite for split_ranges function."""
+
+    @pytest.fixture
+    def mapped_file(self, tmp_path: Path) -> Iterator[mmap]:
+        """Map a CSV file with quoted newlines and quotes in memory."""
+        path = tmp_path / "file.csv"
+        path.write_bytes(CSV_FILE)
+        with path.open("rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mm:
+            yield mm
+
+    def test_ranges_end_on_records(self, mapped_file: mmap) -> None:
+        """Test that the ranges end on newlines out of quotes."""
+        ranges = split_ranges(mm=mapped_file, start=8, quote=b'"', range_size=1)
+
+        assert [mapped_file[start:end] for start, end in ranges] == [
+            b'1,"a\nb"\n',
+            b'2,"c ""d"" e"\n',
+            b"3,f\n",
+        ]
+
+    def test_unbalanced_quotes(self, mapped_file: mmap) -> None:
+        """Test that a file with unbalanced quotes is not split."""
+        assert split_ranges(mm=mapped_file, start=11, quote=b'"', range_size=1) is None
@@ -0,0 +1,161 @@
+from io import BytesIO, StringIO
+from json import JSONDecodeError, JSONDecoder, dumps
+from unittest.mock import Mock
+
+import pytest
+
+from app.api.schemas import CustomConfigModel
+from app.common.exceptions import InvalidTraceError
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.parsers.exceptions import JSONParsingError
+from app.parsers.json.parser import (
+    CHUNK_SIZE,
+    JSONArrayParser,
+    NDJSONParser,
+    TextBuffer,
+)
+
+XAPI_STATEMENT = {
+    "actor": {"account": {"name": "bob", "homePage": "https://lms.example.com"}},
+    "verb": {"id": "http://adlnet.gov/expapi/verbs/attempted"},
+    "object": {"id": "https://lms.example.com/page"},
+}
+CUSTOM_ROW = {"name": "bob", "page": "https://lms.example.com/page"}
+
+
+class TestTextBuffer:
+    """Test suite for TextBuffer class."""
+
+    def test_values_across_chunks(self) -> None:
+        """Test that the values read across several chunks are decoded whole."""
+        buffer = TextBuffer(
+            file=StringIO(' 123456 "long string" {"a": [1, 2]} 7'),
+            chunk_size=3,
+        )
+        decoder = JSONDecoder()
+
+        values = []
+        while buffer.next_char():
+            values.append(buffer.decode_value(decoder=decoder))
+
+        assert values == [123456, "long string", {"a": [1, 2]}, 7]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+    def test_values_split_anywhere(self, chunk_size: int) -> None:
+        """Test that the values are decoded whole wherever the chunks end."""
+        buffer = TextBuffer(
+            file=StringIO(r'{"a\"}": [1, {"b": "]"}]} 12.5 true "x\\" -1e3'),
+            chunk_size=chunk_size,
+        )
+        decoder = JSONDecoder()
+
+        values = []
+        while buffer.next_char():
+            values.append(buffer.decode_value(decoder=decoder))
+
+        assert values == [{'a"}': [1, {"b": "]"}]}, 12.5, True, "x\\", -1000.0]
+
+    def test_invalid_value_not_read_further(self) -> None:
+        """Test that an invalid value is not read further than its end."""
+        file = StringIO('{"a" 1} ' + "1 " * 1000)
+        buffer = TextBuffer(file=file, chunk_size=16)
+
+        with pytest.raises(JSONDecodeError):
+            buffer.decode_value(decoder=JSONDecoder())
+        assert file.tell() == 16
+
+    def test_value_too_large(self) -> None:
+        """Test that a value longer than the maximum size raises a parsing error."""
+        file = StringIO(dumps({"a": "x" * 1000}))
+        buffer = TextBuffer(file=file, chunk_size=16, max_value_size=100)
+
+        with pytest.raises(JSONParsingError, match="longer than 100"):
+            buffer.decode_value(decoder=JSONDecoder())
+        assert file.tell() < 1000
+
+    def test_consumed_characters_dropped(self) -> None:
+        """Test that only the characters of the values being decoded are kept."""
+        buffer = TextBuffer(file=StringIO(" ".join(["[1, 2]"] * 1000)), chunk_size=16)
+        decoder = JSONDecoder()
+
+        while buffer.next_char():
+            buffer.decode_value(decoder=decoder)
+            assert len(buffer.text) <= 32
+
+
+class TestJSONParsers:
+    """Test suite for NDJSONParser and JSONArrayParser classes."""
+
+    def test_ndjson_formats_detected(self, mock_logger: Mock) -> None:
+        """Test that the format of each line is detected, custom if none matches."""
+        file = BytesIO(f"{dumps(XAPI_STATEMENT)}\n\n{dumps(CUSTOM_ROW)}\n".encode())
+
+        traces = list(NDJSONParser(logger=mock_logger).parse(file=file))
+
+        assert [trace.format for trace in traces] == [
+            CustomTraceFormatStrEnum.XAPI,
+            CustomTraceFormatStrEnum.CUSTOM,
+        ]
+        assert traces[1].data == CUSTOM_ROW
+
+    def test_ndjson_format_declared(self, mock_logger: Mock) -> None:
+        """Test that the traces are validated against the declared format."""
+        parser = NDJSONParser(
+            logger=mock_logger,
+            parsing_config=CustomConfigModel(input_format="xapi"),
+        )
+
+        with pytest.raises(InvalidTraceError):
+            list(parser.parse(file=BytesIO(dumps(CUSTOM_ROW).encode())))
+
+    def test_json_array(self, mock_logger: Mock) -> None:
+        """Test that the elements of a JSON array are yielded as traces."""
+        file = BytesIO(dumps([XAPI_STATEMENT, CUSTOM_ROW] * 3, indent=2).encode())
+
+        traces = list(JSONArrayParser(logger=mock_logger).parse(file=file))
+
+        assert [trace.data for trace in traces] == [XAPI_STATEMENT, CUSTOM_ROW] * 3
+        assert traces[0].format == CustomTraceFormatStrEnum.XAPI
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"{}",
+            b'[{"a": 1} {"b": 2}]',
+            b'[{"a": 1},',
+            b'[{"a": 1}] []',
+            b'{"a": 1}\n',
+        ],
+    )
+    def test_json_array_invalid(self, mock_logger: Mock, content: bytes) -> None:
+        """Test that an invalid JSON array raises a parsing error."""
+        with pytest.raises(JSONParsingError):
+            list(JSONArrayParser(logger=mock_logger).parse(file=BytesIO(content)))
+
+    def test_json_array_invalid_element(self, mock_logger: Mock) -> None:
+        """Test that an invalid element stops the parsing without reading the file."""
+        rows = b", ".join([dumps(CUSTOM_ROW).encode()] * 10000)
+        content = b'[{"a": 1}, {"b" 2}, ' + rows
+        file = BytesIO(content + b"]")
+
+        with pytest.raises(JSONParsingError, match="Invalid JSON array element"):
+            list(JSONArrayParser(logger=mock_logger).parse(file=file))
+        assert file.tell() <= 2 * CHUNK_SIZE < len(content)
+
+    @pytest.mark.parametrize("element", [b'"x"', b"1", b"[1]", b"null"])
+    def test_trace_not_object(self, mock_logger: Mock, element: bytes) -> None:
+        """Test that a JSON value which is not an object is rejected with its index."""
+        ndjson = NDJSONParser(logger=mock_logger)
+        json_array = JSONArrayParser(logger=mock_logger)
+
+        with pytest.raises(JSONParsingError, match="trace 1 must be an object"):
+            list(ndjson.parse(file=BytesIO(b'{"a": 1}\n' + element)))
+        with pytest.raises(JSONParsingError, match="trace 1 must be an object"):
+            list(json_array.parse(file=BytesIO(b'[{"a": 1}, ' + element + b"]")))
+
+    def test_json_array_empty(self, mock_logger: Mock) -> None:
+        """Test that an empty JSON array gives no traces."""
+        parser = JSONArrayParser(logger=mock_logger)
+
+        assert list(parser.parse(file=BytesIO(b" [ ] \n"))) == []
@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.infrastructure.config.contract import ConfigContract
+
+TEMPLATES_IRI = "http://schema.dases.eu/xapi/profile/lms/templates"
+ACCESSED_VERB = "https://w3id.org/xapi/netc/verbs/accessed"
+WEBPAGE_TYPE = "https://w3id.org/xapi/acrossx/activities/webpage"
+
+
+def build_template(name: str, rules: list[dict] | None = None) -> dict:
+    """Build a statement template of the LMS profile."""
+    template = {
+        "id": f"{TEMPLATES_IRI}/{name}",
+        "type": "StatementTemplate",
+        "inScheme": "http://schema.dases.eu/xapi/profile/lms/v1",
+        "prefLabel": {"en": name},
+        "definition": {"en": name},
+        "verb": ACCESSED_VERB,
+        "objectActivityType": WEBPAGE_TYPE,
+    }
+    if rules is not None:
+        template["rules"] = rules
+    return template
+
+
+PROFILE = {
+    "id": "http://schema.dases.eu/xapi/profile/lms",
+    "type": "Profile",
+    "prefLabel": {"en": "LMS"},
+    "definition": {"en": "LMS profile"},
+    "versions": [
+        {
+            "id": "http://schema.dases.eu/xapi/profile/lms/v1",
+            "generatedAtTime": "2024-01-01T00:00:00Z",
+        },
+    ],
+    "author": {"type": "Organization", "name": "Test"},
+    "templates": [
+        build_template(
+            name="accessed-page",
+            rules=[
+                {"location": "$.actor.account.name", "presence": "included"},
+                {"location": "$.timestamp", "presence": "recommended"},
+                {
+                    "location": "$.verb.id",
+                    "presence": "included",
+                    "any": [ACCESSED_VERB],
+                },
+                {
+                    "location": "$.object.definition.type",
+                    "presence": "included",
+                    "all": [WEBPAGE_TYPE],
+                },
+                {
+                    "location": "$.context.contextActivities.category[*].id",
+                    "presence": "included",
+                    "none": ["http://bad/category"],
+                },
+                {
+                    "location": "$.context.extensions['https://w3id.org/xapi/acrossx/extensions/type']",
+                    "presence": "recommended",
+                    "any": ["course"],
+                },
+            ],
+        ),
+        build_template(name="downloaded-audio"),
+    ],
+}
+
+
+@pytest.fixture
+def profiles_config(tmp_path: Path) -> Mock:
+    """Create a config reading the LMS profile from a temporary directory.
+
+    :return: A mock config conforming to ConfigContract
+    """
+    tmp_path.joinpath("lms.jsonld").write_text(json.dumps(PROFILE))
+    config = Mock(spec=ConfigContract)
+    config.get_and_create_profiles_base_path.return_value = tmp_path
+    config.get_profile_url.return_value = ""
+    return config
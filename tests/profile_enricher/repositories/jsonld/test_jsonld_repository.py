@@ -0,0 +1,139 @@
+from copy import deepcopy
+from unittest.mock import Mock
+
+import pytest
+
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace
+from app.profile_enricher.profiler_types import ProfilingResult
+from app.profile_enricher.repositories.jsonld.jsonld_repository import (
+    JsonLdProfileRepository,
+)
+
+TRACES = [
+    {"actor": {"account": {"name": "bob"}}, "object": {"id": "http://object"}},
+    {
+        "actor": {"name": "bob"},
+        "verb": {"id": "http://other/verb"},
+        "object": {"id": "http://object", "definition": {"type": "http://other"}},
+        "context": {
+            "contextActivities": {"category": [{"id": "http://bad/category"}]},
+            "extensions": {"https://w3id.org/xapi/acrossx/extensions/type": "other"},
+        },
+    },
+    {
+        "actor": {"account": {"name": "bob"}},
+        "timestamp": "2024-01-01T00:00:00Z",
+        "object": {"id": "http://object", "definition": {}},
+        "context": {"extensions": {}},
+    },
+]
+
+
+def build_trace(data: dict) -> Trace:
+    """Build an xAPI trace of the accessed-page template, without validating it."""
+    return Trace.model_construct(
+        data=deepcopy(data),
+        format=CustomTraceFormatStrEnum.XAPI,
+        profile="lms.accessed-page",
+    )
+
+
+class TestJsonLdProfileRepository:
+    """Test suite for JsonLdProfileRepository class."""
+
+    @pytest.fixture
+    def repository(
+        self,
+        profiles_config: Mock,
+        mock_logger: Mock,
+    ) -> JsonLdProfileRepository:
+        """Create a JsonLdProfileRepository reading the LMS profile."""
+        return JsonLdProfileRepository(logger=mock_logger, config=profiles_config)
+
+    @pytest.mark.parametrize("data", TRACES)
+    def test_enrich_and_validate_trace(
+        self,
+        repository: JsonLdProfileRepository,
+        data: dict,
+    ) -> None:
+        """Test that the single pass gives the results of enrich, validate and recommend."""
+        expected_trace = build_trace(data=data)
+        names = {"group_name": "lms", "template_name": "accessed-page"}
+        repository.enrich_trace(**names, trace=expected_trace)
+        expected = ProfilingResult(
+            errors=repository.validate_trace(**names, trace=expected_trace),
+            recommendations=repository.get_recommendations(
+                **names,
+                trace=expected_trace,
+            ),
+        )
+
+        trace = build_trace(data=data)
+        result = repository.enrich_and_validate_trace(**names, trace=trace)
+
+        assert trace.data == expected_trace.data
+        assert result == expected
+
+    def test_enriched_trace_validated(
+        self,
+        repository: JsonLdProfileRepository,
+    ) -> None:
+        """Test that the rules are evaluated on the enriched trace.
+
+        The verb, the object type and the single-value extension are filled by the enrichment.
+        """
+        trace = build_trace(data=TRACES[0])
+
+        result = repository.enrich_and_validate_trace(
+            group_name="lms",
+            template_name="accessed-page",
+            trace=trace,
+        )
+
+        assert not result.errors
+        assert [recommendation.path for recommendation in result.recommendations] == [
+            "$.timestamp",
+        ]
+
+    @pytest.mark.parametrize("method", ["enrich_trace", "enrich_and_validate_trace"])
+    def test_enriched_trace_model_reset(
+        self,
+        repository: JsonLdProfileRepository,
+        monkeypatch: pytest.MonkeyPatch,
+        method: str,
+    ) -> None:
+        """Test that the model of the trace is validated again from the enriched data."""
+        trace = Trace.from_validated_model(
+            data=deepcopy(TRACES[0]),
+            trace_format=CustomTraceFormatStrEnum.XAPI,
+            model=Mock(),
+            profile="lms.accessed-page",
+        )
+        enriched_model = Mock()
+        monkeypatch.setattr(
+            Trace,
+            "get_format_model_instance",
+            Mock(return_value=enriched_model),
+        )
+
+        getattr(repository, method)(
+            group_name="lms",
+            template_name="accessed-page",
+            trace=trace,
+        )
+
+        assert trace.model is enriched_model
+
+    def test_template_not_found(self, repository: JsonLdProfileRepository) -> None:
+        """Test that a trace of an unknown template is left as is."""
+        trace = build_trace(data=TRACES[0])
+
+        result = repository.enrich_and_validate_trace(
+            group_name="lms",
+            template_name="unknown",
+            trace=trace,
+        )
+
+        assert result == ProfilingResult()
+        assert trace.data == TRACES[0]
@@ -0,0 +1,98 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.profile_enricher.exceptions import ProfileNotFoundError, TemplateNotFoundError
+from app.profile_enricher.repositories.jsonld.profile_loader import ProfileLoader
+from app.profile_enricher.repositories.jsonld.profile_registry import ProfileRegistry
+
+TEMPLATES_IRI = "http://schema.dases.eu/xapi/profile/lms/templates"
+
+
+class TestProfileRegistry:
+    """Test suite for ProfileRegistry class."""
+
+    @pytest.fixture
+    def profile_loader(self, profiles_config: Mock, mock_logger: Mock) -> ProfileLoader:
+        """Create a ProfileLoader reading the LMS profile."""
+        return ProfileLoader(logger=mock_logger, config=profiles_config)
+
+    @pytest.fixture
+    def registry(
+        self,
+        profile_loader: ProfileLoader,
+        mock_logger: Mock,
+    ) -> ProfileRegistry:
+        """Create a ProfileRegistry."""
+        return ProfileRegistry(profile_loader=profile_loader, logger=mock_logger)
+
+    @pytest.mark.parametrize(
+        "template_name",
+        [
+            "accessed-page",
+            "Accessed-Page",
+            f"{TEMPLATES_IRI}/accessed-page",
+            "templates/accessed-page",
+        ],
+    )
+    def test_get_template(self, registry: ProfileRegistry, template_name: str) -> None:
+        """Test that a template is found by its short name, IRI or end of IRI."""
+        template = registry.get_template(group_name="lms", template_name=template_name)
+
+        assert str(template.id) == f"{TEMPLATES_IRI}/accessed-page"
+
+    def test_template_not_found(self, registry: ProfileRegistry) -> None:
+        """Test that an unknown template raises TemplateNotFoundError."""
+        with pytest.raises(TemplateNotFoundError):
+            registry.get_template(group_name="lms", template_name="unknown")
+
+    def test_profile_loaded_once(
+        self,
+        registry: ProfileRegistry,
+        profile_loader: ProfileLoader,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the profile is loaded once for all the template lookups."""
+        load_profile = Mock(wraps=profile_loader.load_profile)
+        monkeypatch.setattr(profile_loader, "load_profile", load_profile)
+
+        registry.get_template(group_name="lms", template_name="accessed-page")
+        registry.get_template(group_name="lms", template_name="downloaded-audio")
+
+        load_profile.assert_called_once_with(group_name="lms")
+
+    def test_profile_not_found_not_kept(self, registry: ProfileRegistry) -> None:
+        """Test that a profile failing to load is loaded again on next use."""
+        for _ in range(2):
+            with pytest.raises(ProfileNotFoundError):
+                registry.get_template(group_name="forum", template_name="posted")
+
+    def test_warmup(
+        self,
+        registry: ProfileRegistry,
+        profile_loader: ProfileLoader,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the warmup loads the profiles, skipping the missing ones."""
+        assert registry.warmup(group_names=["lms", "forum"]) == 1
+
+        load_profile = Mock(wraps=profile_loader.load_profile)
+        monkeypatch.setattr(profile_loader, "load_profile", load_profile)
+        registry.get_template(group_name="lms", template_name="accessed-page")
+
+        load_profile.assert_not_called()
+
+    def test_warmup_unexpected_error(
+        self,
+        registry: ProfileRegistry,
+        profile_loader: ProfileLoader,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the warmup skips a profile failing with any error, as a timeout."""
+        monkeypatch.setattr(
+            profile_loader,
+            "load_profile",
+            Mock(side_effect=TimeoutError("read timed out")),
+        )
+
+        assert registry.warmup(group_names=["lms"]) == 0
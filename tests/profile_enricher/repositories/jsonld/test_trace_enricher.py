@@ -0,0 +1,97 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.common.extensions.enums import CustomTraceFormatStrEnum
+from app.common.models.trace import Trace
+from app.profile_enricher.profiles.jsonld import StatementTemplate
+from app.profile_enricher.repositories.jsonld.trace_enricher import TraceEnricher
+
+EXTENSION = "https://w3id.org/xapi/acrossx/extensions/type"
+
+
+def build_trace(data: dict) -> Trace:
+    """Build an xAPI trace, without validating it."""
+    return Trace.model_construct(data=data, format=CustomTraceFormatStrEnum.XAPI)
+
+
+class TestTraceEnricher:
+    """Test suite for TraceEnricher class."""
+
+    @pytest.fixture
+    def template(self) -> StatementTemplate:
+        """Create a template with a single-value rule and a free rule."""
+        return StatementTemplate(
+            id="http://schema.dases.eu/xapi/profile/lms/templates/enriched",
+            type="StatementTemplate",
+            inScheme="http://schema.dases.eu/xapi/profile/lms/v1",
+            prefLabel={"en": "enriched"},
+            definition={"en": "enriched"},
+            verb="https://w3id.org/xapi/netc/verbs/accessed",
+            objectActivityType="https://w3id.org/xapi/acrossx/activities/webpage",
+            rules=[
+                {"location": "$.actor.account.name", "presence": "included"},
+                {
+                    "location": f"$.context.extensions['{EXTENSION}']",
+                    "presence": "recommended",
+                    "any": ["course"],
+                },
+            ],
+        )
+
+    @pytest.fixture
+    def enricher(self, mock_logger: Mock) -> TraceEnricher:
+        """Create a TraceEnricher."""
+        return TraceEnricher(logger=mock_logger)
+
+    def test_missing_rule_location_filled(
+        self,
+        enricher: TraceEnricher,
+        template: StatementTemplate,
+    ) -> None:
+        """Test that a single-value rule fills its location only when it's missing."""
+        enriched_data = enricher.get_enriched_data(
+            group_name="lms",
+            template=template,
+            trace=build_trace(data={}),
+        )
+        present_data = enricher.get_enriched_data(
+            group_name="lms",
+            template=template,
+            trace=build_trace(data={"context": {"extensions": {EXTENSION: "other"}}}),
+        )
+
+        assert enriched_data["verb"]["display"] == {"en-US": "enriched"}
+        assert enriched_data["context"]["extensions"] == {EXTENSION: "course"}
+        assert "extensions" not in present_data["context"]
+        assert (
+            enriched_data["context"]["contextActivities"]
+            == (present_data["context"]["contextActivities"])
+        )
+
+    def test_patch_built_once_and_copied(
+        self,
+        enricher: TraceEnricher,
+        template: StatementTemplate,
+    ) -> None:
+        """Test that the patch is computed once per template, and copied per trace."""
+        first = enricher.get_enriched_data(
+            group_name="lms",
+            template=template,
+            trace=build_trace(data={}),
+        )
+        first["context"]["contextActivities"]["category"].append({"id": "other"})
+        second = enricher.get_enriched_data(
+            group_name="lms",
+            template=template,
+            trace=build_trace(data={}),
+        )
+
+        assert len(second["context"]["contextActivities"]["category"]) == 1
+        assert TraceEnricher.get_template_enrichment(
+            group_name="lms",
+            template=template,
+        ) is TraceEnricher.get_template_enrichment(
+            group_name="lms",
+            template=template,
+        )
@@ -0,0 +1,64 @@
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from app.profile_enricher.profiles.jsonld import StatementTemplateRule
+from app.profile_enricher.repositories.jsonld.trace_validator import (
+    RuleValues,
+    TraceValidator,
+)
+
+VERB = "https://w3id.org/xapi/netc/verbs/accessed"
+OTHER_VERB = "http://other/verb"
+
+
+class TestTraceValidator:
+    """Test suite for TraceValidator class."""
+
+    @pytest.fixture
+    def validator(self, mock_logger: Mock) -> TraceValidator:
+        """Create a TraceValidator."""
+        return TraceValidator(logger=mock_logger)
+
+    def test_values_sets_built_once(self) -> None:
+        """Test that the values sets of a rule are built when the rule is loaded."""
+        rule = StatementTemplateRule(location="$.verb.id", any=[VERB, VERB])
+
+        assert rule.get_values_set(check_type="any") == frozenset({VERB})
+        assert rule.get_values_set(check_type="any") is rule.get_values_set(
+            check_type="any",
+        )
+        assert rule.get_values_set(check_type="none") == frozenset()
+
+    @pytest.mark.parametrize(
+        ("check_type", "values", "expected_rules"),
+        [
+            ("any", [VERB], []),
+            ("any", [OTHER_VERB, {"id": VERB}], ["any"]),
+            ("all", [OTHER_VERB, VERB], []),
+            ("all", [[VERB]], ["all"]),
+            ("none", [OTHER_VERB, {"id": VERB}], []),
+            ("none", [{"id": VERB}, VERB], ["none"]),
+        ],
+    )
+    def test_values_checks(
+        self,
+        validator: TraceValidator,
+        check_type: str,
+        values: list[Any],
+        expected_rules: list[str],
+    ) -> None:
+        """Test the any/all/none checks, with values which are not hashable."""
+        rule = StatementTemplateRule(
+            location="$.verb.id",
+            presence="included",
+            **{check_type: [VERB]},
+        )
+
+        errors, _ = validator.evaluate_rules(
+            template=Mock(id="template"),
+            rules_values=[RuleValues(rule=rule, location_found=True, values=values)],
+        )
+
+        assert [error.rule for error in errors] == expected_rules
@@ -0,0 +1,75 @@
+from typing import Any
+
+import jsonpath_ng
+import pytest
+
+from app.profile_enricher.utils.jsonpath import JSONPathUtils
+
+EXTENSION = "https://w3id.org/xapi/acrossx/extensions/type"
+
+STATEMENT = {
+    "verb": {"id": "https://w3id.org/xapi/netc/verbs/accessed"},
+    "object": {"definition": {"type": None, "extensions": {}}},
+    "context": {
+        "contextActivities": {
+            "category": [{"id": "http://category/1"}, {"id": "http://category/2"}],
+            "parent": {"id": "http://parent"},
+            "grouping": [],
+        },
+        "extensions": {EXTENSION: ["course", "module"]},
+    },
+}
+
+
+class TestCompiledJSONPath:
+    """Test suite for CompiledJSONPath class."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected_steps"),
+        [
+            ("$", ()),
+            ("$.verb.id", ("verb", "id")),
+            (
+                f"$.context.extensions['{EXTENSION}']",
+                ("context", "extensions", EXTENSION),
+            ),
+            (
+                "$.context.contextActivities.category[*].id",
+                ("context", "contextActivities", "category", None, "id"),
+            ),
+            ("@.id", None),
+            ("$.context.contextActivities.category[0].id", None),
+            ("$..id", None),
+            ("$.context.*", None),
+        ],
+    )
+    def test_steps(self, path: str, expected_steps: tuple | None) -> None:
+        """Test that only the supported expressions are compiled."""
+        assert JSONPathUtils.compile_jsonpath(path).steps == expected_steps
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "$",
+            "$.verb.id",
+            "$.verb.unknown",
+            "$.verb.id.unknown",
+            "$.object.definition.type",
+            f"$.context.extensions['{EXTENSION}']",
+            f"$.context.extensions['{EXTENSION}'][*]",
+            "$.context.contextActivities.category[*].id",
+            "$.context.contextActivities.parent[*].id",
+            "$.context.contextActivities.grouping[*].id",
+            "$.object.definition.type[*]",
+            "$.verb.id[*]",
+            "$.context.contextActivities.category[0].id",
+            "$..id",
+        ],
+    )
+    def test_find(self, path: str) -> None:
+        """Test that the values found are the ones of the jsonpath_ng matches."""
+        expected: list[Any] = [
+            match.value for match in jsonpath_ng.parse(path).find(STATEMENT)
+        ]
+
+        assert JSONPathUtils.compile_jsonpath(path).find(STATEMENT) == expected